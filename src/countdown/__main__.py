@@ -0,0 +1,5 @@
+import sys
+
+from countdown.cli import main
+
+sys.exit(main())
@@ -2,105 +2,261 @@ import tkinter as tk
 import argparse
 import time
 from datetime import datetime, timedelta
-from countdown.digital_display import RetroDigitalDisplay
+from countdown.canvas_batch import CanvasBatch, ResizeCoalescer
+from countdown.digital_display import fit_layout
+from countdown.palette import (
+    COLOR_CYCLE,
+    COLOR_CYCLE_SECONDS,
+    FINISHED_FLASH,
+    GRADIENT_FPS,
+    gradient_hex,
+)
+from countdown.clock import SystemClock
+from countdown.scheduler import (
+    FrameBudget,
+    TickScheduler,
+    format_budget_stats,
+    format_jitter_stats,
+    monotonic_deadline,
+)
+
+# Initial window size; the layout follows the canvas when it is resized
+WINDOW_WIDTH = 1024
+WINDOW_HEIGHT = 600
+
+# Header font size at the digit height of the initial window
+HEADER_FONT_SIZE = 30
+
+# Display implementations selectable with --backend, as (module, class);
+# the photo backend and its rasterizer are imported only when chosen
+DISPLAY_BACKENDS = {
+    "polygon": ("countdown.digital_display", "RetroDigitalDisplay"),
+    "photo": ("countdown.photo_display", "PhotoDigitalDisplay"),
+}
+
+
+def display_backend(name):
+    """Import and return the display class of a --backend name."""
+    module, class_name = DISPLAY_BACKENDS[name]
+    return getattr(__import__(module, fromlist=[class_name]), class_name)
 
 
 class AdvancedCountdownTimer:
-    def __init__(self, root, target_time=None, duration_minutes=5):
+    def __init__(
+        self,
+        root,
+        target_time=None,
+        duration_minutes=5,
+        clock=None,
+        shared_clock=None,
+        backend="polygon",
+        measure_redraw=False,
+        gradient=False,
+    ):
         self.root = root
+        self.clock = clock or SystemClock()
+        self.shared_clock = shared_clock
         self.root.title("Advanced Retro Countdown Timer")
-        self.root.geometry("1024x600")
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.configure(bg="black")
 
         # Set the target time based on input
         if target_time:
             self.target_time = target_time
         else:
-            self.target_time = datetime.now() + timedelta(minutes=duration_minutes)
+            self.target_time = self.clock.now() + timedelta(minutes=duration_minutes)
 
         # Create the canvas for drawing
         self.canvas = tk.Canvas(self.root, bg="black", highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
+        # All canvas updates of a frame are applied in one Tcl evaluation
+        self.batch = CanvasBatch(self.canvas)
+
+        # Lay out for the initial window size
+        x, y, size = fit_layout(WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.base_size = size
+
         # Create the header text
-        self.header_font = tk.font.Font(family="Courier", size=30, weight="bold")
+        self.header_font = tk.font.Font(
+            family="Courier", size=HEADER_FONT_SIZE, weight="bold"
+        )
         self.header_text = self.canvas.create_text(
-            512,
-            100,
+            WINDOW_WIDTH / 2,
+            WINDOW_HEIGHT / 6,
             text="The livestream starts in",
             fill="#00FF00",
             font=self.header_font,
         )
 
         # Create the custom digital display
-        self.display = RetroDigitalDisplay(
+        self.display = display_backend(backend)(
             canvas=self.canvas,
-            x=180,  # Starting x position
-            y=200,  # y position
-            size=120,  # Height of digits
+            x=x,  # Centered horizontally
+            y=y,  # A third down the window
+            size=size,  # Height of digits
             color="#FF00FF",  # Magenta color
             glow_color="#FF88FF",  # Light magenta glow
             thickness_ratio=0.15,  # Thickness of segments
+            batch=self.batch,
         )
 
+        # Follow window resizes (fullscreen, dragging) with one relayout per
+        # burst of <Configure> events
+        self.resizer = ResizeCoalescer(self.root, self.clock, self.relayout)
+        self.resizer.size = (WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.canvas.bind("<Configure>", self.resizer.configure)
+
         # Create color cycling for 80s effect
-        self.colors = [
-            ("#FF00FF", "#FF88FF"),  # Magenta
-            ("#00FFFF", "#88FFFF"),  # Cyan
-            ("#FFFF00", "#FFFF88"),  # Yellow
-            ("#FF00FF", "#FF88FF"),  # Back to magenta
-        ]
+        self.colors = list(COLOR_CYCLE)
         self.color_index = 0
-        self.color_cycle_speed = 2.0  # seconds per color
-        self.last_color_change = time.time()
+        self.color_cycle_speed = COLOR_CYCLE_SECONDS
+        self.static_periods = periods = (1.0, self.color_cycle_speed)
+
+        # Smooth gradient: (color, glow) per animation frame, looked up
+        # rather than computed; frames that do not fit the budget are dropped
+        self.gradient = None
+        self.budget = None
+        self.shown_second = None
+        if gradient:
+            self.gradient_period = 1 / GRADIENT_FPS
+            periods += (self.gradient_period,)
+            self.gradient = tuple(
+                zip(
+                    gradient_hex(tuple(color for color, _ in self.colors)),
+                    gradient_hex(tuple(glow for _, glow in self.colors)),
+                )
+            )
+            self.budget = FrameBudget(GRADIENT_FPS)
+
+        self.frames = 0
+
+        # Redraw time of the canvas per frame, measured with --stats
+        self.measure_redraw = measure_redraw
+        self.redraws = 0
+        self.redraw_total = 0.0
+        self.redraw_max = 0.0
+
+        # Schedule a render only when the digits, colon or color change
+        self.scheduler = TickScheduler(
+            monotonic_deadline(self.target_time, self.clock),
+            periods=periods,
+            clock=self.clock.monotonic,
+        )
+        self.animated_periods = periods
+        self.color_origin = self.scheduler.phase(
+            self.color_cycle_speed, self.scheduler.clock()
+        )
+        self.finished_shown = False
 
         # Start the animation
         self.update_timer()
 
+    def relayout(self, width, height):
+        """Fit the header and the display to a new canvas size."""
+        x, y, size = fit_layout(width, height)
+        self.display.place(x, y, size)
+        self.batch.coords(self.header_text, width / 2, height / 6)
+        self.header_font.configure(
+            size=max(8, round(HEADER_FONT_SIZE * size / self.base_size))
+        )
+        self.batch.flush()
+
+    def present(self):
+        """Apply the frame's canvas updates, timing the redraw if measuring."""
+        self.batch.flush()
+        if self.measure_redraw:
+            start = time.perf_counter()
+            # Tk redraws the canvas when idle; force it now to time it
+            self.canvas.update_idletasks()
+            elapsed = time.perf_counter() - start
+            self.redraws += 1
+            self.redraw_total += elapsed
+            self.redraw_max = max(self.redraw_max, elapsed)
+
     def update_timer(self):
-        # Calculate remaining time
-        now = datetime.now()
-        remaining = self.target_time - now
+        now = self.scheduler.tick()
+        self.frames += 1
+        self.display.begin_frame()
+
+        # Follow the publisher of a shared clock (deadline may move live)
+        if self.shared_clock:
+            state = self.shared_clock.sync(self.scheduler)
+            self.color_origin = self.scheduler.phase(
+                self.color_cycle_speed, state.color_epoch
+            )
 
         # Check if countdown is complete
-        if remaining.total_seconds() <= 0:
+        if self.scheduler.finished(now):
             # Display zeros and show completion message
             self.display.show_time(0, 0, 0)
-            self.canvas.itemconfig(
-                self.header_text, text="The livestream has started!", fill="#FF0000"
-            )
+            if not self.finished_shown:
+                self.batch.itemconfig(
+                    self.header_text,
+                    text="The livestream has started!",
+                    fill="#FF0000",
+                )
+                # Only the flash remains: stop the gradient animation
+                self.scheduler.periods = self.static_periods
+            self.finished_shown = True
 
             # Flash effect when timer ends
-            if int(time.time()) % 2 == 0:
-                self.display.set_color("#FF0000", "#FF8888")  # Red
-            else:
-                self.display.set_color("#880000", "#440000")  # Dark red
+            flash = self.scheduler.phase(1.0, now) % len(FINISHED_FLASH)
+            self.display.set_color(*FINISHED_FLASH[flash])
+            self.present()
 
             # Continue updating even after countdown completes (for the flashing effect)
-            self.root.after(500, self.update_timer)
+            delay_ms = self.scheduler.delay_ms(now)
+            self.clock.after(self.root, delay_ms, self.update_timer)
             return
 
+        if self.finished_shown:
+            # A shared target was moved back into the future
+            self.batch.itemconfig(
+                self.header_text, text="The livestream starts in", fill="#00FF00"
+            )
+            self.display.set_color(*self.colors[self.color_index])
+            self.scheduler.periods = self.animated_periods
+            self.finished_shown = False
+            self.shown_second = None
+
+        if self.gradient:
+            # Digit flips always render; frames in between only if they fit
+            second = self.scheduler.phase(1.0, now)
+            next_flip = self.scheduler.next_boundary(1.0, now)
+            if second == self.shown_second and not self.budget.admit(now, next_flip):
+                delay_ms = self.scheduler.delay_ms(now)
+                self.clock.after(self.root, delay_ms, self.update_timer)
+                return
+            self.shown_second = second
+
         # Extract hours, minutes, seconds
-        hours, remainder = divmod(int(remaining.total_seconds()), 3600)
+        hours, remainder = divmod(self.scheduler.remaining_seconds(now), 3600)
         minutes, seconds = divmod(remainder, 60)
 
-        # Update the digital display
-        self.display.show_time(hours, minutes, seconds)
+        # Update the digital display; the colons blink every second
+        seconds_blink = self.scheduler.phase(1.0, now) % 2 == 0
+        self.display.show_time(hours, minutes, seconds, seconds_blink)
 
         # Cycle colors for 80s effect
-        current_time = time.time()
-        if current_time - self.last_color_change > self.color_cycle_speed:
-            self.color_index = (self.color_index + 1) % len(self.colors)
+        color_phase = self.scheduler.phase(self.color_cycle_speed, now)
+        color_index = (color_phase - self.color_origin) % len(self.colors)
+        if self.gradient:
+            frames_per_color = len(self.gradient) // len(self.colors)
+            index = self.scheduler.phase(self.gradient_period, now)
+            index -= self.color_origin * frames_per_color
+            self.display.set_color(*self.gradient[index % len(self.gradient)])
+        elif color_index != self.color_index:
+            self.color_index = color_index
             self.display.set_color(*self.colors[self.color_index])
-            self.last_color_change = current_time
 
-        # Blink colon every second for seconds ticking effect
-        seconds_blink = int(time.time()) % 2 == 0
-        self.display.show_colon(2, seconds_blink)
-        self.display.show_colon(5, seconds_blink)
+        self.present()
+        if self.budget:
+            self.budget.record(now, self.scheduler.clock())
 
-        # Schedule the next update
-        self.root.after(100, self.update_timer)
+        # Schedule the next update for the next second boundary
+        delay_ms = self.scheduler.delay_ms(now)
+        self.clock.after(self.root, delay_ms, self.update_timer)
 
 
 def parse_duration(duration_str):
@@ -162,6 +318,37 @@ def parse_arguments():
         "--fullscreen", action="store_true", help="Run in fullscreen mode"
     )
 
+    parser.add_argument(
+        "--backend",
+        choices=sorted(DISPLAY_BACKENDS),
+        default="polygon",
+        help="Display drawing: vector polygons, or pre-rendered images with a blurred glow",
+    )
+
+    parser.add_argument(
+        "--gradient",
+        action="store_true",
+        help="Fade smoothly between the colors at up to 60 fps (polygon backend only)",
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print tick timing statistics when the window is closed",
+    )
+
+    parser.add_argument(
+        "--shared-clock",
+        metavar="NAME",
+        help="Follow the countdown published by countdown-clock under NAME",
+    )
+
+    parser.add_argument(
+        "--sync-leader",
+        metavar="HOST[:PORT]",
+        help="Follow the clock and target of a countdown-sync leader on the LAN",
+    )
+
     return parser.parse_args()
 
 
@@ -203,6 +390,33 @@ def main():
         print(f"Error: {e}")
         print("Using default duration (5 minutes).")
 
+    if args.gradient and args.backend == "photo":
+        # Every gradient step would render a new set of sprites
+        print("Error: --gradient needs the polygon backend.")
+        return
+
+    shared_clock = None
+    if args.shared_clock:
+        # Imported on demand so plain runs do not load shared memory support
+        from countdown.shared_clock import SharedClockReader
+
+        try:
+            shared_clock = SharedClockReader(args.shared_clock)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error: cannot attach to shared clock: {e}")
+            return
+
+    clock = None
+    if args.sync_leader:
+        # Imported on demand so plain runs do not load the network code
+        from countdown.clock_sync import follow_leader, format_sync_stats
+
+        clock = follow_leader(args.sync_leader)
+        if clock is None:
+            return
+        # The leader's target replaces --time/--duration
+        target_time = clock.target_time() or target_time
+
     # Create the Tkinter application
     root = tk.Tk()
 
@@ -212,9 +426,37 @@ def main():
         # Bind escape key to exit fullscreen
         root.bind("<Escape>", lambda e: root.attributes("-fullscreen", False))
 
-    app = AdvancedCountdownTimer(root, target_time, duration_minutes)
+    app = AdvancedCountdownTimer(
+        root,
+        target_time,
+        duration_minutes,
+        clock=clock,
+        shared_clock=shared_clock,
+        backend=args.backend,
+        measure_redraw=args.stats,
+        gradient=args.gradient,
+    )
     root.mainloop()
 
+    if args.stats:
+        print(format_jitter_stats(app.scheduler.jitter_stats()))
+        frames = max(1, app.frames)
+        updates, evals = app.batch.updates, app.batch.evals
+        print(
+            f"canvas updates={updates} ({updates / frames:.1f}/frame), "
+            f"Tcl evals={evals} ({evals / frames:.1f}/frame)"
+        )
+        if app.redraws:
+            average_ms = app.redraw_total / app.redraws * 1000
+            print(
+                f"{args.backend} redraw avg={average_ms:.2f}ms "
+                f"max={app.redraw_max * 1000:.2f}ms over {app.redraws} frames"
+            )
+        if app.budget:
+            print(format_budget_stats(app.budget.stats()))
+        if clock:
+            print(format_sync_stats(clock.stats()))
+
 
 if __name__ == "__main__":
     main()
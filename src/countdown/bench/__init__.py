@@ -0,0 +1,4 @@
+"""
+Headless benchmarks for the countdown renderers.
+Run with `countdown-bench --help` for options.
+"""
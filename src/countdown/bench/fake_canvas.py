@@ -0,0 +1,184 @@
+import itertools
+
+
+class RecordingTcl:
+    """
+    A stand-in for the Tcl interpreter of a RecordingCanvas.
+
+    Evaluates the canvas scripts submitted by CanvasBatch, counting each
+    script as one Tk round-trip.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+
+    def eval(self, script):
+        canvas = self.canvas
+        canvas.calls += 1
+        for line in script.split("\n"):
+            widget, command, item, *words = _tcl_words(line)
+            if widget != canvas._w:
+                raise ValueError(f"unsupported Tcl command: {line}")
+            if item.isdigit():
+                item = int(item)
+            if command == "itemconfigure":
+                names = [name.lstrip("-") for name in words[0::2]]
+                canvas._configure(item, dict(zip(names, words[1::2])))
+            elif command == "coords":
+                canvas._coords(item, [float(word) for word in words])
+            elif command == "move":
+                canvas._transform(item, 0, 0, 1, 1, *map(float, words))
+            elif command == "scale":
+                canvas._transform(item, *map(float, words), 0, 0)
+            else:
+                raise ValueError(f"unsupported Tcl command: {line}")
+        return ""
+
+
+class RecordingImage:
+    """A stand-in for tkinter.PhotoImage holding the data it was created from."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, data):
+        self.name = f"image{next(self._ids)}"
+        self.data = data
+
+    def __str__(self):
+        return self.name
+
+
+class RecordingCanvas:
+    """
+    A stand-in for tkinter.Canvas that records calls instead of drawing.
+
+    Items and their options are kept in memory (including tag lookups) so the
+    display classes behave as they would on a real canvas, while every call
+    (or batched Tcl script) is counted as one Tk round-trip.
+    """
+
+    def __init__(self, width=1024, height=600):
+        self.width = width
+        self.height = height
+        self.items = {}
+        self.next_id = 1
+        self.calls = 0
+        self._w = ".canvas"
+        self.tk = RecordingTcl(self)
+
+    def _create(self, kind, coords, options):
+        self.calls += 1
+        item = self.next_id
+        self.next_id += 1
+
+        tags = options.get("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        options = dict(options, tags=tuple(tags))
+        options.setdefault("state", "normal")
+
+        self.items[item] = {"kind": kind, "coords": list(coords), **options}
+        return item
+
+    def _find(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        if tag_or_id == "all":
+            return list(self.items)
+        return [item for item, data in self.items.items() if tag_or_id in data["tags"]]
+
+    def create_polygon(self, *coords, **options):
+        return self._create("polygon", _flatten(coords), options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", _flatten(coords), options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", _flatten(coords), options)
+
+    def create_image(self, *coords, **options):
+        return self._create("image", _flatten(coords), options)
+
+    def _configure(self, tag_or_id, options):
+        for item in self._find(tag_or_id):
+            self.items[item].update(options)
+
+    def itemconfig(self, tag_or_id, **options):
+        self.calls += 1
+        self._configure(tag_or_id, options)
+
+    itemconfigure = itemconfig
+
+    def _coords(self, tag_or_id, coords):
+        for item in self._find(tag_or_id):
+            self.items[item]["coords"] = list(coords)
+
+    def _transform(self, tag_or_id, x, y, x_factor, y_factor, dx, dy):
+        # Scale about (x, y), then move by (dx, dy)
+        for item in self._find(tag_or_id):
+            coords = self.items[item]["coords"]
+            coords[0::2] = [x + (value - x) * x_factor + dx for value in coords[0::2]]
+            coords[1::2] = [y + (value - y) * y_factor + dy for value in coords[1::2]]
+
+    def coords(self, tag_or_id, *coords):
+        self.calls += 1
+        self._coords(tag_or_id, _flatten(coords))
+
+    def move(self, tag_or_id, dx, dy):
+        self.calls += 1
+        self._transform(tag_or_id, 0, 0, 1, 1, dx, dy)
+
+    def scale(self, tag_or_id, x, y, x_factor, y_factor):
+        self.calls += 1
+        self._transform(tag_or_id, x, y, x_factor, y_factor, 0, 0)
+
+    def delete(self, tag_or_id):
+        self.calls += 1
+        for item in self._find(tag_or_id):
+            del self.items[item]
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def visible_items(self):
+        """Return the ids of all items that are not hidden."""
+        return [item for item, data in self.items.items() if data["state"] != "hidden"]
+
+
+def _tcl_words(line):
+    """Split one command of a CanvasBatch script into its words."""
+    escapes = {"n": "\n", "t": "\t", "r": "\r", "v": "\v", "f": "\f"}
+    words = []
+    word = []
+    empty = False
+    chars = iter(line)
+    for char in chars:
+        if char == " ":
+            words.append("" if empty else "".join(word))
+            word = []
+            empty = False
+        elif char == "\\":
+            escaped = next(chars)
+            word.append(escapes.get(escaped, escaped))
+        elif char == "{" and not word:
+            # "{}", the quoted empty word
+            next(chars)
+            empty = True
+        else:
+            word.append(char)
+    words.append("" if empty else "".join(word))
+    return words
+
+
+def _flatten(coords):
+    """Flatten create_* coordinates given as a list or as separate arguments."""
+    flat = []
+    for value in coords:
+        if isinstance(value, (list, tuple)):
+            flat.extend(value)
+        else:
+            flat.append(value)
+    return flat
@@ -0,0 +1,170 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from countdown import __version__
+from countdown.bench.scenarios import SCENARIOS
+
+# Metrics where a larger value is an improvement
+HIGHER_IS_BETTER = {"frames_per_sec"}
+
+
+def run_scenario(scenario, alloc_frames):
+    """
+    Run one scenario and return its metrics.
+
+    The timed pass renders every frame of the simulated countdown. A second,
+    shorter pass under tracemalloc measures the peak memory allocated while
+    rendering a frame (tracing slows rendering down, so it is kept separate);
+    scenarios whose work happens in other processes set `traced = False`.
+    """
+    frames = scenario.frames
+
+    scenario.reset()
+    start = time.perf_counter()
+    for index in range(frames):
+        scenario.render(index)
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "frames": frames,
+        "seconds": elapsed,
+        "frames_per_sec": frames / elapsed if elapsed else float("inf"),
+    }
+    result.update(scenario.metrics(frames))
+
+    if getattr(scenario, "traced", True):
+        traced = min(frames, alloc_frames)
+        scenario.reset()
+        tracemalloc.start()
+        allocated = 0
+        for index in range(traced):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            scenario.render(index)
+            allocated += tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+        result["alloc_bytes_per_frame"] = allocated / max(1, traced)
+
+    scenario.close()
+    return result
+
+
+def compare(results, baseline):
+    """Return report lines comparing `results` against a baseline run."""
+    lines = []
+    for name, metrics in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        for metric, value in metrics.items():
+            old = base.get(metric)
+            if metric in ("frames", "seconds") or not old:
+                continue
+            change = (value - old) / old * 100
+            better = change > 0 if metric in HIGHER_IS_BETTER else change < 0
+            verdict = "better" if better else "worse"
+            if abs(change) < 0.5:
+                verdict = "same"
+            lines.append(
+                f"{name:>10} {metric:<22} {old:>12.2f} -> {value:>12.2f} "
+                f"({change:+.1f}%, {verdict})"
+            )
+    return lines
+
+
+def check_budgets(results):
+    """Return report lines for metrics above their scenario's budget."""
+    lines = []
+    for name, metrics in results.items():
+        for metric, budget in getattr(SCENARIOS[name], "budgets", {}).items():
+            value = metrics.get(metric)
+            if value is not None and value > budget:
+                lines.append(
+                    f"{name:>10} {metric:<22} {value:>12.2f} over budget {budget}"
+                )
+    return lines
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Countdown Renderer Benchmarks")
+
+    parser.add_argument(
+        "--hours",
+        type=float,
+        default=1.0,
+        help="Length of the simulated countdown in hours (one frame per second)",
+    )
+
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run (repeatable, default: all)",
+    )
+
+    parser.add_argument(
+        "--alloc-frames",
+        type=int,
+        default=600,
+        help="Number of frames traced for the allocation measurement",
+    )
+
+    parser.add_argument(
+        "--json", metavar="PATH", help="Write the results as JSON ('-' for stdout)"
+    )
+
+    parser.add_argument(
+        "--baseline", metavar="PATH", help="Compare against a previous JSON result"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    results = {}
+    for name in args.scenario or sorted(SCENARIOS):
+        results[name] = run_scenario(SCENARIOS[name](args.hours), args.alloc_frames)
+
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "hours": args.hours,
+        "results": results,
+    }
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        for name, metrics in results.items():
+            details = " ".join(
+                f"{metric}={value:.2f}"
+                for metric, value in metrics.items()
+                if metric not in ("frames", "seconds")
+            )
+            print(f"{name:>10}: {metrics['frames']} frames, {details}")
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for line in compare(results, baseline):
+            print(line, file=sys.stderr if args.json == "-" else sys.stdout)
+
+    over_budget = check_budgets(results)
+    for line in over_budget:
+        print(line, file=sys.stderr)
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
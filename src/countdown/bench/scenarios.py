@@ -0,0 +1,488 @@
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from countdown.bench.fake_canvas import RecordingCanvas, RecordingImage
+from countdown.canvas_batch import ResizeCoalescer
+from countdown.clock import VirtualClock
+from countdown.dashboard import TILE_COLORS, Dashboard, DashboardTimer
+from countdown.digital_display import RetroDigitalDisplay, fit_layout
+from countdown.export import frame_state
+from countdown.palette import COLOR_CYCLE, COLOR_CYCLE_SECONDS, GRADIENT_FPS
+from countdown.photo_display import PhotoDigitalDisplay
+from countdown.raster import DisplayRaster, fit_size
+from countdown.scheduler import TickScheduler
+from countdown.screen_buffer import FrameWriter, ScreenBuffer
+from countdown.terminal_countdown import (
+    COLORS,
+    countdown_frame,
+    format_time,
+    gradient_frame,
+    gradient_styles,
+    rich_frame,
+)
+from countdown.timing_wheel import TimingWheel
+
+
+class TerminalScenario:
+    """Terminal renderer: frame composition, screen diff and a null-sink write."""
+
+    name = "terminal"
+
+    def __init__(self, hours, width=120):
+        self.frames = int(hours * 3600)
+        self.width = width
+        self.colors = [
+            COLORS["bright_magenta"],
+            COLORS["bright_cyan"],
+            COLORS["bright_yellow"],
+            COLORS["bright_green"],
+        ]
+        self.sink = open(os.devnull, "w")
+
+    def reset(self):
+        self.screen = ScreenBuffer()
+        self.writer = FrameWriter(self.sink)
+
+    def render(self, index):
+        # One frame per second of simulated countdown, color step every 2s
+        remaining = self.frames - index
+        color = self.colors[(index // 2) % len(self.colors)]
+        frame = countdown_frame(format_time(remaining), color, self.width)
+        self.writer.write(self.screen.render(frame))
+
+    def metrics(self, frames):
+        stats = self.writer.stats()
+        return {
+            "bytes_per_frame": stats["bytes_per_frame"],
+            "writes_per_frame": stats["writes_per_frame"],
+        }
+
+    def close(self):
+        self.sink.close()
+
+
+class GradientScenario(TerminalScenario):
+    """Terminal --gradient animation: one frame per 1/60 s, digits every 60."""
+
+    name = "gradient"
+
+    # Share of the frame interval rendering may use; FrameBudget drops
+    # animation frames beyond it, so a slower renderer shows a choppier fade
+    budgets = {"budget_used": 0.5}
+
+    def reset(self):
+        super().reset()
+        self.header_styles, self.digit_styles = gradient_styles(2)
+        self.render_seconds = 0.0
+
+    def render(self, index):
+        start = time.perf_counter()
+        remaining = self.frames // GRADIENT_FPS - index // GRADIENT_FPS
+        style = index % len(self.digit_styles)
+        frame = gradient_frame(
+            format_time(remaining),
+            self.header_styles[style],
+            self.digit_styles[style],
+            self.width,
+        )
+        self.writer.write(self.screen.render(frame))
+        self.render_seconds += time.perf_counter() - start
+
+    def metrics(self, frames):
+        metrics = super().metrics(frames)
+        frame_seconds = self.render_seconds / frames
+        metrics["frame_ms"] = frame_seconds * 1000
+        metrics["budget_used"] = frame_seconds * GRADIENT_FPS
+        return metrics
+
+
+class TruecolorScenario(TerminalScenario):
+    """Terminal renderer with per-cell 24-bit colors, run-length compressed."""
+
+    name = "truecolor"
+    depth = "truecolor"
+
+    # The shaded gradient must stay cheaper than the 16-color rows (about
+    # 2170 bytes per frame at the default width): this catches regressions
+    # of the run-length and gap skipping in ScreenBuffer
+    budgets = {"bytes_per_frame": 1400}
+
+    def render(self, index):
+        remaining = self.frames - index
+        frame = rich_frame(format_time(remaining), index // 2, self.width, self.depth)
+        self.writer.write(self.screen.render(frame))
+
+
+class Color256Scenario(TruecolorScenario):
+    """The truecolor scenario on a 256-color terminal."""
+
+    name = "256color"
+    depth = "256"
+    budgets = {"bytes_per_frame": 1150}
+
+
+class DisplayScenario:
+    """RetroDigitalDisplay driven like AdvancedCountdownTimer on a fake canvas."""
+
+    name = "display"
+
+    def __init__(self, hours):
+        self.frames = int(hours * 3600)
+        self.colors = COLOR_CYCLE
+
+    def create_display(self):
+        return RetroDigitalDisplay(
+            canvas=self.canvas,
+            x=180,
+            y=200,
+            size=120,
+            color="#FF00FF",
+            glow_color="#FF88FF",
+            thickness_ratio=0.15,
+        )
+
+    def reset(self):
+        self.canvas = RecordingCanvas()
+        self.display = self.create_display()
+        # Item creation is a one-off cost; count only the per-frame updates
+        self.display.show_time(0, 0, 0)
+        self.display.flush()
+        self.start_calls = self.canvas.calls
+        self.start_updates = self.display.batch.updates
+
+    def render(self, index):
+        remaining = self.frames - index
+        hours, remainder = divmod(remaining, 3600)
+        minutes, seconds = divmod(remainder, 60)
+
+        self.display.begin_frame()
+        self.display.show_time(hours, minutes, seconds, index % 2 == 0)
+        self.display.set_color(*self.colors[(index // 2) % len(self.colors)])
+        self.display.flush()
+
+    def metrics(self, frames):
+        # Unbatched, every canvas update would be a Tcl evaluation of its own
+        updates = self.display.batch.updates - self.start_updates
+        return {
+            "tk_calls_per_frame": (self.canvas.calls - self.start_calls) / frames,
+            "unbatched_calls_per_frame": updates / frames,
+            "canvas_items": len(self.canvas.items),
+        }
+
+    def close(self):
+        pass
+
+
+class PhotoScenario(DisplayScenario):
+    """The display scenario with PhotoDigitalDisplay sprites on a 4K canvas."""
+
+    name = "photo"
+
+    def __init__(self, hours, width=3840, height=2160):
+        super().__init__(hours)
+        self.width = width
+        self.height = height
+
+    def create_display(self):
+        self.canvas.width, self.canvas.height = self.width, self.height
+        x, y, size = fit_layout(self.width, self.height)
+        return PhotoDigitalDisplay(
+            canvas=self.canvas,
+            x=x,
+            y=y,
+            size=size,
+            color="#FF00FF",
+            glow_color="#FF88FF",
+            thickness_ratio=0.15,
+            image_factory=RecordingImage,
+        )
+
+    def metrics(self, frames):
+        metrics = super().metrics(frames)
+        metrics["sprites_rendered"] = self.display.sprites_rendered
+        metrics["sprite_megabytes"] = self.display.sprite_bytes / 1e6
+        return metrics
+
+
+class ResizeScenario:
+    """Window drags between 1024x600 and 4K with the display following along."""
+
+    name = "resize"
+
+    def __init__(self, hours, event_ms=4, drag_events=1000):
+        # One frame per <Configure> event, a drag every `drag_events`
+        self.frames = int(hours * 3600)
+        self.event_ms = event_ms
+        self.drag_events = drag_events
+
+    def reset(self):
+        self.clock = VirtualClock()
+        self.canvas = RecordingCanvas()
+        self.display = RetroDigitalDisplay(
+            self.canvas, *fit_layout(1024, 600), thickness_ratio=0.15
+        )
+        self.display.show_time(12, 34, 56)
+        self.display.flush()
+        self.items = len(self.canvas.items)
+        self.start_calls = self.canvas.calls
+        self.resizer = ResizeCoalescer(None, self.clock, self.relayout)
+
+    def relayout(self, width, height):
+        self.display.place(*fit_layout(width, height))
+        self.display.flush()
+
+    def render(self, index):
+        # Out to 3840x2160 and back over each drag
+        half = self.drag_events // 2
+        progress = 1 - abs(index % self.drag_events - half) / half
+        self.resizer.resize(
+            round(1024 + progress * (3840 - 1024)), round(600 + progress * (2160 - 600))
+        )
+        self.clock.advance(self.event_ms / 1000)
+        self.clock.fire_due()
+
+    def metrics(self, frames):
+        relayouts = self.resizer.relayouts
+        calls = self.canvas.calls - self.start_calls
+        return {
+            "relayouts_per_event": relayouts / frames,
+            "tk_calls_per_relayout": calls / max(1, relayouts),
+            "items_created": len(self.canvas.items) - self.items,
+        }
+
+    def close(self):
+        pass
+
+
+class DashboardScenario:
+    """Dashboard engine with many timers whose seconds flip at staggered offsets."""
+
+    name = "dashboard"
+
+    def __init__(self, hours, timers=64, offsets=4):
+        self.timer_count = timers
+        self.offsets = offsets
+        self.seconds = int(hours * 3600)
+        # One frame per distinct flip instant: `offsets` per simulated second
+        self.frames = self.seconds * offsets
+        self.sink = open(os.devnull, "w")
+
+    def reset(self):
+        clock = VirtualClock()
+        timers = [
+            DashboardTimer(
+                f"Room {index + 1}",
+                self.seconds + index % self.offsets / self.offsets,
+                TILE_COLORS[index % len(TILE_COLORS)],
+            )
+            for index in range(self.timer_count)
+        ]
+        # Tall enough that every tile is drawn
+        rows = -(-self.timer_count // 4)
+        self.dashboard = Dashboard(
+            timers, clock=clock, stream=self.sink, size=(264, rows * 12 + 1)
+        )
+        self.dashboard.step(0.0)
+        self.start_tiles = self.dashboard.tiles_drawn
+        self.start_bytes = self.dashboard.writer.bytes
+
+    def render(self, index):
+        self.dashboard.step(self.dashboard.next_deadline())
+
+    def metrics(self, frames):
+        tiles = self.dashboard.tiles_drawn - self.start_tiles
+        written = self.dashboard.writer.bytes - self.start_bytes
+        return {"tiles_per_frame": tiles / frames, "bytes_per_frame": written / frames}
+
+    def close(self):
+        self.sink.close()
+
+
+class WheelScenario:
+    """Timing wheel holding a week of targets, advanced one second per frame."""
+
+    name = "wheel"
+
+    def __init__(self, hours, targets=100_000, horizon=7 * 24 * 3600):
+        self.frames = int(hours * 3600)
+        self.targets = targets
+        self.horizon = horizon
+
+    def reset(self):
+        # A tenth more than `targets`, cancelled again below (e.g. sessions
+        # removed from the schedule), so `targets` stay pending
+        scheduled = self.targets + self.targets // 10
+        deadlines = random.Random(0).sample(range(self.horizon), scheduled)
+        self.wheel = TimingWheel(resolution=1.0)
+
+        start = time.perf_counter()
+        handles = [self.wheel.schedule(deadline + 0.5) for deadline in deadlines]
+        self.insert_ns = (time.perf_counter() - start) / scheduled * 1e9
+
+        # The deadlines are in random order, so these are spread over the week
+        cancelled = handles[self.targets :]
+        start = time.perf_counter()
+        for handle in cancelled:
+            self.wheel.cancel(handle)
+        self.cancel_ns = (time.perf_counter() - start) / len(cancelled) * 1e9
+
+        self.pending = len(self.wheel)
+        self.expired = 0
+
+    def render(self, index):
+        self.expired += len(self.wheel.advance(index + 1))
+
+    def metrics(self, frames):
+        return {
+            "pending": self.pending,
+            "insert_ns": self.insert_ns,
+            "cancel_ns": self.cancel_ns,
+            "expired_per_frame": self.expired / frames,
+        }
+
+    def close(self):
+        pass
+
+
+class RasterScenario:
+    """Sprite-composited 1080p frames of the advanced display, one per second."""
+
+    name = "raster"
+
+    def __init__(self, hours, width=1920, height=1080, size=None):
+        self.frames = int(hours * 3600)
+        self.width = width
+        self.height = height
+        # The default of countdown-video: the largest display the frame fits
+        self.size = size or fit_size(width, height)
+
+    def reset(self):
+        self.raster = DisplayRaster(self.width, self.height, self.size)
+        self.scheduler = TickScheduler(self.frames, periods=(1.0, COLOR_CYCLE_SECONDS))
+        self.color_origin = self.scheduler.phase(COLOR_CYCLE_SECONDS, 0.0)
+        # Fill the frame before measuring
+        for index in range(8):
+            self.render(index)
+        self.start_cells = self.raster.cells_blitted
+        self.start_bytes = self.raster.bytes_blitted
+
+    def render(self, index):
+        self.raster.render(*frame_state(self.scheduler, self.color_origin, index))
+
+    def metrics(self, frames):
+        cells = self.raster.cells_blitted - self.start_cells
+        blitted = self.raster.bytes_blitted - self.start_bytes
+        return {
+            "cells_per_frame": cells / frames,
+            "blit_bytes_per_frame": blitted / frames,
+            "atlas_bytes": len(self.raster.atlas),
+        }
+
+    def close(self):
+        pass
+
+
+def import_milliseconds(module):
+    """Return the cumulative import time of `module` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        # e.g. Tk is not installed
+        return None
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    return None
+
+
+class StartupScenario:
+    """
+    Import time of the `countdown` dispatcher and of every backend it starts.
+
+    Import times depend on the machine, so the budgets are ratios to the
+    interpreter's own startup imports (`site`, as in `python -c pass`),
+    measured in the same run.
+    """
+
+    name = "startup"
+
+    modules = {
+        "cli": "countdown.cli",
+        "terminal": "countdown.terminal_countdown",
+        "gui": "countdown.main",
+        "advanced": "countdown.advanced_countdown",
+        "dashboard": "countdown.dashboard",
+        "serve": "countdown.serve",
+        "export": "countdown.export",
+        "video": "countdown.video",
+    }
+
+    # Median import times, as multiples of the interpreter startup, above
+    # which the run fails. The dispatcher imports nothing, the terminal
+    # countdown neither Tk, asyncio nor argparse, and the exporters no
+    # process pool until they use it
+    budgets = {
+        "cli_import_ratio": 1.0,
+        "terminal_import_ratio": 8,
+        "gui_import_ratio": 10,
+        "advanced_import_ratio": 12,
+        "dashboard_import_ratio": 35,
+        "serve_import_ratio": 35,
+        "export_import_ratio": 13,
+        "video_import_ratio": 15,
+    }
+
+    # Each frame runs in fresh interpreters, so tracing this one is pointless
+    traced = False
+
+    def __init__(self, hours, runs=5):
+        # One frame imports every module once; the countdown length is unused
+        self.frames = runs
+
+    def reset(self):
+        self.samples = {name: [] for name in self.modules}
+        self.startup = []
+
+    def render(self, index):
+        self.startup.append(import_milliseconds("site"))
+        for name, module in self.modules.items():
+            milliseconds = import_milliseconds(module)
+            if milliseconds is not None:
+                self.samples[name].append(milliseconds)
+
+    def metrics(self, frames):
+        startup = statistics.median(self.startup)
+        metrics = {"python_startup_ms": startup}
+        for name, samples in self.samples.items():
+            if samples:
+                milliseconds = statistics.median(samples)
+                metrics[f"{name}_import_ms"] = milliseconds
+                metrics[f"{name}_import_ratio"] = milliseconds / startup
+        return metrics
+
+    def close(self):
+        pass
+
+
+SCENARIOS = {
+    TerminalScenario.name: TerminalScenario,
+    GradientScenario.name: GradientScenario,
+    TruecolorScenario.name: TruecolorScenario,
+    Color256Scenario.name: Color256Scenario,
+    DisplayScenario.name: DisplayScenario,
+    PhotoScenario.name: PhotoScenario,
+    ResizeScenario.name: ResizeScenario,
+    DashboardScenario.name: DashboardScenario,
+    WheelScenario.name: WheelScenario,
+    RasterScenario.name: RasterScenario,
+    StartupScenario.name: StartupScenario,
+}
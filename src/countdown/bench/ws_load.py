@@ -0,0 +1,194 @@
+"""
+Load-test client for the countdown-serve WebSocket endpoint.
+
+Opens many concurrent /ws?timing=1 connections to a server on the same host
+and measures, for every delta received, the time from the server's send
+timestamp to its arrival. Both ends read time.monotonic_ns(), which is only
+comparable within one machine, so run the server and the client side by side.
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import time
+
+from countdown.scheduler import percentile
+from countdown.serve import (
+    FIELD_TIMING,
+    OP_CLOSE,
+    read_websocket_frame,
+    websocket_accept,
+    websocket_frame,
+)
+
+
+async def connect(host, port):
+    """Open a WebSocket to /ws?timing=1 and return its (reader, writer)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write(
+        (
+            "GET /ws?timing=1 HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n"
+            "\r\n"
+        ).encode()
+    )
+    response = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    if " 101 " not in response.split("\r\n", 1)[0]:
+        raise ConnectionError(response.split("\r\n", 1)[0])
+    if websocket_accept(key) not in response:
+        raise ConnectionError("Bad Sec-WebSocket-Accept")
+    return reader, writer
+
+
+def send_time(payload):
+    """Return the server timestamp appended to a delta, or None."""
+    marker = len(payload) - 9
+    if marker >= 0 and payload[marker] == FIELD_TIMING << 4:
+        return int.from_bytes(payload[marker + 1 :], "big")
+    return None
+
+
+class LoadTest:
+    """Spawns the client connections and collects their latencies."""
+
+    def __init__(self, host, port, clients, seconds, concurrency=200):
+        """
+        Initialize a new LoadTest
+
+        Parameters:
+        - host, port: Address of the countdown-serve instance
+        - clients: Number of WebSocket connections to open
+        - seconds: How long every connection stays open once all are up
+        - concurrency: Connection attempts in flight at once
+        """
+        self.host = host
+        self.port = port
+        self.clients = clients
+        self.seconds = seconds
+        self.connecting = asyncio.Semaphore(concurrency)
+        self.ready = asyncio.Event()
+
+        self.latencies_ns = []
+        self.connected = 0
+        self.failed = 0
+        self.frames = 0
+        self.payload_bytes = 0
+
+    async def client(self):
+        try:
+            async with self.connecting:
+                reader, writer = await connect(self.host, self.port)
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            self.failed += 1
+            return
+
+        self.connected += 1
+        try:
+            # Latencies only count once every client is connected
+            await self.ready.wait()
+            deadline = time.monotonic() + self.seconds
+            while (timeout := deadline - time.monotonic()) > 0:
+                try:
+                    frame = read_websocket_frame(reader)
+                    opcode, payload = await asyncio.wait_for(frame, timeout)
+                except asyncio.TimeoutError:
+                    break
+                received = time.monotonic_ns()
+                sent = send_time(payload)
+                self.frames += 1
+                self.payload_bytes += len(payload)
+                if sent is not None:
+                    self.latencies_ns.append(received - sent)
+            writer.write(websocket_frame(b"\x03\xe8", OP_CLOSE, os.urandom(4)))
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            self.failed += 1
+        finally:
+            writer.close()
+
+    async def run(self):
+        tasks = [asyncio.create_task(self.client()) for _ in range(self.clients)]
+        while self.connected + self.failed < self.clients:
+            await asyncio.sleep(0.05)
+        self.ready.set()
+        await asyncio.gather(*tasks)
+
+    def report(self):
+        """Return the connection counters and latency percentiles in ms."""
+        latencies = sorted(ns / 1e6 for ns in self.latencies_ns)
+        result = {
+            "clients": self.clients,
+            "connected": self.connected,
+            "failed": self.failed,
+            "frames": self.frames,
+            "payload_bytes_per_frame": self.payload_bytes / max(1, self.frames),
+        }
+        if latencies:
+            result.update(
+                {
+                    "p50_ms": percentile(latencies, 0.50),
+                    "p90_ms": percentile(latencies, 0.90),
+                    "p99_ms": percentile(latencies, 0.99),
+                    "max_ms": latencies[-1],
+                }
+            )
+        return result
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Countdown WebSocket Load Test")
+
+    parser.add_argument("--host", default="127.0.0.1", help="Server address")
+
+    parser.add_argument("--port", type=int, default=8080, help="Server port")
+
+    parser.add_argument(
+        "--clients", type=int, default=1000, help="Number of connections to open"
+    )
+
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=10.0,
+        help="How long to receive updates once all clients are connected",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=200,
+        help="Connection attempts in flight at once",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    async def run():
+        test = LoadTest(
+            args.host, args.port, args.clients, args.seconds, args.concurrency
+        )
+        await test.run()
+        return test.report()
+
+    try:
+        result = asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nLoad test stopped by user.")
+        return
+
+    for name, value in result.items():
+        if isinstance(value, float):
+            value = f"{value:.3f}"
+        print(f"{name:<24} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Batching of canvas updates into one Tcl evaluation per frame.
+
+Every canvas.itemconfig call is a separate Python to Tcl round trip that
+marshals its arguments. CanvasBatch collects the item updates of a frame as
+Tcl commands instead and submits them as a single script when flushed.
+ResizeCoalescer likewise turns the stream of <Configure> events of a window
+drag into a few relayouts.
+"""
+
+# Characters with a meaning in Tcl words, escaped with a backslash
+_SPECIAL = set(' ;"\\{}[]$')
+_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r", "\v": "\\v", "\f": "\\f"}
+
+
+def tcl_quote(value):
+    """Quote a value as a single word of a Tcl script."""
+    text = str(value)
+    if not text:
+        return "{}"
+    return "".join(
+        _ESCAPES.get(char) or ("\\" + char if char in _SPECIAL else char)
+        for char in text
+    )
+
+
+class CanvasBatch:
+    """Collects canvas item updates and evaluates them as one Tcl script."""
+
+    def __init__(self, canvas):
+        """
+        Initialize a new CanvasBatch
+
+        Parameters:
+        - canvas: tkinter Canvas the updates are applied to
+        """
+        self.canvas = canvas
+        self.commands = []
+
+        # Counters for instrumentation
+        self.updates = 0
+        self.evals = 0
+
+    def _queue(self, *words):
+        self.commands.append(" ".join([self.canvas._w, *map(tcl_quote, words)]))
+        self.updates += 1
+
+    def itemconfig(self, item, **options):
+        """Queue canvas.itemconfig(item, **options) for the next flush()."""
+        words = []
+        for name, value in options.items():
+            words.append(f"-{name}")
+            words.append(value)
+        self._queue("itemconfigure", item, *words)
+
+    def coords(self, item, *coords):
+        """Queue canvas.coords(item, *coords) for the next flush()."""
+        self._queue("coords", item, *coords)
+
+    def move(self, item, dx, dy):
+        """Queue canvas.move(item, dx, dy) for the next flush()."""
+        self._queue("move", item, dx, dy)
+
+    def scale(self, item, x, y, x_factor, y_factor):
+        """Queue canvas.scale(item, x, y, x_factor, y_factor)."""
+        self._queue("scale", item, x, y, x_factor, y_factor)
+
+    def flush(self):
+        """Apply the queued updates in one evaluation; return their number."""
+        count = len(self.commands)
+        if count:
+            self.canvas.tk.eval("\n".join(self.commands))
+            self.commands.clear()
+            self.evals += 1
+        return count
+
+
+class ResizeCoalescer:
+    """Runs a relayout at most once per delay while a widget is being resized."""
+
+    def __init__(self, root, clock, callback, delay_ms=50):
+        """
+        Initialize a new ResizeCoalescer
+
+        Parameters:
+        - root: Tk widget whose after() arms the relayout timer
+        - clock: Clock providing after()
+        - callback: Called with (width, height) to lay out for a new size
+        - delay_ms: Time a relayout waits for further size changes
+        """
+        self.root = root
+        self.clock = clock
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self.size = None
+        self.pending = None
+        self.scheduled = False
+
+        # Counters for instrumentation
+        self.events = 0
+        self.relayouts = 0
+
+    def configure(self, event):
+        """<Configure> handler: remember the size, relayout once it settles."""
+        self.resize(event.width, event.height)
+
+    def resize(self, width, height):
+        self.events += 1
+        self.pending = (width, height)
+        if not self.scheduled:
+            self.scheduled = True
+            self.clock.after(self.root, self.delay_ms, self.relayout)
+
+    def relayout(self):
+        """Lay out for the latest size seen, if it differs from the last one."""
+        self.scheduled = False
+        if self.pending == self.size:
+            return
+        self.size = self.pending
+        self.relayouts += 1
+        self.callback(*self.size)
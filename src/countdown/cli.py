@@ -0,0 +1,64 @@
+"""
+The `countdown` command: every countdown tool behind one entry point.
+
+`countdown <command> [options]` imports only the module of the selected
+command and hands the remaining arguments to its main(), so starting the
+terminal countdown does not pay for Tk, asyncio or the exporters. This module
+itself imports nothing beyond what the interpreter has already loaded.
+"""
+
+import sys
+
+# Command -> (module providing main(), description); imported on demand
+COMMANDS = {
+    "terminal": ("countdown.terminal_countdown", "Countdown in the terminal"),
+    "gui": ("countdown.main", "Basic Tkinter countdown window"),
+    "advanced": ("countdown.advanced_countdown", "Tkinter 7-segment display"),
+    "dashboard": ("countdown.dashboard", "Many timers on one terminal screen"),
+    "serve": ("countdown.serve", "Browser overlay server"),
+    "clock": ("countdown.shared_clock", "Shared clock for screens on one host"),
+    "sync": ("countdown.clock_sync", "Sync displays across machines"),
+    "export": ("countdown.export", "Export the countdown as image frames"),
+    "video": ("countdown.video", "Raw video frames for an encoder"),
+    "bench": ("countdown.bench.runner", "Renderer benchmarks"),
+    "ws-load": ("countdown.bench.ws_load", "WebSocket load test for the server"),
+}
+
+
+def usage():
+    """Return the list of commands."""
+    lines = ["usage: countdown <command> [options]", "", "commands:"]
+    for name, (_, description) in COMMANDS.items():
+        lines.append(f"  {name:<10} {description}")
+    lines.append("")
+    lines.append("Run 'countdown <command> --help' for the options of a command.")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0 if argv else 2
+
+    if argv[0] == "--version":
+        from countdown import __version__
+
+        print(f"countdown {__version__}")
+        return 0
+
+    name = argv[0]
+    if name not in COMMANDS:
+        print(f"countdown: unknown command '{name}'", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+
+    module = __import__(COMMANDS[name][0], fromlist=["main"])
+    # The command parses its own options and reports itself in --help
+    sys.argv = [f"countdown {name}"] + argv[1:]
+    return module.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
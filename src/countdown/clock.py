@@ -0,0 +1,102 @@
+"""
+Clock abstraction for the countdown timers.
+
+The timers read wall time, monotonic time, sleep and arm Tk timers only
+through a clock object. SystemClock uses the real clock; VirtualClock lets a
+simulation drive a whole countdown without waiting for it in real time.
+"""
+
+import heapq
+import itertools
+import time
+from datetime import datetime, timedelta
+
+
+class SimulationComplete(Exception):
+    """Raised by VirtualClock once the simulated time limit is reached."""
+
+
+class SystemClock:
+    """The real clock: datetime.now(), time.monotonic(), sleep and root.after()."""
+
+    realtime = True
+
+    def now(self):
+        return datetime.now()
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def after(self, root, delay_ms, callback):
+        return root.after(delay_ms, callback)
+
+
+class VirtualClock:
+    """
+    A simulated clock that only advances when the code sleeps or a timer fires.
+
+    Sleeping returns immediately after moving the clock forward, and after()
+    queues the callback; run() then fires queued callbacks in time order,
+    jumping the clock straight to each one's due time.
+    """
+
+    realtime = False
+
+    def __init__(self, start=None, stop_after=None):
+        """
+        Initialize a new VirtualClock
+
+        Parameters:
+        - start: Wall-clock datetime at simulated time zero (default: now)
+        - stop_after: Simulated seconds after which sleep() and run() stop by
+          raising SimulationComplete (default: never)
+        """
+        self.start = start or datetime.now()
+        self.elapsed = 0.0
+        self.stop_after = stop_after
+
+        # Pending after() callbacks as (due, sequence, callback)
+        self.timers = []
+        self.sequence = itertools.count()
+        self.wakeups = 0
+
+    def now(self):
+        return self.start + timedelta(seconds=self.elapsed)
+
+    def monotonic(self):
+        return self.elapsed
+
+    def advance(self, seconds):
+        """Move the clock forward, raising SimulationComplete past the limit."""
+        self.elapsed += max(0.0, seconds)
+        if self.stop_after is not None and self.elapsed >= self.stop_after:
+            raise SimulationComplete()
+
+    def sleep(self, seconds):
+        self.wakeups += 1
+        self.advance(seconds)
+
+    def after(self, root, delay_ms, callback):
+        due = self.elapsed + delay_ms / 1000
+        heapq.heappush(self.timers, (due, next(self.sequence), callback))
+
+    def fire_due(self):
+        """Fire the queued after() callbacks that are due by now."""
+        while self.timers and self.timers[0][0] <= self.elapsed:
+            _, _, callback = heapq.heappop(self.timers)
+            self.wakeups += 1
+            callback()
+
+    def run(self):
+        """Fire queued after() callbacks in order until none are left."""
+        try:
+            while self.timers:
+                due, _, callback = heapq.heappop(self.timers)
+                self.advance(due - self.elapsed)
+                self.wakeups += 1
+                callback()
+        except SimulationComplete:
+            pass
@@ -0,0 +1,419 @@
+"""
+LAN clock synchronization so displays on several hosts flip together.
+
+A leader answers small UDP requests with its monotonic clock readings, its
+wall-clock offset and the countdown deadline. Followers poll it NTP-style:
+from the four timestamps of an exchange they estimate the offset between
+the two clocks and the round-trip time, keep the offset of the fastest
+recent exchange (the least disturbed by queueing), and fit a drift (skew)
+over the longer history. SyncedClock presents the leader's time through the
+usual clock interface, so every renderer schedules its flips against the
+leader's clock instead of its own.
+
+Timestamps of one exchange:
+- t1: follower sends the request (follower clock)
+- t2: leader receives it (leader clock)
+- t3: leader sends the response (leader clock)
+- t4: follower receives the response (follower clock)
+
+offset = ((t2 - t1) + (t3 - t4)) / 2, round trip = (t4 - t1) - (t3 - t2)
+"""
+
+import argparse
+import math
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from countdown.clock import SystemClock
+from countdown.scheduler import monotonic_deadline
+from countdown.terminal_countdown import (
+    format_time,
+    parse_duration,
+    parse_target_time,
+)
+
+DEFAULT_PORT = 9123
+
+# magic, sequence, t1
+REQUEST = struct.Struct("!4sId")
+REQUEST_MAGIC = b"CDSQ"
+
+# magic, sequence, t1 (echoed), t2, t3, wall offset, deadline (NaN if none)
+RESPONSE = struct.Struct("!4sIddddd")
+RESPONSE_MAGIC = b"CDSR"
+
+
+def parse_address(address, default_port=DEFAULT_PORT):
+    """Split "host[:port]" into a (host, port) tuple."""
+    host, _, port = address.rpartition(":")
+    if not host:
+        return port, default_port
+    return host, int(port)
+
+
+class ClockLeader:
+    """Answers follower requests with its clock readings and the deadline."""
+
+    def __init__(
+        self, deadline=None, host="0.0.0.0", port=DEFAULT_PORT, offset=0.0, skew_ppm=0.0
+    ):
+        """
+        Initialize a new ClockLeader
+
+        Parameters:
+        - deadline: Monotonic instant the countdown reaches zero (or None)
+        - host, port: Address to listen on
+        - offset: Seconds added to every reading (to test followers locally)
+        - skew_ppm: Drift applied to every reading in parts per million
+          (to test followers locally)
+        """
+        self.deadline = deadline
+        self.offset = offset
+        self.skew = skew_ppm / 1e6
+        self.origin = time.monotonic()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((host, port))
+        self.address = self.socket.getsockname()
+        self.requests = 0
+
+    def monotonic(self):
+        """Return the leader's monotonic time (shifted for local testing)."""
+        local = time.monotonic()
+        return local + self.offset + (local - self.origin) * self.skew
+
+    def wall_offset(self):
+        """Return the Unix time minus the leader's monotonic time."""
+        return time.time() - self.monotonic()
+
+    def answer(self, packet, sender):
+        received = self.monotonic()
+        if len(packet) != REQUEST.size:
+            return
+        magic, sequence, sent = REQUEST.unpack(packet)
+        if magic != REQUEST_MAGIC:
+            return
+
+        deadline = math.nan if self.deadline is None else self.deadline
+        wall_offset = self.wall_offset()
+        response = RESPONSE.pack(
+            RESPONSE_MAGIC,
+            sequence,
+            sent,
+            received,
+            self.monotonic(),
+            wall_offset,
+            deadline,
+        )
+        self.socket.sendto(response, sender)
+        self.requests += 1
+
+    def serve_forever(self):
+        while True:
+            packet, sender = self.socket.recvfrom(512)
+            self.answer(packet, sender)
+
+    def close(self):
+        self.socket.close()
+
+
+class SyncedClock(SystemClock):
+    """
+    Clock that reads the leader's time, kept in sync by a background thread.
+
+    monotonic() and now() return the leader's monotonic and wall time as
+    estimated from the latest exchanges; sleep() and after() are those of the
+    local system, which is fine because they only wait for intervals.
+    """
+
+    def __init__(self, leader, poll_interval=1.0, window=8, history=64, timeout=0.5):
+        """
+        Initialize a new SyncedClock
+
+        Parameters:
+        - leader: (host, port) of the ClockLeader
+        - poll_interval: Seconds between exchanges once synchronized
+        - window: Recent exchanges the fastest one is picked from
+        - history: Filtered offsets the skew is fitted over
+        - timeout: Seconds to wait for a response before counting it as lost
+        """
+        self.leader = leader
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.settimeout(timeout)
+        self.socket.connect(leader)
+
+        # Raw exchanges as (round trip, offset, local receive time)
+        self.samples = deque(maxlen=window)
+        # Filtered offsets as (local time, offset) for the skew fit
+        self.history = deque(maxlen=history)
+
+        # (offset, skew, reference local time) swapped in as a single tuple
+        self.estimate = (0.0, 0.0, time.monotonic())
+        self.round_trip = None
+        self.wall_offset = time.time() - time.monotonic()
+        self.deadline = None
+
+        self.sequence = 0
+        self.sent = 0
+        self.lost = 0
+        self.synced = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def monotonic(self):
+        offset, skew, reference = self.estimate
+        local = time.monotonic()
+        return local + offset + (local - reference) * skew
+
+    def now(self):
+        return datetime.fromtimestamp(self.wall_offset + self.monotonic())
+
+    def target_time(self):
+        """Return the leader's deadline as a datetime, or None if it has none."""
+        if self.deadline is None:
+            return None
+        return self.now() + timedelta(seconds=self.deadline - self.monotonic())
+
+    def exchange(self):
+        """Run one request/response exchange; return True if it succeeded."""
+        self.sequence = (self.sequence + 1) & 0xFFFFFFFF
+        sent = time.monotonic()
+        self.sent += 1
+        try:
+            self.socket.send(REQUEST.pack(REQUEST_MAGIC, self.sequence, sent))
+        except OSError:
+            # E.g. the ICMP "port unreachable" of an earlier request
+            self.lost += 1
+            return False
+
+        while True:
+            try:
+                packet = self.socket.recv(512)
+            except OSError:
+                # Timed out, or the leader is not running
+                self.lost += 1
+                return False
+            received = time.monotonic()
+            if len(packet) != RESPONSE.size:
+                continue
+            magic, sequence, echoed, leader_received, leader_sent, wall, deadline = (
+                RESPONSE.unpack(packet)
+            )
+            # Ignore stray or late answers to earlier requests
+            if magic == RESPONSE_MAGIC and sequence == self.sequence and echoed == sent:
+                break
+
+        round_trip = (received - sent) - (leader_sent - leader_received)
+        offset = ((leader_received - sent) + (leader_sent - received)) / 2
+        self.samples.append((round_trip, offset, received))
+        self.wall_offset = wall
+        self.deadline = None if math.isnan(deadline) else deadline
+        self.update_estimate()
+        return True
+
+    def update_estimate(self):
+        # The fastest exchange of the window suffered the least queueing delay
+        round_trip, offset, local = min(self.samples)
+        if not self.history or self.history[-1] != (local, offset):
+            self.history.append((local, offset))
+
+        skew = 0.0
+        if len(self.history) >= 4:
+            times = [t for t, _ in self.history]
+            offsets = [o for _, o in self.history]
+            mean_t = sum(times) / len(times)
+            mean_o = sum(offsets) / len(offsets)
+            spread = sum((t - mean_t) ** 2 for t in times)
+            if spread > 0:
+                skew = (
+                    sum((t - mean_t) * (o - mean_o) for t, o in self.history) / spread
+                )
+
+        self.round_trip = round_trip
+        self.estimate = (offset, skew, local)
+        self.synced.set()
+
+    def run(self):
+        # A quick burst fills the window, then poll at the regular interval
+        burst = self.samples.maxlen
+        while not self.stopped.is_set():
+            self.exchange()
+            interval = self.poll_interval
+            if burst > 0:
+                burst -= 1
+                interval = 0.05
+            self.stopped.wait(interval)
+
+    def start(self, wait=2.0):
+        """Start syncing in the background; return True once synchronized."""
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self.synced.wait(wait)
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+        self.socket.close()
+
+    def stats(self):
+        """Return the current offset, round trip and skew estimates."""
+        offset, skew, reference = self.estimate
+        return {
+            "offset_ms": offset * 1000,
+            "round_trip_ms": (self.round_trip or 0.0) * 1000,
+            "skew_ppm": skew * 1e6,
+            "exchanges": self.sent,
+            "lost": self.lost,
+        }
+
+
+def format_sync_stats(stats):
+    """Format the dictionary returned by SyncedClock.stats()."""
+    return (
+        f"offset={stats['offset_ms']:+.3f}ms rtt={stats['round_trip_ms']:.3f}ms "
+        f"skew={stats['skew_ppm']:+.1f}ppm "
+        f"exchanges={stats['exchanges']} lost={stats['lost']}"
+    )
+
+
+def follow_leader(address):
+    """Start a SyncedClock for a renderer's --sync-leader option, or None."""
+    clock = SyncedClock(parse_address(address))
+    if not clock.start():
+        print(f"Error: no answer from clock leader {address}")
+        clock.stop()
+        return None
+    return clock
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Retro Countdown Clock Sync")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    lead = commands.add_parser("lead", help="Serve the clock and countdown target")
+    group = lead.add_mutually_exclusive_group()
+
+    group.add_argument(
+        "--time", type=str, help="Target time in format HH:MM:SS or HH:MM"
+    )
+
+    group.add_argument(
+        "--duration",
+        type=str,
+        default="5",
+        help="Duration for countdown. Formats: minutes (5), decimal minutes (5.5), MM:SS (5:30), or HH:MM:SS (1:30:45)",
+    )
+
+    lead.add_argument("--host", default="0.0.0.0", help="Address to listen on")
+
+    lead.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help="UDP port to listen on"
+    )
+
+    lead.add_argument(
+        "--fake-offset-ms",
+        type=float,
+        default=0.0,
+        help="Shift the served clock (to test followers on one machine)",
+    )
+
+    lead.add_argument(
+        "--fake-skew-ppm",
+        type=float,
+        default=0.0,
+        help="Make the served clock drift (to test followers on one machine)",
+    )
+
+    follow = commands.add_parser("follow", help="Report offset and skew to a leader")
+
+    follow.add_argument("leader", help="Leader address as HOST[:PORT]")
+
+    follow.add_argument(
+        "--seconds", type=float, default=30.0, help="How long to follow the leader"
+    )
+
+    follow.add_argument(
+        "--interval", type=float, default=1.0, help="Seconds between exchanges"
+    )
+
+    return parser.parse_args()
+
+
+def lead(args):
+    clock = SystemClock()
+
+    # Parse the target time if provided
+    target_time = None
+    if args.time:
+        try:
+            target_time = parse_target_time(args.time)
+        except ValueError:
+            print("Invalid time format. Using default duration.")
+
+    if target_time is None:
+        duration_seconds = 300  # Default: 5 minutes
+        try:
+            duration_seconds = parse_duration(args.duration)
+        except ValueError as e:
+            print(f"Error: {e}")
+            print("Using default duration (5 minutes).")
+        target_time = clock.now() + timedelta(seconds=duration_seconds)
+
+    leader = ClockLeader(
+        host=args.host,
+        port=args.port,
+        offset=args.fake_offset_ms / 1000,
+        skew_ppm=args.fake_skew_ppm,
+    )
+    # The deadline is served on the leader's (possibly shifted) clock
+    leader.deadline = leader.monotonic() + (
+        monotonic_deadline(target_time, clock) - clock.monotonic()
+    )
+    print(f"Leading countdown on udp://{args.host}:{args.port}")
+    try:
+        leader.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nLeader stopped after {leader.requests} requests.")
+    finally:
+        leader.close()
+
+
+def follow(args):
+    clock = SyncedClock(parse_address(args.leader), poll_interval=args.interval)
+    if not clock.start():
+        print(f"Error: no answer from clock leader {args.leader}")
+        clock.stop()
+        return
+
+    end = time.monotonic() + args.seconds
+    try:
+        while time.monotonic() < end:
+            remaining = ""
+            if clock.deadline is not None:
+                seconds = max(0, math.ceil(clock.deadline - clock.monotonic()) - 1)
+                remaining = f" remaining={format_time(seconds)}"
+            print(format_sync_stats(clock.stats()) + remaining, flush=True)
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        clock.stop()
+
+
+def main():
+    args = parse_arguments()
+    if args.command == "lead":
+        lead(args)
+    else:
+        follow(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+"""
+Multi-timer dashboard: many independent countdowns in one asyncio process.
+
+All countdowns share a single heap ordered by the instant each one's display
+changes next. The event loop sleeps until the earliest of those instants,
+redraws only the tiles that changed (and within them only the changed
+cells), and goes back to sleep, so the CPU cost follows the number of digit
+changes rather than the number of timers times a poll rate.
+
+Only the timers on screen are in that heap. The expiry of every timer, shown
+or not, is a subscription to a TargetSchedule, so a schedule of thousands of
+sessions costs one timing wheel entry per session rather than a wake-up per
+session and second.
+"""
+
+import argparse
+import asyncio
+import heapq
+import itertools
+import json
+import signal
+import tomllib
+from datetime import timedelta
+
+from countdown.clock import SystemClock
+from countdown.scheduler import TickScheduler, monotonic_deadline
+from countdown.screen_buffer import (
+    CLEAR_SCREEN,
+    ERASE_LINE,
+    HIDE_CURSOR,
+    RESET,
+    SHOW_CURSOR,
+    FrameWriter,
+    changed_span,
+    move_to,
+)
+from countdown.terminal_countdown import (
+    COLORS,
+    DIGITS,
+    format_time,
+    parse_duration,
+    parse_target_time,
+    render_ascii_rows,
+)
+from countdown.terminal_geometry import TerminalGeometry
+from countdown.timing_wheel import TargetSchedule
+
+GLYPH_WIDTH = len(DIGITS["0"][0])
+TILE_WIDTH = GLYPH_WIDTH * len("00:00:00")
+TILE_HEIGHT = 12  # Label row, 10 digit rows and a spacer row
+TILE_GAP = 2
+
+TILE_COLORS = [
+    COLORS["bright_magenta"],
+    COLORS["bright_cyan"],
+    COLORS["bright_yellow"],
+    COLORS["bright_green"],
+]
+
+
+class DashboardTimer:
+    """One countdown tile on the dashboard."""
+
+    def __init__(self, label, deadline, color):
+        self.label = label
+        self.color = color
+        self.scheduler = TickScheduler(deadline, history=1)
+
+        # What is currently drawn on screen (None until first drawn)
+        self.time_str = None
+        self.drawn_style = None
+        self.position = None
+
+    def display_value(self, now):
+        """Return the HH:MM:SS string this timer shows at monotonic time `now`."""
+        if self.scheduler.finished(now):
+            return "00:00:00"
+        return format_time(self.scheduler.remaining_seconds(now))
+
+    def style(self, now):
+        """Return the ANSI style of the digit rows."""
+        if self.scheduler.finished(now):
+            return f"{COLORS['bg_black']}{COLORS['bright_red']}"
+        return f"{COLORS['bg_black']}{self.color}"
+
+    def label_text(self, now):
+        """Return the label row text, centered over the tile."""
+        label = self.label
+        if self.scheduler.finished(now):
+            label = f"{label} - STARTED"
+        return label[:TILE_WIDTH].center(TILE_WIDTH)
+
+
+class Dashboard:
+    """Drives and draws any number of DashboardTimers from one deadline heap."""
+
+    def __init__(self, timers, clock=None, stream=None, size=None):
+        """
+        Initialize a new Dashboard
+
+        Parameters:
+        - timers: List of DashboardTimer instances
+        - clock: Clock providing monotonic time (default: SystemClock)
+        - stream: Text stream the dashboard is drawn to (default: sys.stdout)
+        - size: Fixed (columns, lines) instead of the terminal size
+        """
+        self.timers = timers
+        self.clock = clock or SystemClock()
+        self.writer = FrameWriter(stream)
+        self.geometry = TerminalGeometry()
+        self.size = size
+
+        # Heap of (next change, sequence, timer) for the shown timers still
+        # counting down; filled by layout()
+        self.heap = []
+        self.sequence = itertools.count()
+
+        # Expiry of every timer, including those not shown
+        self.expiries = TargetSchedule(self.clock)
+        for timer in timers:
+            self.expiries.subscribe_deadline(
+                timer.scheduler.deadline, self._expired, timer
+            )
+
+        self.needs_layout = True
+        self.wake = None
+        self.now = self.clock.monotonic()
+        self.lines = 0
+        self.hidden = 0
+        self.hidden_started = 0
+        self.status_changed = False
+
+        # Counters for instrumentation
+        self.frames = 0
+        self.tiles_drawn = 0
+        self.started = 0
+
+    def _push(self, timer, now):
+        if not timer.scheduler.finished(now):
+            change = timer.scheduler.next_change(now)
+            heapq.heappush(self.heap, (change, next(self.sequence), timer))
+
+    def _expired(self, handle):
+        self.started += 1
+        if handle.payload.position is None:
+            # Shown timers redraw themselves; count the others on the status line
+            self.hidden_started += 1
+            self.status_changed = True
+
+    def next_deadline(self):
+        """Return the monotonic instant of the next digit change (or None)."""
+        deadline = self.heap[0][0] if self.heap else None
+        if self.hidden:
+            # Timers off screen only matter when they expire
+            expiry = self.expiries.next_poll(self.now)
+            if expiry is not None and (deadline is None or expiry < deadline):
+                deadline = expiry
+        return deadline
+
+    def status_line(self):
+        """Return the escape sequence of the status line about hidden timers."""
+        status = f"{self.hidden} more timers not shown (enlarge the terminal)"
+        if self.hidden_started:
+            status += f", {self.hidden_started} of them started"
+        return f"{move_to(self.lines - 1, 0)}{ERASE_LINE}{status}"
+
+    def request_layout(self):
+        """Re-layout and repaint on the next step (e.g. after a resize)."""
+        self.needs_layout = True
+        if self.wake:
+            self.wake.set()
+
+    def layout(self, now):
+        """Assign tile positions for the current terminal size and repaint."""
+        columns, lines = self.size or self.geometry.size()
+        per_row = max(1, (columns + TILE_GAP) // (TILE_WIDTH + TILE_GAP))
+        visible_rows = max(1, (lines - 1) // TILE_HEIGHT)
+
+        out = [HIDE_CURSOR, RESET, CLEAR_SCREEN]
+        self.heap = []
+        self.lines = lines
+        self.hidden = 0
+        self.hidden_started = 0
+        for index, timer in enumerate(self.timers):
+            tile_row, tile_column = divmod(index, per_row)
+            timer.time_str = None
+            if tile_row >= visible_rows:
+                timer.position = None
+                self.hidden += 1
+                if timer.scheduler.finished(now):
+                    self.hidden_started += 1
+                continue
+            timer.position = (
+                tile_row * TILE_HEIGHT,
+                tile_column * (TILE_WIDTH + TILE_GAP),
+            )
+            out.append(self.draw_tile(timer, now))
+            self._push(timer, now)
+
+        if self.hidden:
+            out.append(self.status_line())
+
+        self.needs_layout = False
+        self.status_changed = False
+        return "".join(out)
+
+    def draw_tile(self, timer, now):
+        """Return the escape sequence updating the changed cells of one tile."""
+        if timer.position is None:
+            return ""
+        top, left = timer.position
+        style = timer.style(now)
+        time_str = timer.display_value(now)
+        rows = render_ascii_rows(time_str)
+
+        out = []
+        if timer.time_str is None or timer.drawn_style != style:
+            # First draw (or the switch to finished): label and all digit rows
+            label = f"{style}{COLORS['bold']}{timer.label_text(now)}"
+            out.append(f"{move_to(top, left)}{label}{RESET}")
+            for index, line in enumerate(rows):
+                out.append(f"{move_to(top + 1 + index, left)}{style}{line}{RESET}")
+        else:
+            # Glyphs have a fixed width, so the changed characters of the time
+            # string give the changed columns of every row
+            start, end = changed_span(timer.time_str, time_str)
+            start, end = start * GLYPH_WIDTH, end * GLYPH_WIDTH
+            if start < end:
+                for index, line in enumerate(rows):
+                    cell = move_to(top + 1 + index, left + start)
+                    out.append(f"{cell}{style}{line[start:end]}{RESET}")
+
+        timer.time_str = time_str
+        timer.drawn_style = style
+        self.tiles_drawn += 1
+        return "".join(out)
+
+    def step(self, now):
+        """Redraw every timer whose display changed by `now` and reschedule it."""
+        out = []
+        self.now = now
+        self.expiries.poll(now)
+        if self.needs_layout:
+            out.append(self.layout(now))
+        elif self.status_changed:
+            out.append(self.status_line())
+            self.status_changed = False
+
+        while self.heap and self.heap[0][0] <= now:
+            _, _, timer = heapq.heappop(self.heap)
+            out.append(self.draw_tile(timer, now))
+            self._push(timer, now)
+
+        self.frames += 1
+        self.writer.write("".join(out))
+
+    async def run(self):
+        """Run the dashboard until cancelled."""
+        loop = asyncio.get_running_loop()
+        self.wake = asyncio.Event()
+        if hasattr(signal, "SIGWINCH"):
+            # A burst of resizes collapses into one re-layout on the next step
+            loop.add_signal_handler(signal.SIGWINCH, self.request_layout)
+
+        try:
+            while True:
+                now = self.clock.monotonic()
+                self.step(now)
+
+                deadline = self.next_deadline()
+                handle = None
+                if deadline is not None:
+                    delay = max(0.0, deadline - self.clock.monotonic())
+                    handle = loop.call_later(delay, self.wake.set)
+                await self.wake.wait()
+                self.wake.clear()
+                if handle:
+                    handle.cancel()
+        finally:
+            if hasattr(signal, "SIGWINCH"):
+                loop.remove_signal_handler(signal.SIGWINCH)
+            bottom = move_to((self.size or self.geometry.size())[1] - 1, 0)
+            self.writer.write(f"{RESET}{bottom}{SHOW_CURSOR}")
+
+    def stats(self):
+        """Return frame and tile redraw counters."""
+        frames = max(1, self.frames)
+        return {
+            "timers": len(self.timers),
+            "started": self.started,
+            "frames": self.frames,
+            "tiles_per_frame": self.tiles_drawn / frames,
+            "bytes_per_frame": self.writer.bytes / frames,
+        }
+
+
+def load_config(path):
+    """
+    Load timer definitions from a JSON or TOML file.
+
+    The file holds a list of timers (or a "timers" key with that list); each
+    timer has a "label" and either a "time" (HH:MM or HH:MM:SS) or a
+    "duration" in any format accepted by --duration.
+    """
+    if str(path).endswith(".toml"):
+        with open(path, "rb") as f:
+            config = tomllib.load(f)
+    else:
+        with open(path) as f:
+            config = json.load(f)
+
+    if isinstance(config, dict):
+        config = config.get("timers", [])
+    return config
+
+
+def build_timers(config, clock=None):
+    """Create DashboardTimers from the loaded config entries."""
+    clock = clock or SystemClock()
+    now = clock.now()
+
+    if not isinstance(config, list):
+        raise ValueError("the timers must be a list")
+
+    timers = []
+    for index, entry in enumerate(config):
+        if not isinstance(entry, dict):
+            raise ValueError(
+                f"timer {index + 1} must be an object with a label and a "
+                f"time or duration, not {entry!r}"
+            )
+
+        label = entry.get("label", f"Timer {index + 1}")
+        if not isinstance(label, str):
+            raise ValueError(f"timer {index + 1}: the label must be a string")
+
+        if "time" in entry:
+            if not isinstance(entry["time"], str):
+                raise ValueError(
+                    f"timer {index + 1}: the time must be a string (HH:MM or HH:MM:SS)"
+                )
+            target_time = parse_target_time(entry["time"], now)
+        else:
+            seconds = parse_duration(str(entry.get("duration", "5")))
+            target_time = now + timedelta(seconds=seconds)
+
+        color = TILE_COLORS[index % len(TILE_COLORS)]
+        timers.append(
+            DashboardTimer(label, monotonic_deadline(target_time, clock), color)
+        )
+    return timers
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Retro Countdown Dashboard")
+
+    parser.add_argument(
+        "config", help="JSON or TOML file listing the timers (label + time/duration)"
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print redraw statistics when the dashboard is stopped",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    try:
+        timers = build_timers(load_config(args.config))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return
+
+    dashboard = Dashboard(timers)
+    try:
+        asyncio.run(dashboard.run())
+    except KeyboardInterrupt:
+        print(f"{COLORS['reset']}\nDashboard stopped by user.")
+
+    if args.stats:
+        stats = dashboard.stats()
+        print(
+            f"timers={stats['timers']} started={stats['started']} "
+            f"frames={stats['frames']} "
+            f"tiles/frame={stats['tiles_per_frame']:.2f} "
+            f"bytes/frame={stats['bytes_per_frame']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,71 +1,71 @@
-class RetroDigitalDisplay:
-    """A custom widget that draws digital clock-style segments for a more authentic 80s look."""
-
-    def __init__(
-        self,
-        canvas,
-        x,
-        y,
-        size=100,
-        color="#FF00FF",
-        glow_color="#FF88FF",
-        thickness_ratio=0.2,
-    ):
-        """
-        Initialize a new RetroDigitalDisplay
-
-        Parameters:
-        - canvas: tkinter Canvas to draw on
-        - x, y: Position coordinates
-        - size: Height of the digit
-        - color: Primary color for the segments
-        - glow_color: Secondary color for the glow effect
-        - thickness_ratio: Thickness of segments as ratio of size
-        """
-        self.canvas = canvas
-        self.x = x
-        self.y = y
-        self.size = size
-        self.color = color
-        self.glow_color = glow_color
-        self.width = size * 0.7  # Aspect ratio for digit width
-        self.thickness = size * thickness_ratio
-        self.segment_gap = self.thickness * 0.3
-
-        # Segment IDs for each displayed character
-        self.segments = {}
-        self.current_value = None
-
-    def _create_segment(self, points, tag):
-        """Create a segment with glow effect."""
-        # Create glow effect (larger polygon behind)
-        glow = self.canvas.create_polygon(
-            points, fill=self.glow_color, outline="", tags=f"{tag}_glow", state="hidden"
-        )
-
-        # Create the actual segment
-        segment = self.canvas.create_polygon(
-            points, fill=self.color, outline="", tags=tag, state="hidden"
-        )
-
-        return segment, glow
-
-    def create_digit(self, position=0):
-        """Create all segments for a digit at the specified position."""
-        # Calculate position offset
-        offset_x = position * (self.width + self.size * 0.3)
-
-        # Define the segments (a-g) for the 7-segment display
-        x, y = self.x + offset_x, self.y
-        w, h = self.width, self.size
-        t = self.thickness
-        g = self.segment_gap
-
+import itertools
+
+from countdown.canvas_batch import CanvasBatch
+
+# Segment patterns for digits 0-9
+SEGMENT_PATTERNS = {
+    0: "abcdef",
+    1: "bc",
+    2: "abged",
+    3: "abgcd",
+    4: "fgbc",
+    5: "afgcd",
+    6: "afedcg",
+    7: "abc",
+    8: "abcdefg",
+    9: "abcfg",
+}
+
+SEGMENT_KEYS = "abcdefg"
+
+# Segment patterns as 7-bit masks (bit 0 is segment a, bit 6 is segment g)
+SEGMENT_MASKS = {
+    digit: sum(1 << SEGMENT_KEYS.index(key) for key in pattern)
+    for digit, pattern in SEGMENT_PATTERNS.items()
+}
+
+
+# Width of an HH:MM:SS display in digit heights: seven digit steps of 0.7
+# plus 0.3 spacing, then the last digit
+DISPLAY_WIDTH_RATIO = 7 * (0.7 + 0.3) + 0.7
+
+# Source of unique tag namespaces for displays sharing a canvas
+_display_ids = itertools.count()
+
+
+def fit_layout(width, height, margin=0.05, top=1 / 3, max_size=0.4):
+    """
+    Return the (x, y, size) of an HH:MM:SS display fitted to a canvas.
+
+    Parameters:
+    - width, height: Canvas size
+    - margin: Horizontal margin on either side, as ratio of the width
+    - top: Top of the digits, as ratio of the height
+    - max_size: Largest digit height, as ratio of the height
+    """
+    size = min(width * (1 - 2 * margin) / DISPLAY_WIDTH_RATIO, height * max_size)
+    return (width - size * DISPLAY_WIDTH_RATIO) / 2, height * top, size
+
+
+def segment_points(x, y, width, height, thickness, gap):
+    """
+    Return the polygon points of segments a-g of one digit.
+
+    Parameters:
+    - x, y: Top-left corner of the digit
+    - width, height: Size of the digit
+    - thickness: Thickness of the segments
+    - gap: Space left between neighbouring segments
+    """
+    w, h = width, height
+    t = thickness
+    g = gap
+
+    return {
         # Segment a (top horizontal)
-        a_points = [x + g, y, x + w - g, y, x + w - g - t, y + t, x + g + t, y + t]
-
+        "a": [x + g, y, x + w - g, y, x + w - g - t, y + t, x + g + t, y + t],
         # Segment b (top right vertical)
-        b_points = [
+        "b": [
             x + w,
             y + g,
             x + w,
@@ -74,10 +74,9 @@ class RetroDigitalDisplay:
             y + h / 2 - g - t,
             x + w - t,
             y + g + t,
-        ]
-
+        ],
         # Segment c (bottom right vertical)
-        c_points = [
+        "c": [
             x + w,
             y + h / 2 + g,
             x + w,
@@ -86,10 +85,9 @@ class RetroDigitalDisplay:
             y + h - g - t,
             x + w - t,
             y + h / 2 + g + t,
-        ]
-
+        ],
         # Segment d (bottom horizontal)
-        d_points = [
+        "d": [
             x + g,
             y + h,
             x + w - g,
@@ -98,10 +96,9 @@ class RetroDigitalDisplay:
             y + h - t,
             x + g + t,
             y + h - t,
-        ]
-
+        ],
         # Segment e (bottom left vertical)
-        e_points = [
+        "e": [
             x,
             y + h / 2 + g,
             x,
@@ -110,10 +107,9 @@ class RetroDigitalDisplay:
             y + h - g - t,
             x + t,
             y + h / 2 + g + t,
-        ]
-
+        ],
         # Segment f (top left vertical)
-        f_points = [
+        "f": [
             x,
             y + g,
             x,
@@ -122,10 +118,9 @@ class RetroDigitalDisplay:
             y + h / 2 - g - t,
             x + t,
             y + g + t,
-        ]
-
+        ],
         # Segment g (middle horizontal)
-        g_points = [
+        "g": [
             x + g,
             y + h / 2,
             x + w - g,
@@ -134,76 +129,207 @@ class RetroDigitalDisplay:
             y + h / 2 + t / 2,
             x + g + t,
             y + h / 2 + t / 2,
-        ]
+        ],
+    }
 
-        # Create all segments
-        segments = {}
-        segments["a"] = self._create_segment(a_points, f"seg_{position}_a")
-        segments["b"] = self._create_segment(b_points, f"seg_{position}_b")
-        segments["c"] = self._create_segment(c_points, f"seg_{position}_c")
-        segments["d"] = self._create_segment(d_points, f"seg_{position}_d")
-        segments["e"] = self._create_segment(e_points, f"seg_{position}_e")
-        segments["f"] = self._create_segment(f_points, f"seg_{position}_f")
-        segments["g"] = self._create_segment(g_points, f"seg_{position}_g")
 
-        self.segments[position] = segments
-        return segments
+def colon_dots(x, y, size, thickness):
+    """
+    Return the (dot, glow) bounding boxes of the upper and lower colon dots.
 
-    def create_colon(self, position=0):
-        """Create a colon separator."""
-        offset_x = position * (self.width + self.size * 0.3)
-        x, y = self.x + offset_x, self.y
-        r = self.thickness / 2
-
-        # Upper dot
-        upper_dot = self.canvas.create_oval(
-            x - r,
-            y + self.size * 0.3 - r,
-            x + r,
-            y + self.size * 0.3 + r,
-            fill=self.color,
-            outline="",
-            tags=f"colon_{position}_1",
-        )
+    Parameters:
+    - x, y: Center line and top of the colon
+    - size: Height of the digits next to it
+    - thickness: Segment thickness, the diameter of a dot
+    """
+    r = thickness / 2
+    dots = []
+    for center in (y + size * 0.3, y + size * 0.7):
+        dot = (x - r, center - r, x + r, center + r)
+        glow = (x - r * 1.5, center - r * 1.5, x + r * 1.5, center + r * 1.5)
+        dots.append((dot, glow))
+    return dots
+
+
+class RetroDigitalDisplay:
+    """A custom widget that draws digital clock-style segments for a more authentic 80s look."""
+
+    def __init__(
+        self,
+        canvas,
+        x,
+        y,
+        size=100,
+        color="#FF00FF",
+        glow_color="#FF88FF",
+        thickness_ratio=0.2,
+        namespace=None,
+        batch=None,
+    ):
+        """
+        Initialize a new RetroDigitalDisplay
+
+        Parameters:
+        - canvas: tkinter Canvas to draw on
+        - x, y: Position coordinates
+        - size: Height of the digit
+        - color: Primary color for the segments
+        - glow_color: Secondary color for the glow effect
+        - thickness_ratio: Thickness of segments as ratio of size
+        - namespace: Prefix for the canvas tags of this display (unique by default)
+        - batch: CanvasBatch collecting the updates of a frame (default: a new
+          one on `canvas`); updates reach the canvas when it is flushed
+        """
+        self.canvas = canvas
+        self.batch = batch or CanvasBatch(canvas)
+        self.x = x
+        self.y = y
+        self.size = size
+        self.color = color
+        self.glow_color = glow_color
+        self.thickness_ratio = thickness_ratio
+        self.width = size * 0.7  # Aspect ratio for digit width
+        self.thickness = size * thickness_ratio
+        self.segment_gap = self.thickness * 0.3
+
+        # Group tags shared by all items of this display, used for bulk updates
+        self.namespace = namespace or f"retro{next(_display_ids)}"
+        self.fill_tag = f"{self.namespace}_fill"
+        self.glow_tag = f"{self.namespace}_glow"
+
+        # Segment IDs for each displayed character
+        self.segments = {}
+        self.current_value = None
+
+        # Currently shown segment mask per digit position and colon visibility
+        self.masks = {}
+        self.colon_visible = {}
+
+        # Number of canvas operations (item creations and queued updates),
+        # in total and since begin_frame()
+        self.tk_calls = 0
+        self.frame_start = 0
+
+    @property
+    def frame_tk_calls(self):
+        """Number of canvas operations since the last begin_frame()."""
+        return self.tk_calls - self.frame_start
+
+    def begin_frame(self):
+        """Start counting canvas operations for a new frame."""
+        self.frame_start = self.tk_calls
+
+    def flush(self):
+        """Apply the updates queued in the batch to the canvas."""
+        return self.batch.flush()
 
-        # Upper dot glow
-        upper_glow = self.canvas.create_oval(
-            x - r * 1.5,
-            y + self.size * 0.3 - r * 1.5,
-            x + r * 1.5,
-            y + self.size * 0.3 + r * 1.5,
+    def _itemconfig(self, item, **options):
+        """Queue a canvas item update in the frame's batch."""
+        self.tk_calls += 1
+        self.batch.itemconfig(item, **options)
+
+    def _create_segment(self, points, tag):
+        """Create a segment with glow effect."""
+        self.tk_calls += 2
+
+        # Create glow effect (larger polygon behind)
+        glow = self.canvas.create_polygon(
+            points,
             fill=self.glow_color,
             outline="",
-            tags=f"colon_{position}_1_glow",
+            tags=(f"{tag}_glow", self.glow_tag, self.namespace),
+            state="hidden",
         )
 
-        # Lower dot
-        lower_dot = self.canvas.create_oval(
-            x - r,
-            y + self.size * 0.7 - r,
-            x + r,
-            y + self.size * 0.7 + r,
+        # Create the actual segment
+        segment = self.canvas.create_polygon(
+            points,
             fill=self.color,
             outline="",
-            tags=f"colon_{position}_2",
+            tags=(tag, self.fill_tag, self.namespace),
+            state="hidden",
         )
 
-        # Lower dot glow
-        lower_glow = self.canvas.create_oval(
-            x - r * 1.5,
-            y + self.size * 0.7 - r * 1.5,
-            x + r * 1.5,
-            y + self.size * 0.7 + r * 1.5,
-            fill=self.glow_color,
-            outline="",
-            tags=f"colon_{position}_2_glow",
+        return segment, glow
+
+    def place(self, x, y, size):
+        """
+        Move the display to (x, y) and scale it to digits `size` high.
+
+        Items already on the canvas are transformed in place with one scale
+        and one move of the display's namespace tag instead of being
+        recreated; the geometry is linear in position and size, so the
+        result is the same as drawing the display there from scratch.
+        """
+        factor = size / self.size
+        if self.segments:
+            self.tk_calls += 2
+            self.batch.scale(self.namespace, 0, 0, factor, factor)
+            self.batch.move(self.namespace, x - self.x * factor, y - self.y * factor)
+
+        self.x = x
+        self.y = y
+        self.size = size
+        self.width = size * 0.7
+        self.thickness = size * self.thickness_ratio
+        self.segment_gap = self.thickness * 0.3
+
+    def position_x(self, position):
+        """Return the left edge of the digit or colon at `position`."""
+        return self.x + position * (self.width + self.size * 0.3)
+
+    def create_digit(self, position=0):
+        """Create all segments for a digit at the specified position."""
+        points = segment_points(
+            self.position_x(position),
+            self.y,
+            self.width,
+            self.size,
+            self.thickness,
+            self.segment_gap,
         )
 
+        # Create all segments
+        tag = f"{self.namespace}_seg_{position}"
+        segments = {}
+        for key in SEGMENT_KEYS:
+            segments[key] = self._create_segment(points[key], f"{tag}_{key}")
+
+        self.segments[position] = segments
+        return segments
+
+    def create_colon(self, position=0):
+        """Create a colon separator."""
+        self.tk_calls += 4
+        dots = []
+        glows = []
+        for index, (dot_box, glow_box) in enumerate(
+            colon_dots(self.position_x(position), self.y, self.size, self.thickness),
+            start=1,
+        ):
+            tag = f"{self.namespace}_colon_{position}_{index}"
+
+            # Dot, then its glow drawn over it
+            dots.append(
+                self.canvas.create_oval(
+                    *dot_box,
+                    fill=self.color,
+                    outline="",
+                    tags=(tag, self.fill_tag, self.namespace),
+                )
+            )
+            glows.append(
+                self.canvas.create_oval(
+                    *glow_box,
+                    fill=self.glow_color,
+                    outline="",
+                    tags=(f"{tag}_glow", self.glow_tag, self.namespace),
+                )
+            )
+
         # Store the colon segments
-        self.segments[f"colon_{position}"] = {
-            "dots": [upper_dot, lower_dot],
-            "glows": [upper_glow, lower_glow],
-        }
+        self.segments[f"colon_{position}"] = {"dots": dots, "glows": glows}
+        self.colon_visible[position] = True
 
     def show_digit(self, position, digit):
         """
@@ -216,32 +342,20 @@ class RetroDigitalDisplay:
         if position not in self.segments:
             self.create_digit(position)
 
-        # Segment patterns for digits 0-9
-        patterns = {
-            0: "abcdef",
-            1: "bc",
-            2: "abged",
-            3: "abgcd",
-            4: "fgbc",
-            5: "afgcd",
-            6: "afedcg",
-            7: "abc",
-            8: "abcdefg",
-            9: "abcfg",
-        }
-
-        # Hide all segments first
-        for segment_key in "abcdefg":
-            segment, glow = self.segments[position][segment_key]
-            self.canvas.itemconfig(segment, state="hidden")
-            self.canvas.itemconfig(glow, state="hidden")
-
-        # Show active segments for the digit
-        pattern = patterns.get(digit, "")
-        for segment_key in pattern:
-            segment, glow = self.segments[position][segment_key]
-            self.canvas.itemconfig(segment, state="normal")
-            self.canvas.itemconfig(glow, state="normal")
+        # Only touch the segments whose state differs from what is shown
+        mask = SEGMENT_MASKS.get(digit, 0)
+        changed = mask ^ self.masks.get(position, 0)
+        if not changed:
+            return
+
+        for bit, segment_key in enumerate(SEGMENT_KEYS):
+            if changed & (1 << bit):
+                state = "normal" if mask & (1 << bit) else "hidden"
+                segment, glow = self.segments[position][segment_key]
+                self._itemconfig(segment, state=state)
+                self._itemconfig(glow, state=state)
+
+        self.masks[position] = mask
 
     def show_colon(self, position, visible=True):
         """Toggle the visibility of a colon."""
@@ -249,27 +363,31 @@ class RetroDigitalDisplay:
         if colon_key not in self.segments:
             self.create_colon(position)
 
+        if self.colon_visible[position] == visible:
+            return
+
         state = "normal" if visible else "hidden"
         for dot in self.segments[colon_key]["dots"]:
-            self.canvas.itemconfig(dot, state=state)
+            self._itemconfig(dot, state=state)
         for glow in self.segments[colon_key]["glows"]:
-            self.canvas.itemconfig(glow, state=state)
+            self._itemconfig(glow, state=state)
+        self.colon_visible[position] = visible
 
-    def show_time(self, hours, minutes, seconds):
-        """Display a time in HH:MM:SS format."""
+    def show_time(self, hours, minutes, seconds, colon_visible=True):
+        """Display a time in HH:MM:SS format, the colons shown or blinked off."""
         # Hours
         self.show_digit(0, hours // 10)
         self.show_digit(1, hours % 10)
 
         # Colon
-        self.show_colon(2)
+        self.show_colon(2, colon_visible)
 
         # Minutes
         self.show_digit(3, minutes // 10)
         self.show_digit(4, minutes % 10)
 
         # Colon
-        self.show_colon(5)
+        self.show_colon(5, colon_visible)
 
         # Seconds
         self.show_digit(6, seconds // 10)
@@ -277,20 +395,10 @@ class RetroDigitalDisplay:
 
     def set_color(self, color, glow_color=None):
         """Change the color of all segments."""
-        self.color = color
-        if glow_color:
+        # Recolor every item of this display through its group tags
+        if color != self.color:
+            self.color = color
+            self._itemconfig(self.fill_tag, fill=self.color)
+        if glow_color and glow_color != self.glow_color:
             self.glow_color = glow_color
-
-        # Update all existing segments
-        for position in self.segments:
-            if isinstance(position, int):
-                for segment_key in "abcdefg":
-                    if segment_key in self.segments[position]:
-                        segment, glow = self.segments[position][segment_key]
-                        self.canvas.itemconfig(segment, fill=self.color)
-                        self.canvas.itemconfig(glow, fill=self.glow_color)
-            elif position.startswith("colon_"):
-                for dot in self.segments[position]["dots"]:
-                    self.canvas.itemconfig(dot, fill=self.color)
-                for glow in self.segments[position]["glows"]:
-                    self.canvas.itemconfig(glow, fill=self.glow_color)
+            self._itemconfig(self.glow_tag, fill=self.glow_color)
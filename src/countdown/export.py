@@ -0,0 +1,253 @@
+"""
+Offline export of the advanced countdown as an image sequence.
+
+Frames are rasterized without Tk (see countdown.raster) at a fixed frame
+rate and written as PNG or raw RGB files, one per frame. The display only
+changes on whole seconds, so each run of identical frames is rendered and
+encoded once and its repeats are hard links to the first file (or copies
+where the file system has no hard links). The frame range is split into
+chunks that a process pool renders in parallel.
+"""
+
+import argparse
+import os
+import time
+
+from countdown.palette import COLOR_CYCLE, COLOR_CYCLE_SECONDS, FINISHED_FLASH
+from countdown.raster import DisplayRaster, png_bytes
+from countdown.scheduler import TickScheduler
+from countdown.terminal_countdown import parse_duration
+
+FORMATS = ("png", "rgb")
+
+
+class ExportJob:
+    """Settings of one export, shared by every chunk of frames."""
+
+    def __init__(
+        self,
+        output,
+        duration,
+        fps=30,
+        width=1024,
+        height=600,
+        size=120,
+        tail=0.0,
+        image_format="png",
+        compression=6,
+    ):
+        """
+        Initialize a new ExportJob
+
+        Parameters:
+        - output: Directory the frames are written to
+        - duration: Countdown length in seconds
+        - fps: Frames per second
+        - width, height: Frame size in pixels
+        - size: Height of the digits
+        - tail: Seconds of the flashing finished state to append
+        - image_format: "png" or "rgb" (raw 24-bit RGB rows, no header)
+        - compression: zlib level for PNG frames
+        """
+        self.output = output
+        self.duration = duration
+        self.fps = fps
+        self.width = width
+        self.height = height
+        self.size = size
+        self.tail = tail
+        self.image_format = image_format
+        self.compression = compression
+
+    @property
+    def frames(self):
+        return round((self.duration + self.tail) * self.fps)
+
+    def path(self, index):
+        return os.path.join(self.output, f"frame_{index:06d}.{self.image_format}")
+
+    def chunks(self, chunk_seconds=60):
+        """Split the frames into (start, end) ranges of whole seconds."""
+        size = max(1, round(chunk_seconds * self.fps))
+        return [
+            (start, min(start + size, self.frames))
+            for start in range(0, self.frames, size)
+        ]
+
+
+def frame_state(scheduler, color_origin, now):
+    """Return what AdvancedCountdownTimer shows at time `now` as a tuple."""
+    if scheduler.finished(now):
+        flash = scheduler.phase(1.0, now) % len(FINISHED_FLASH)
+        return (0, 0, 0, True) + FINISHED_FLASH[flash]
+
+    hours, remainder = divmod(scheduler.remaining_seconds(now), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    color_phase = scheduler.phase(COLOR_CYCLE_SECONDS, now)
+    color, glow = COLOR_CYCLE[(color_phase - color_origin) % len(COLOR_CYCLE)]
+    colon = scheduler.phase(1.0, now) % 2 == 0
+    return (hours, minutes, seconds, colon, color, glow)
+
+
+def link_or_copy(source, path, data):
+    """Make `path` a hard link to `source`, or write `data` if links fail."""
+    try:
+        if os.path.lexists(path):
+            os.remove(path)
+        os.link(source, path)
+    except OSError:
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+def export_chunk(job, start, end):
+    """Write frames [start, end) and return (rendered, repeated, bytes)."""
+    raster = DisplayRaster(
+        job.width,
+        job.height,
+        job.size,
+        row_prefix=1 if job.image_format == "png" else 0,
+    )
+    # Simulated time starts at 0 with the deadline at the countdown length,
+    # the same arithmetic the live timers use on the monotonic clock
+    scheduler = TickScheduler(job.duration, periods=(1.0, COLOR_CYCLE_SECONDS))
+    color_origin = scheduler.phase(COLOR_CYCLE_SECONDS, 0.0)
+
+    rendered = repeated = written = 0
+    last_state = last_path = data = None
+    for index in range(start, end):
+        state = frame_state(scheduler, color_origin, index / job.fps)
+        path = job.path(index)
+        if state == last_state:
+            link_or_copy(last_path, path, data)
+            repeated += 1
+            continue
+
+        frame = raster.render(*state)
+        if job.image_format == "png":
+            data = png_bytes(job.width, job.height, frame, job.compression)
+        else:
+            data = frame
+        with open(path, "wb") as f:
+            f.write(data)
+        rendered += 1
+        written += len(data)
+        last_state, last_path = state, path
+
+    return rendered, repeated, written
+
+
+def export(job, workers=None, progress=None):
+    """Render every frame of `job` with a process pool; return the totals."""
+    # Imported here: the raw video output shares frame_state with this module
+    # and has no use for a process pool
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    os.makedirs(job.output, exist_ok=True)
+    totals = [0, 0, 0]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(export_chunk, job, start, end) for start, end in job.chunks()
+        ]
+        for done, future in enumerate(as_completed(futures), start=1):
+            for index, value in enumerate(future.result()):
+                totals[index] += value
+            if progress:
+                progress(done, len(futures))
+    return tuple(totals)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Retro Countdown Frame Exporter")
+
+    parser.add_argument(
+        "--duration",
+        type=str,
+        default="5",
+        help="Duration for countdown. Formats: minutes (5), decimal minutes (5.5), MM:SS (5:30), or HH:MM:SS (1:30:45)",
+    )
+
+    parser.add_argument(
+        "--output", default="frames", help="Directory to write the frames to"
+    )
+
+    parser.add_argument(
+        "--format", choices=FORMATS, default="png", help="Image format of the frames"
+    )
+
+    parser.add_argument("--fps", type=int, default=30, help="Frames per second")
+
+    parser.add_argument("--width", type=int, default=1024, help="Frame width")
+
+    parser.add_argument("--height", type=int, default=600, help="Frame height")
+
+    parser.add_argument("--size", type=int, default=120, help="Height of the digits")
+
+    parser.add_argument(
+        "--tail",
+        type=float,
+        default=0.0,
+        help="Seconds of the flashing finished state to append",
+    )
+
+    parser.add_argument(
+        "--compression", type=int, default=6, help="PNG zlib compression level (0-9)"
+    )
+
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Worker processes (default: all CPUs)"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    try:
+        duration_seconds = parse_duration(args.duration)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    job = ExportJob(
+        args.output,
+        duration_seconds,
+        fps=args.fps,
+        width=args.width,
+        height=args.height,
+        size=args.size,
+        tail=args.tail,
+        image_format=args.format,
+        compression=args.compression,
+    )
+
+    def progress(done, total):
+        print(f"\rRendered {done}/{total} chunks", end="", flush=True)
+
+    start = time.perf_counter()
+    try:
+        rendered, repeated, written = export(job, args.jobs, progress)
+    except KeyboardInterrupt:
+        print("\nExport stopped by user.")
+        return
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"\n{job.frames} frames ({rendered} rendered, {repeated} repeated) "
+        f"in {elapsed:.1f}s, {written / 1e6:.1f} MB encoded"
+    )
+    if job.image_format == "png":
+        pattern = os.path.join(job.output, "frame_%06d.png")
+        print(f"Encode with: ffmpeg -framerate {job.fps} -i {pattern} countdown.mp4")
+    else:
+        pattern = os.path.join(job.output, "frame_*.rgb")
+        print(
+            f"Raw frames: rgb24 {job.width}x{job.height}; e.g. cat {pattern} | "
+            f"ffmpeg -f rawvideo -pix_fmt rgb24 -s {job.width}x{job.height} "
+            f"-framerate {job.fps} -i - countdown.mp4"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,31 @@ from tkinter import font as tkfont
 import argparse
 import time
 from datetime import datetime, timedelta
+from countdown.canvas_batch import CanvasBatch
+from countdown.clock import SystemClock
+from countdown.palette import GRADIENT_FPS, gradient_hex
+from countdown.scheduler import (
+    FrameBudget,
+    TickScheduler,
+    format_budget_stats,
+    format_jitter_stats,
+    monotonic_deadline,
+)
 
 
 class CountdownTimer:
-    def __init__(self, root, target_time=None, duration_minutes=5):
+    def __init__(
+        self,
+        root,
+        target_time=None,
+        duration_minutes=5,
+        clock=None,
+        shared_clock=None,
+        gradient=False,
+    ):
         self.root = root
+        self.clock = clock or SystemClock()
+        self.shared_clock = shared_clock
         self.root.title("Retro Countdown Timer")
         self.root.geometry("800x400")
         self.root.configure(bg="black")
@@ -16,7 +36,7 @@ class CountdownTimer:
         if target_time:
             self.target_time = target_time
         else:
-            self.target_time = datetime.now() + timedelta(minutes=duration_minutes)
+            self.target_time = self.clock.now() + timedelta(minutes=duration_minutes)
 
         # Create the 80s style fonts
         self.header_font = tkfont.Font(family="Courier", size=24, weight="bold")
@@ -26,6 +46,9 @@ class CountdownTimer:
         self.canvas = tk.Canvas(self.root, bg="black", highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
+        # All canvas updates of a tick are applied in one Tcl evaluation
+        self.batch = CanvasBatch(self.canvas)
+
         # Create the text elements
         self.header_text = self.canvas.create_text(
             400,
@@ -39,38 +62,95 @@ class CountdownTimer:
             400, 200, text="00:00:00", fill="#FF00FF", font=self.timer_font
         )
 
+        # Smooth gradient: fade between the two colors instead of switching
+        # them every second; frames that do not fit the budget are dropped
+        self.static_periods = periods = (1.0,)
+        self.gradient = None
+        self.budget = None
+        self.shown_second = None
+        if gradient:
+            self.gradient_period = 1 / GRADIENT_FPS
+            periods += (self.gradient_period,)
+            self.gradient = gradient_hex(("#FF00FF", "#00FFFF"), 1.0)
+            self.budget = FrameBudget(GRADIENT_FPS)
+
+        # Schedule updates on the exact second boundaries of the countdown
+        self.scheduler = TickScheduler(
+            monotonic_deadline(self.target_time, self.clock),
+            periods=periods,
+            clock=self.clock.monotonic,
+        )
+        self.animated_periods = periods
+        self.finished_shown = False
+
         # Start the timer update
         self.update_timer()
 
     def update_timer(self):
-        # Calculate remaining time
-        now = datetime.now()
-        remaining = self.target_time - now
+        now = self.scheduler.tick()
+
+        # Follow the publisher of a shared clock (deadline may move live)
+        if self.shared_clock:
+            self.shared_clock.sync(self.scheduler)
 
         # Check if countdown is complete
-        if remaining.total_seconds() <= 0:
-            self.canvas.itemconfig(self.timer_text, text="00:00:00", fill="#FF0000")
-            self.canvas.itemconfig(
-                self.header_text, text="The livestream has started!", fill="#FF0000"
-            )
+        if self.scheduler.finished(now):
+            if not self.finished_shown:
+                self.batch.itemconfig(self.timer_text, text="00:00:00", fill="#FF0000")
+                self.batch.itemconfig(
+                    self.header_text, text="The livestream has started!", fill="#FF0000"
+                )
+                self.batch.flush()
+                # Nothing animates any more: stop the gradient animation
+                self.scheduler.periods = self.static_periods
+            self.finished_shown = True
+            if self.shared_clock:
+                # The shared target can still be moved back into the future
+                delay_ms = self.scheduler.delay_ms(now)
+                self.clock.after(self.root, delay_ms, self.update_timer)
             return
 
+        if self.finished_shown:
+            self.batch.itemconfig(
+                self.header_text, text="The livestream starts in", fill="#00FF00"
+            )
+            self.scheduler.periods = self.animated_periods
+            self.finished_shown = False
+            self.shown_second = None
+
+        if self.gradient:
+            # Digit flips always render; frames in between only if they fit
+            second = self.scheduler.phase(1.0, now)
+            next_flip = self.scheduler.next_boundary(1.0, now)
+            if second == self.shown_second and not self.budget.admit(now, next_flip):
+                delay_ms = self.scheduler.delay_ms(now)
+                self.clock.after(self.root, delay_ms, self.update_timer)
+                return
+            self.shown_second = second
+
         # Format the time
-        hours, remainder = divmod(int(remaining.total_seconds()), 3600)
+        hours, remainder = divmod(self.scheduler.remaining_seconds(now), 3600)
         minutes, seconds = divmod(remainder, 60)
         time_string = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
-        # Update the timer text
-        self.canvas.itemconfig(self.timer_text, text=time_string)
-
         # Add 80s style glow effect (changing colors periodically)
-        if int(time.time()) % 2 == 0:
-            self.canvas.itemconfig(self.timer_text, fill="#FF00FF")  # Magenta
+        if self.gradient:
+            index = self.scheduler.phase(self.gradient_period, now)
+            fill = self.gradient[index % len(self.gradient)]
+        elif self.scheduler.phase(1.0, now) % 2 == 0:
+            fill = "#FF00FF"  # Magenta
         else:
-            self.canvas.itemconfig(self.timer_text, fill="#00FFFF")  # Cyan
+            fill = "#00FFFF"  # Cyan
+
+        # Update the timer text
+        self.batch.itemconfig(self.timer_text, text=time_string, fill=fill)
+        self.batch.flush()
+        if self.budget:
+            self.budget.record(now, self.scheduler.clock())
 
-        # Schedule the next update
-        self.root.after(1000, self.update_timer)
+        # Schedule the next update for the next second boundary
+        delay_ms = self.scheduler.delay_ms(now)
+        self.clock.after(self.root, delay_ms, self.update_timer)
 
 
 def parse_duration(duration_str):
@@ -128,6 +208,30 @@ def parse_arguments():
         help="Duration for countdown. Formats: minutes (5), decimal minutes (5.5), MM:SS (5:30), or HH:MM:SS (1:30:45)",
     )
 
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print tick timing statistics when the window is closed",
+    )
+
+    parser.add_argument(
+        "--shared-clock",
+        metavar="NAME",
+        help="Follow the countdown published by countdown-clock under NAME",
+    )
+
+    parser.add_argument(
+        "--sync-leader",
+        metavar="HOST[:PORT]",
+        help="Follow the clock and target of a countdown-sync leader on the LAN",
+    )
+
+    parser.add_argument(
+        "--gradient",
+        action="store_true",
+        help="Fade smoothly between the colors at up to 60 fps",
+    )
+
     return parser.parse_args()
 
 
@@ -169,11 +273,47 @@ def main():
         print(f"Error: {e}")
         print("Using default duration (5 minutes).")
 
+    shared_clock = None
+    if args.shared_clock:
+        # Imported on demand so plain runs do not load shared memory support
+        from countdown.shared_clock import SharedClockReader
+
+        try:
+            shared_clock = SharedClockReader(args.shared_clock)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error: cannot attach to shared clock: {e}")
+            return
+
+    clock = None
+    if args.sync_leader:
+        # Imported on demand so plain runs do not load the network code
+        from countdown.clock_sync import follow_leader, format_sync_stats
+
+        clock = follow_leader(args.sync_leader)
+        if clock is None:
+            return
+        # The leader's target replaces --time/--duration
+        target_time = clock.target_time() or target_time
+
     # Create the Tkinter application
     root = tk.Tk()
-    app = CountdownTimer(root, target_time, duration_minutes)
+    app = CountdownTimer(
+        root,
+        target_time,
+        duration_minutes,
+        clock=clock,
+        shared_clock=shared_clock,
+        gradient=args.gradient,
+    )
     root.mainloop()
 
+    if args.stats:
+        print(format_jitter_stats(app.scheduler.jitter_stats()))
+        if app.budget:
+            print(format_budget_stats(app.budget.stats()))
+        if clock:
+            print(format_sync_stats(clock.stats()))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,62 @@
+"""
+Shared 80s color palette for the countdown front ends.
+
+Besides the stepped color cycle, the smooth gradient mode uses lookup
+tables precomputed once per gradient (hex strings for Tk, SGR sequences for
+the terminal), so no color math or formatting happens per frame.
+"""
+
+import functools
+
+# Color cycle of the advanced display as (segment color, glow color) pairs
+COLOR_CYCLE = [
+    ("#FF00FF", "#FF88FF"),  # Magenta
+    ("#00FFFF", "#88FFFF"),  # Cyan
+    ("#FFFF00", "#FFFF88"),  # Yellow
+    ("#FF00FF", "#FF88FF"),  # Back to magenta
+]
+COLOR_CYCLE_SECONDS = 2.0  # seconds per color
+
+# Alternating colors of the flash effect once the countdown is complete
+FINISHED_FLASH = [
+    ("#FF0000", "#FF8888"),  # Red
+    ("#880000", "#440000"),  # Dark red
+]
+
+# Smooth gradient mode: frames per second of the animation
+GRADIENT_FPS = 60
+
+
+def hex_to_rgb(color):
+    """Convert "#RRGGBB" to an (r, g, b) tuple."""
+    return tuple(bytes.fromhex(color.lstrip("#")))
+
+
+def blend_stops(stops, frames_per_stop):
+    """
+    Return the RGB colors of a cyclic gradient through `stops`.
+
+    Each stop ("#RRGGBB") fades linearly into the next one (the last into
+    the first) over `frames_per_stop` frames.
+    """
+    colors = [hex_to_rgb(stop) for stop in stops]
+    gradient = []
+    for start, end in zip(colors, colors[1:] + colors[:1]):
+        for frame in range(frames_per_stop):
+            t = frame / frames_per_stop
+            gradient.append(tuple(round(a + (b - a) * t) for a, b in zip(start, end)))
+    return gradient
+
+
+@functools.lru_cache(maxsize=16)
+def gradient_hex(stops, seconds_per_stop=COLOR_CYCLE_SECONDS, fps=GRADIENT_FPS):
+    """Return a lookup table of "#RRGGBB" strings, one per animation frame."""
+    frames = max(1, round(seconds_per_stop * fps))
+    return tuple(f"#{r:02X}{g:02X}{b:02X}" for r, g, b in blend_stops(stops, frames))
+
+
+@functools.lru_cache(maxsize=16)
+def gradient_sgr(stops, seconds_per_stop=COLOR_CYCLE_SECONDS, fps=GRADIENT_FPS):
+    """Return a lookup table of 24-bit SGR foreground sequences, one per frame."""
+    frames = max(1, round(seconds_per_stop * fps))
+    return tuple(f"\033[38;2;{r};{g};{b}m" for r, g, b in blend_stops(stops, frames))
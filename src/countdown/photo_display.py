@@ -0,0 +1,201 @@
+"""
+Advanced display backend drawing every position as one PhotoImage item.
+
+RetroDigitalDisplay keeps 14 polygons per digit that Tk re-rasterizes on
+every change. PhotoDigitalDisplay instead pre-renders each glyph, with a
+blurred glow polygons cannot draw (see countdown.raster.glyph_levels), into
+a PhotoImage sprite once per size and colors, and shows a time by swapping
+the image of the positions that changed: eight canvas items in total.
+"""
+
+import math
+import tkinter as tk
+from collections import OrderedDict
+
+from countdown.digital_display import RetroDigitalDisplay
+from countdown.raster import glyph_levels, glyph_shapes, ppm_bytes, shade
+
+# Glow around a glyph, as ratio of the digit height; at most half the gap
+# between two digits so neighbouring images never overlap
+GLOW_PAD = 0.12
+
+# Memory the sprite cache may hold (Tk keeps 4 bytes per pixel): the
+# digits of the color cycle at 4K
+SPRITE_CACHE_BYTES = 128 * 1024 * 1024
+
+
+class PhotoDigitalDisplay(RetroDigitalDisplay):
+    """RetroDigitalDisplay drawn with one pre-rendered image per position."""
+
+    def __init__(
+        self,
+        canvas,
+        x,
+        y,
+        size=100,
+        color="#FF00FF",
+        glow_color="#FF88FF",
+        thickness_ratio=0.2,
+        namespace=None,
+        batch=None,
+        image_factory=None,
+        cache_bytes=SPRITE_CACHE_BYTES,
+    ):
+        """
+        Initialize a new PhotoDigitalDisplay
+
+        Parameters as for RetroDigitalDisplay, and:
+        - image_factory: Called with PPM data to create a sprite image
+          (default: a tk.PhotoImage of the canvas)
+        - cache_bytes: Memory the least recently used sprites are evicted
+          from the cache beyond
+        """
+        super().__init__(
+            canvas,
+            x,
+            y,
+            size,
+            color,
+            glow_color,
+            thickness_ratio,
+            namespace,
+            batch,
+        )
+        self.image_factory = image_factory or self._photo_image
+        self.cache_bytes = cache_bytes
+
+        # Image item per position and the (glyph, color, glow) it shows
+        self.items = {}
+        self.shown = {}
+
+        # Glyph planes of the current size, and the sprites made from them
+        self.levels = {}
+        self.sprites = OrderedDict()
+        self.sprite_bytes = 0
+
+        # Evicted sprites, kept alive until the batch that may still name
+        # them has been flushed
+        self.retired = []
+
+        # Counters for instrumentation
+        self.sprites_rendered = 0
+
+    def _photo_image(self, data):
+        return tk.PhotoImage(master=self.canvas, data=data, format="PPM")
+
+    def _cell(self, position, glyph):
+        """Return (left, top, width, height, origin x) of a position's image."""
+        pad = self.size * GLOW_PAD
+        height = math.ceil(self.size + 2 * pad)
+        if isinstance(glyph, str):
+            # Colons are centered on their position and get the rest of the gap
+            half = self.size * 0.3 - pad
+            left = self.position_x(position) - half
+            return left, self.y - pad, math.ceil(2 * half), height, half
+        width = math.ceil(self.width + 2 * pad)
+        return self.position_x(position) - pad, self.y - pad, width, height, pad
+
+    def _sprite(self, position, glyph):
+        """Return the image of a glyph in the current colors, rendering it once."""
+        key = (glyph, self.color, self.glow_color)
+        image = self.sprites.get(key)
+        if image is not None:
+            self.sprites.move_to_end(key)
+            return image
+
+        _, _, width, height, origin_x = self._cell(position, glyph)
+        levels = self.levels.get(glyph)
+        if levels is None:
+            pad = self.size * GLOW_PAD
+            shapes = glyph_shapes(glyph, origin_x, pad, self.size, self.thickness)
+            levels = self.levels[glyph] = glyph_levels(shapes, width, height, pad)
+
+        pixels = shade(levels, self.color, self.glow_color)
+        image = self.image_factory(ppm_bytes(width, height, pixels))
+        self.sprites[key] = image
+        self.sprite_bytes += width * height * 4
+        self.sprites_rendered += 1
+        self._evict()
+        return image
+
+    def _evict(self):
+        # Drop the least recently used sprites that are not on screen
+        shown = set(self.shown.values())
+        for key in list(self.sprites):
+            if self.sprite_bytes <= self.cache_bytes:
+                break
+            if key in shown:
+                continue
+            self.retired.append(self.sprites.pop(key))
+            _, _, width, height, _ = self._cell(0, key[0])
+            self.sprite_bytes -= width * height * 4
+
+    def begin_frame(self):
+        """Start a new frame; the previous frame's batch has been flushed."""
+        super().begin_frame()
+        self.retired.clear()
+
+    def flush(self):
+        """Apply the queued updates, then release the evicted sprites."""
+        count = super().flush()
+        self.retired.clear()
+        return count
+
+    def _show(self, position, glyph):
+        key = (glyph, self.color, self.glow_color)
+        if self.shown.get(position) == key:
+            return
+
+        image = self._sprite(position, glyph)
+        item = self.items.get(position)
+        if item is None:
+            left, top, _, _, _ = self._cell(position, glyph)
+            self.tk_calls += 1
+            self.items[position] = self.canvas.create_image(
+                left,
+                top,
+                anchor="nw",
+                image=image,
+                tags=(f"{self.namespace}_pos_{position}", self.namespace),
+            )
+        else:
+            self._itemconfig(item, image=image)
+        self.shown[position] = key
+
+    def show_digit(self, position, digit):
+        """Display a digit at the specified position."""
+        self._show(position, digit)
+
+    def show_colon(self, position, visible=True):
+        """Show or hide the colon at the specified position."""
+        self._show(position, ":" if visible else "")
+
+    def set_color(self, color, glow_color=None):
+        """Change the color of all positions."""
+        self.color = color
+        if glow_color:
+            self.glow_color = glow_color
+        for position, (glyph, _, _) in list(self.shown.items()):
+            self._show(position, glyph)
+
+    def place(self, x, y, size):
+        """
+        Move the display to (x, y) and scale it to digits `size` high.
+
+        The images are moved in place; a new size renders new sprites.
+        """
+        resized = size != self.size
+        super().place(x, y, size)
+        if resized:
+            self.levels.clear()
+            self.retired.extend(self.sprites.values())
+            self.sprites.clear()
+            self.sprite_bytes = 0
+
+        for position, (glyph, _, _) in list(self.shown.items()):
+            left, top, _, _, _ = self._cell(position, glyph)
+            self.tk_calls += 1
+            self.batch.coords(self.items[position], left, top)
+            if resized:
+                del self.shown[position]
+                self._show(position, glyph)
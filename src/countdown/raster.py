@@ -0,0 +1,458 @@
+"""
+Tk-free rasterizer for the seven-segment display.
+
+The polygons and ovals RetroDigitalDisplay draws on a canvas are converted
+into horizontal pixel spans and filled in the same stacking order Tk uses,
+so the output matches the window (Tk does not anti-alias canvas polygons
+either). Each glyph is rasterized once into a sprite; frames are composed by
+copying sprites into a reused frame buffer.
+"""
+
+import itertools
+import math
+import operator
+import struct
+import zlib
+
+from countdown.digital_display import (
+    SEGMENT_KEYS,
+    SEGMENT_MASKS,
+    colon_dots,
+    fit_layout,
+    segment_points,
+)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Digit and colon positions of an HH:MM:SS display
+DIGIT_POSITIONS = (0, 1, 3, 4, 6, 7)
+COLON_POSITIONS = (2, 5)
+
+
+# Bytes per pixel of the supported frame buffer layouts
+PIXEL_FORMATS = {"rgb24": 3, "bgra": 4}
+
+# Blurred glow: samples across the glow radius at the reduced resolution it
+# is computed at, and brightness of the blurred coverage
+GLOW_SAMPLES = 16
+GLOW_GAIN = 2.0
+
+
+def hex_to_rgb(color):
+    """Convert "#RRGGBB" to its three RGB bytes."""
+    return bytes.fromhex(color.lstrip("#"))
+
+
+def pixel_bytes(color, pixel_format="rgb24"):
+    """Convert "#RRGGBB" to the bytes of one pixel in `pixel_format`."""
+    rgb = hex_to_rgb(color)
+    if pixel_format == "bgra":
+        return rgb[::-1] + b"\xff"
+    return rgb
+
+
+def polygon_spans(points, width, height):
+    """
+    Return the (row, first column, end column) spans covering a convex polygon.
+
+    A pixel is covered when its center lies inside the polygon.
+    """
+    xs = points[0::2]
+    ys = points[1::2]
+    edges = list(zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1]))
+
+    spans = []
+    top = max(0, math.floor(min(ys)))
+    bottom = min(height, math.ceil(max(ys)))
+    for row in range(top, bottom):
+        center = row + 0.5
+        crossings = [
+            x0 + (center - y0) * (x1 - x0) / (y1 - y0)
+            for x0, y0, x1, y1 in edges
+            if min(y0, y1) <= center < max(y0, y1)
+        ]
+        if crossings:
+            first = max(0, math.ceil(min(crossings) - 0.5))
+            end = min(width, math.ceil(max(crossings) - 0.5))
+            if first < end:
+                spans.append((row, first, end))
+    return spans
+
+
+def oval_spans(box, width, height):
+    """Return the (row, first column, end column) spans covering an oval."""
+    x0, y0, x1, y1 = box
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    rx, ry = (x1 - x0) / 2, (y1 - y0) / 2
+
+    spans = []
+    for row in range(max(0, math.floor(y0)), min(height, math.ceil(y1))):
+        dy = (row + 0.5 - cy) / ry
+        if abs(dy) < 1:
+            dx = rx * math.sqrt(1 - dy * dy)
+            first = max(0, math.ceil(cx - dx - 0.5))
+            end = min(width, math.ceil(cx + dx - 0.5))
+            if first < end:
+                spans.append((row, first, end))
+    return spans
+
+
+def png_bytes(width, height, scanlines, level=6):
+    """
+    Encode an 8-bit RGB image as PNG.
+
+    `scanlines` holds every row prefixed by its filter byte (0 for none).
+    """
+
+    def chunk(kind, data):
+        checksum = zlib.crc32(kind + data)
+        return struct.pack("!I", len(data)) + kind + data + struct.pack("!I", checksum)
+
+    header = struct.pack("!IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        PNG_SIGNATURE
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(scanlines, level))
+        + chunk(b"IEND", b"")
+    )
+
+
+def glyph_shapes(glyph, x, y, size, thickness):
+    """
+    Return the shapes of a glyph as ("polygon", points) and ("oval", box).
+
+    Parameters:
+    - glyph: A digit, ":" for a shown colon or "" for a hidden one
+    - x, y: Top-left corner of a digit, or center line and top of a colon
+    - size: Height of the digits
+    - thickness: Thickness of the segments
+    """
+    if glyph == ":":
+        return [("oval", dot) for dot, _ in colon_dots(x, y, size, thickness)]
+    if glyph == "":
+        return []
+    points = segment_points(x, y, size * 0.7, size, thickness, thickness * 0.3)
+    mask = SEGMENT_MASKS.get(glyph, 0)
+    return [
+        ("polygon", points[key])
+        for bit, key in enumerate(SEGMENT_KEYS)
+        if mask & (1 << bit)
+    ]
+
+
+def shape_spans(shapes, width, height, scale=1.0):
+    """Yield the spans covering `shapes` with their coordinates scaled."""
+    for kind, coords in shapes:
+        coords = [value * scale for value in coords]
+        if kind == "oval":
+            yield from oval_spans(coords, width, height)
+        else:
+            yield from polygon_spans(coords, width, height)
+
+
+def box_blur(values, width, height, radius):
+    """Blur a row-major plane of floats with one horizontal and one vertical box."""
+    window = 2 * radius + 1
+    scale = itertools.repeat(1 / window)
+
+    def blur(line):
+        # Window sums as differences of prefix sums padded by the radius
+        sums = [0.0] * (radius + 1)
+        sums += itertools.accumulate(line)
+        sums += [sums[-1]] * radius
+        return list(map(operator.mul, map(operator.sub, sums[window:], sums), scale))
+
+    rows = [blur(values[row * width : (row + 1) * width]) for row in range(height)]
+    columns = [blur(column) for column in zip(*rows)]
+    return [value for row in zip(*columns) for value in row]
+
+
+def glyph_levels(shapes, width, height, glow_radius):
+    """
+    Return a width x height byte plane of a glyph and its blurred glow.
+
+    255 marks the glyph and 0-254 the brightness of the glow around it. The
+    glow is the glyph's coverage blurred by three box blurs (close to a
+    gaussian), computed at a resolution of GLOW_SAMPLES pixels per glow
+    radius and scaled back up; shade() turns the plane into colored pixels.
+    """
+    levels = bytearray(width * height)
+    if not shapes:
+        return levels
+
+    if glow_radius > 0:
+        step = max(1, round(glow_radius / GLOW_SAMPLES))
+        low_width, low_height = math.ceil(width / step), math.ceil(height / step)
+        coverage = [0.0] * (low_width * low_height)
+        for row, first, end in shape_spans(shapes, low_width, low_height, 1 / step):
+            start = row * low_width
+            coverage[start + first : start + end] = [1.0] * (end - first)
+
+        radius = max(1, round(glow_radius / step / 3))
+        for _ in range(3):
+            coverage = box_blur(coverage, low_width, low_height, radius)
+
+        # Scale back up: each reduced pixel becomes a step x step block
+        glow = bytes(min(254, round(value * GLOW_GAIN * 254)) for value in coverage)
+        wide = bytearray(low_width * step)
+        for low_row in range(low_height):
+            low = glow[low_row * low_width : (low_row + 1) * low_width]
+            for offset in range(step):
+                wide[offset::step] = low
+            row = bytes(wide[:width])
+            for full_row in range(low_row * step, min(height, (low_row + 1) * step)):
+                levels[full_row * width : (full_row + 1) * width] = row
+
+    for row, first, end in shape_spans(shapes, width, height):
+        levels[row * width + first : row * width + end] = b"\xff" * (end - first)
+    return levels
+
+
+def shade(levels, color, glow_color):
+    """Turn a glyph_levels() plane into RGB pixels of the given colors."""
+    rgb = hex_to_rgb(color)
+    glow = hex_to_rgb(glow_color)
+    pixels = bytearray(len(levels) * 3)
+    for channel in range(3):
+        # Glow brightness 0-254 scales the glow color, 255 is the glyph color
+        table = bytes(glow[channel] * level // 254 for level in range(255))
+        pixels[channel::3] = levels.translate(table + bytes([rgb[channel]]))
+    return pixels
+
+
+def ppm_bytes(width, height, pixels):
+    """Encode 8-bit RGB pixels as a binary PPM image."""
+    return b"P6\n%d %d\n255\n" % (width, height) + pixels
+
+
+def fit_size(width, height, max_size=1 / 3):
+    """
+    Return the digit height of a display fitted to a frame.
+
+    The display is about 7.7 digit heights wide, so on wide frames the
+    width limits the size rather than `max_size` of the height.
+    """
+    return max(1, int(fit_layout(width, height, max_size=max_size)[2]))
+
+
+class DisplayRaster:
+    """
+    Composes HH:MM:SS RetroDigitalDisplay frames from pre-rasterized sprites.
+
+    Each of the eight display positions is a fixed cell of the frame. The
+    first time a cell has to show a glyph (a digit, or a shown or hidden
+    colon) in a given color, that glyph is rasterized once into a sprite of
+    the glyph atlas. A frame is then composed by copying sprite rows into
+    the frame buffer, which is reused from frame to frame: only the cells
+    whose glyph or color changed are copied again.
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        size=120,
+        thickness_ratio=0.15,
+        x=None,
+        y=None,
+        row_prefix=0,
+        background="#000000",
+        pixel_format="rgb24",
+    ):
+        """
+        Initialize a new DisplayRaster
+
+        Parameters:
+        - width, height: Frame size in pixels
+        - size: Height of the digits
+        - thickness_ratio: Thickness of segments as ratio of size
+        - x, y: Top-left corner of the display (default: centered)
+        - row_prefix: Bytes reserved before every row (1 for PNG filter bytes)
+        - background: Background color
+        - pixel_format: Pixel layout, "rgb24" or "bgra"
+        """
+        self.width = width
+        self.height = height
+        self.row_prefix = row_prefix
+        self.pixel_format = pixel_format
+        self.pixel_size = PIXEL_FORMATS[pixel_format]
+        self.stride = row_prefix + width * self.pixel_size
+        self.frame_size = self.stride * height
+        self.background = pixel_bytes(background, pixel_format)
+
+        # Same proportions as RetroDigitalDisplay
+        self.size = size
+        self.digit_width = size * 0.7
+        self.thickness = size * thickness_ratio
+        step = self.digit_width + size * 0.3
+        if x is None:
+            x = (width - (step * 7 + self.digit_width)) / 2
+        if y is None:
+            y = (height - size) / 2
+
+        # Integer cell rectangle of every position; the glyph keeps its
+        # sub-pixel offset inside the cell so sprites match direct rendering
+        self.cells = {}
+        for position in DIGIT_POSITIONS:
+            self.cells[position] = self._cell(
+                x + position * step, y, 0, self.digit_width
+            )
+        glow_radius = self.thickness * 0.75
+        for position in COLON_POSITIONS:
+            left = x + position * step
+            self.cells[position] = self._cell(
+                left, y, glow_radius, glow_radius, glyph_x=left
+            )
+
+        # Glyph atlas: sprites stored back to back, indexed by glyph and color
+        self.atlas = bytearray()
+        self.sprites = {}
+
+        # Reused frame buffer and the sprite key shown in each cell
+        self.frame = self.blank()
+        self.view = memoryview(self.frame)
+        self.shown = {}
+
+        # Counters for instrumentation
+        self.frames = 0
+        self.cells_blitted = 0
+        self.bytes_blitted = 0
+
+    def _cell(self, x, y, before, after, glyph_x=None):
+        # Cell covering [x - before, x + after] by the digit height
+        left = math.floor(x - before)
+        top = math.floor(y)
+        right = math.ceil(x + after) + 1
+        bottom = math.ceil(y + self.size) + 1
+        origin = (x if glyph_x is None else glyph_x) - left
+        return (left, top, right - left, bottom - top, origin, y - top)
+
+    def blank(self):
+        """Return a new frame filled with the background (filter bytes zero)."""
+        if not any(self.background):
+            return bytearray(self.frame_size)
+        row = bytes(self.row_prefix) + self.background * self.width
+        return bytearray(row * self.height)
+
+    def _rasterize(self, position, glyph, rgb, glow):
+        """Rasterize one glyph of a cell into a new sprite; return its offset."""
+        _, _, cell_width, cell_height, origin_x, origin_y = self.cells[position]
+        sprite = bytearray(self.background * (cell_width * cell_height))
+        pixel_size = self.pixel_size
+        row_bytes = cell_width * pixel_size
+
+        def fill(spans, color):
+            for row, first, end in spans:
+                count = end - first
+                offset = row * row_bytes + first * pixel_size
+                sprite[offset : offset + count * pixel_size] = color * count
+
+        if position in COLON_POSITIONS:
+            if glyph:
+                # Tk stacks each dot's glow on top of the dot
+                for dot, dot_glow in colon_dots(
+                    origin_x, origin_y, self.size, self.thickness
+                ):
+                    fill(oval_spans(dot, cell_width, cell_height), rgb)
+                    fill(oval_spans(dot_glow, cell_width, cell_height), glow)
+        else:
+            points = segment_points(
+                origin_x,
+                origin_y,
+                self.digit_width,
+                self.size,
+                self.thickness,
+                self.thickness * 0.3,
+            )
+            mask = SEGMENT_MASKS.get(glyph, 0)
+            for bit, key in enumerate(SEGMENT_KEYS):
+                if mask & (1 << bit):
+                    # A segment's glow has the segment's shape and sits behind
+                    # it, so on screen only the segment color shows
+                    fill(polygon_spans(points[key], cell_width, cell_height), rgb)
+
+        offset = len(self.atlas)
+        self.atlas += sprite
+        return offset
+
+    def _blit(self, position, offset):
+        """Copy the sprite at atlas `offset` into the cell of `position`."""
+        left, top, cell_width, cell_height, _, _ = self.cells[position]
+        pixel_size = self.pixel_size
+        row_bytes = cell_width * pixel_size
+
+        # Clip the cell to the frame
+        first_column = max(0, -left)
+        end_column = min(cell_width, self.width - left)
+        first_row = max(0, -top)
+        end_row = min(cell_height, self.height - top)
+        if first_column >= end_column or first_row >= end_row:
+            return
+
+        atlas = memoryview(self.atlas)
+        view = self.view
+        length = (end_column - first_column) * pixel_size
+        source = offset + first_row * row_bytes + first_column * pixel_size
+        target = (
+            (top + first_row) * self.stride
+            + self.row_prefix
+            + (left + first_column) * pixel_size
+        )
+        for _ in range(first_row, end_row):
+            view[target : target + length] = atlas[source : source + length]
+            source += row_bytes
+            target += self.stride
+
+        self.cells_blitted += 1
+        self.bytes_blitted += length * (end_row - first_row)
+
+    def show(self, position, glyph, color, glow_color):
+        """Show `glyph` (a digit, or True/False for a colon) in a cell."""
+        key = (glyph, color, glow_color)
+        if self.shown.get(position) == key:
+            return
+        # Cells of the same kind and geometry share their sprites
+        kind = "colon" if position in COLON_POSITIONS else "digit"
+        sprite = (kind, self.cells[position][2:], key)
+        offset = self.sprites.get(sprite)
+        if offset is None:
+            offset = self.sprites[sprite] = self._rasterize(
+                position,
+                glyph,
+                pixel_bytes(color, self.pixel_format),
+                pixel_bytes(glow_color, self.pixel_format),
+            )
+        self._blit(position, offset)
+        self.shown[position] = key
+
+    def render(self, hours, minutes, seconds, colon_visible, color, glow_color):
+        """
+        Update the frame to show HH:MM:SS like RetroDigitalDisplay.show_time.
+
+        Returns the reused frame buffer; it is only valid until the next call.
+        """
+        digits = (
+            hours // 10,
+            hours % 10,
+            minutes // 10,
+            minutes % 10,
+            seconds // 10,
+            seconds % 10,
+        )
+        for position, digit in zip(DIGIT_POSITIONS, digits):
+            self.show(position, digit, color, glow_color)
+        for position in COLON_POSITIONS:
+            self.show(position, bool(colon_visible), color, glow_color)
+        self.frames += 1
+        return self.frame
+
+    def stats(self):
+        """Return blit counters and the size of the glyph atlas."""
+        frames = max(1, self.frames)
+        return {
+            "frames": self.frames,
+            "cells_per_frame": self.cells_blitted / frames,
+            "bytes_per_frame": self.bytes_blitted / frames,
+            "sprites": len(self.sprites),
+            "atlas_bytes": len(self.atlas),
+        }
@@ -0,0 +1,227 @@
+"""
+Deadline-aligned tick scheduling on the monotonic clock.
+
+Rather than polling at a fixed rate, the front ends ask the TickScheduler for
+the exact instant the displayed value changes next (a second digit flip, a
+colon blink or a color cycle step), sleep until then and render once.
+"""
+
+import math
+import time
+from collections import deque
+from countdown.clock import SystemClock
+
+
+def monotonic_deadline(target_time, clock=None):
+    """Convert a wall-clock datetime target into a deadline on clock.monotonic()."""
+    clock = clock or SystemClock()
+    return clock.monotonic() + (target_time - clock.now()).total_seconds()
+
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of `values` (0 <= fraction <= 1)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def format_jitter_stats(stats):
+    """Format the dictionary returned by TickScheduler.jitter_stats()."""
+    return (
+        f"ticks={stats['ticks']} lateness p50={stats['p50_ms']:.2f}ms "
+        f"p99={stats['p99_ms']:.2f}ms max={stats['max_ms']:.2f}ms"
+    )
+
+
+class TickScheduler:
+    """
+    Compute and wait for the next instant the countdown display changes.
+
+    Every periodic effect is anchored to the deadline, so with periods of one
+    and two seconds the digits, the colon blink and the color cycle all flip
+    together on the same monotonic instants.
+    """
+
+    def __init__(
+        self,
+        deadline,
+        periods=(1.0,),
+        clock=time.monotonic,
+        sleep=time.sleep,
+        history=4096,
+    ):
+        """
+        Initialize a new TickScheduler
+
+        Parameters:
+        - deadline: Monotonic time at which the countdown reaches zero
+        - periods: Periods (in seconds) of every effect that changes the display
+        - clock: Monotonic clock function
+        - sleep: Sleep function used by wait()
+        - history: Number of recent ticks kept for the jitter statistics
+        """
+        self.deadline = deadline
+        self.periods = tuple(periods)
+        self.clock = clock
+        self.sleep = sleep
+
+        # Monotonic instant the countdown was frozen at, or None while running
+        self.paused_at = None
+
+        # Lateness (seconds) of recent ticks relative to their scheduled instant
+        self.lateness = deque(maxlen=history)
+        self.ticks = 0
+        self.scheduled = None
+        self.woken = False
+
+    def _frozen(self, now):
+        # While paused the display shows the countdown as of the pause
+        if self.paused_at is None:
+            return now
+        return min(now, self.paused_at)
+
+    def finished(self, now):
+        """Return True once the deadline has been reached."""
+        return self._frozen(now) >= self.deadline
+
+    def remaining_seconds(self, now):
+        """Return the whole seconds to display at monotonic time `now`."""
+        return max(0, math.ceil(self.deadline - self._frozen(now)) - 1)
+
+    def phase(self, period, now):
+        """Return the number of whole periods elapsed since the deadline."""
+        return math.floor((self._frozen(now) - self.deadline) / period)
+
+    def next_boundary(self, period, now):
+        """Return the first monotonic instant after `now` a `period` effect flips."""
+        boundary = self.deadline + (self.phase(period, now) + 1) * period
+        # Periods like 1/60 are not exact in binary: rounding may land on
+        # (or a hair past) `now`
+        if boundary <= now + 1e-9:
+            boundary += period
+        return boundary
+
+    def next_change(self, now):
+        """Return the first monotonic instant after `now` the display changes."""
+        if self.paused_at is not None and now >= self.paused_at:
+            # Nothing changes while paused; keep polling at the tick rate
+            return now + min(self.periods)
+        return min(self.next_boundary(period, now) for period in self.periods)
+
+    def tick(self):
+        """Mark the start of a render and record how late it is."""
+        now = self.clock()
+        if self.scheduled is not None:
+            self.lateness.append(now - self.scheduled)
+            self.ticks += 1
+            self.scheduled = None
+        return now
+
+    def wake(self):
+        """Make a pending wait() return early (e.g. from a signal handler)."""
+        self.woken = True
+
+    def wait(self, now):
+        """Sleep until the next change after `now` and return the new time."""
+        self.scheduled = self.next_change(now)
+        while not self.woken:
+            delay = self.scheduled - self.clock()
+            if delay <= 0:
+                break
+            self.sleep(delay)
+
+        if self.woken:
+            # An early wake-up is not a scheduled tick: keep it out of the stats
+            self.woken = False
+            self.scheduled = None
+        return self.tick()
+
+    def delay(self, now):
+        """Schedule the next change after `now` and return the seconds until it."""
+        self.scheduled = self.next_change(now)
+        return max(0.0, self.scheduled - self.clock())
+
+    def delay_ms(self, now):
+        """Return the delay in whole milliseconds for a Tk after() call."""
+        # Round up so the callback never fires before the boundary
+        return max(1, math.ceil(self.delay(now) * 1000))
+
+    def jitter_stats(self):
+        """Return the tick count and p50/p99/max lateness in milliseconds."""
+        values = list(self.lateness)
+        return {
+            "ticks": self.ticks,
+            "p50_ms": percentile(values, 0.50) * 1000,
+            "p99_ms": percentile(values, 0.99) * 1000,
+            "max_ms": max(values, default=0.0) * 1000,
+        }
+
+
+def format_budget_stats(stats):
+    """Format the dictionary returned by FrameBudget.stats()."""
+    return (
+        f"frames rendered={stats['rendered']} "
+        f"animation frames dropped={stats['dropped']} "
+        f"cost={stats['cost_ms']:.2f}ms over budget={stats['over_budget']}"
+    )
+
+
+class FrameBudget:
+    """
+    Decides which optional animation frames to render under load.
+
+    Frames that must happen (a digit flip) always render. An animation frame
+    in between is dropped when its expected cost would run into the next
+    flip, or when the previous frames used more than `load` of the time, so
+    a slow machine gets a choppier animation rather than late digits. Frames
+    missed while busy are never caught up: the scheduler only wakes for the
+    next frame instant after now.
+    """
+
+    def __init__(self, fps, load=0.5, smoothing=0.1):
+        """
+        Initialize a new FrameBudget
+
+        Parameters:
+        - fps: Target frame rate of the animation
+        - load: Share of the time rendering may use
+        - smoothing: Weight of the newest frame in the average frame cost
+        """
+        self.interval = 1.0 / fps
+        self.load = load
+        self.smoothing = smoothing
+        self.cost = 0.0
+        self.next_allowed = float("-inf")
+
+        # Counters for instrumentation
+        self.rendered = 0
+        self.dropped = 0
+        self.over_budget = 0
+
+    def admit(self, now, next_flip):
+        """Return True if an animation frame at `now` fits before `next_flip`."""
+        if now < self.next_allowed or now + self.cost > next_flip:
+            self.dropped += 1
+            return False
+        return True
+
+    def record(self, start, end):
+        """Record a rendered frame (animation or flip) that ran from start to end."""
+        cost = end - start
+        self.cost += self.smoothing * (cost - self.cost)
+        # Leave the rest of the time to everything else before the next frame
+        self.next_allowed = end + cost * (1 / self.load - 1)
+        self.rendered += 1
+        if cost > self.interval * self.load:
+            self.over_budget += 1
+
+    def stats(self):
+        """Return the rendered and dropped frame counters and the frame cost."""
+        return {
+            "rendered": self.rendered,
+            "dropped": self.dropped,
+            "over_budget": self.over_budget,
+            "cost_ms": self.cost * 1000,
+        }
@@ -0,0 +1,269 @@
+"""
+In-place terminal frame renderer.
+
+Instead of clearing the screen and reprinting everything, the ScreenBuffer
+keeps the previously drawn frame in memory, homes the cursor with ANSI escape
+sequences and writes only the parts of each row that actually changed.
+
+A row is styled as a whole, or cell by cell for truecolor art: then only the
+changed cells are written, and an SGR sequence only where the style differs
+from the one in effect (which carries over from cell to cell and row to row).
+"""
+
+import os
+import sys
+
+CSI = "\033["
+RESET = "\033[0m"
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+CLEAR_SCREEN = "\033[2J"
+ERASE_LINE = "\033[2K"
+ERASE_TO_EOL = "\033[K"
+
+# Unchanged cells of a row with per-cell styles that are skipped with a
+# cursor move; shorter gaps are rewritten, which costs fewer bytes
+SKIP_CELLS = 8
+
+
+def move_to(row, column):
+    """Return the escape sequence moving the cursor to a 0-based row/column."""
+    return f"{CSI}{row + 1};{column + 1}H"
+
+
+def changed_span(old, new):
+    """
+    Return the (start, end) slice of `new` that differs from `old`.
+
+    Both strings are treated as one terminal cell per character. If `new` is
+    shorter than `old`, the returned span ends at len(new) and the caller is
+    responsible for erasing the leftover cells.
+    """
+    # Binary search on slice equality keeps the character scan in C
+    low, high = 0, min(len(old), len(new))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[:middle] == new[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    start = low
+
+    if len(old) != len(new):
+        return start, len(new)
+
+    size = len(new)
+    low, high = 0, size - start
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[size - middle :] == new[size - middle :]:
+            low = middle
+        else:
+            high = middle - 1
+    return start, size - low
+
+
+class ScreenBuffer:
+    """Differential renderer for a frame made of styled text rows."""
+
+    def __init__(self):
+        # Previous frame as a list of (style, text) rows
+        self.rows = []
+        self.needs_clear = True
+
+        # Output accounting
+        self.frames = 0
+        self.last_frame_bytes = 0
+        self.total_bytes = 0
+
+    @property
+    def bytes_per_frame(self):
+        """Average number of bytes emitted per rendered frame."""
+        if not self.frames:
+            return 0.0
+        return self.total_bytes / self.frames
+
+    def invalidate(self):
+        """Forget the previous frame so the next render repaints everything."""
+        self.rows = []
+        self.needs_clear = True
+
+    def render(self, rows):
+        """
+        Return the escape sequence that turns the previous frame into `rows`.
+
+        Parameters:
+        - rows: Sequence of (style, text) tuples, one per screen row. `style`
+          is the ANSI prefix applied to the whole row (may be empty), or a
+          tuple with the SGR sequence of every cell of `text`. Per-cell
+          styles must all set the same background: a space is written in
+          whatever style is in effect.
+        """
+        out = []
+        previous = self.rows
+        if self.needs_clear:
+            out.append(HIDE_CURSOR + RESET + CLEAR_SCREEN)
+            previous = []
+            self.needs_clear = False
+
+        # SGR sequence in effect while writing per-cell rows
+        current = None
+        for index, (style, text) in enumerate(rows):
+            old = previous[index] if index < len(previous) else None
+            if old == (style, text):
+                continue
+
+            if isinstance(style, tuple):
+                current = self._render_cells(out, index, old, style, text, current)
+                continue
+            if current is not None:
+                out.append(RESET)
+                current = None
+
+            old_text = "" if old is None else old[1]
+            if old is None or old[0] != style:
+                # Style changed (or new row): repaint the whole row
+                start, end = 0, len(text)
+            else:
+                start, end = changed_span(old_text, text)
+
+            if start < end:
+                out.append(f"{move_to(index, start)}{style}{text[start:end]}{RESET}")
+            if len(text) < len(old_text):
+                out.append(f"{move_to(index, len(text))}{ERASE_TO_EOL}")
+
+        if current is not None:
+            out.append(RESET)
+
+        # Blank out rows left over from a taller previous frame
+        for index in range(len(rows), len(previous)):
+            out.append(f"{move_to(index, 0)}{ERASE_LINE}")
+
+        self.rows = list(rows)
+        frame = "".join(out)
+
+        self.frames += 1
+        self.last_frame_bytes = len(frame.encode("utf-8"))
+        self.total_bytes += self.last_frame_bytes
+        return frame
+
+    def _render_cells(self, out, index, old, styles, text, current):
+        """Write a row with per-cell styles; return the SGR now in effect."""
+        if old is None:
+            old_styles, old_text = (), ""
+        elif isinstance(old[0], tuple):
+            old_styles, old_text = old
+        else:
+            # Styled as a whole: rewrite every cell, but erase past its text
+            old_styles, old_text = (), old[1]
+
+        # Cells outside the changed spans of both the text and the styles
+        # are equal to the drawn ones
+        start, end = changed_span(old_text, text)
+        style_start, style_end = changed_span(old_styles, styles)
+        start, end = min(start, style_start), max(end, style_end)
+
+        # Changed cells, joined into segments across gaps too short to skip
+        drawn = min(len(old_text), len(old_styles), end)
+        changed = [
+            cell
+            for cell in range(start, drawn)
+            if old_text[cell] != text[cell] or old_styles[cell] != styles[cell]
+        ]
+        changed.extend(range(max(start, drawn), end))
+        segments = []
+        for cell in changed:
+            if segments and cell - segments[-1][1] < SKIP_CELLS:
+                segments[-1][1] = cell + 1
+            else:
+                segments.append([cell, cell + 1])
+
+        for first, last in segments:
+            out.append(move_to(index, first))
+            # Run-length: emit a style only where it changes, and not at all
+            # for spaces, which only show the (shared) background
+            run = first
+            for cell in range(first, last):
+                style = styles[cell]
+                if style != current and (current is None or text[cell] != " "):
+                    out.append(text[run:cell])
+                    out.append(style)
+                    current = style
+                    run = cell
+            out.append(text[run:last])
+
+        if len(text) < len(old_text):
+            if current is not None:
+                out.append(RESET)
+                current = None
+            out.append(f"{move_to(index, len(text))}{ERASE_TO_EOL}")
+        return current
+
+    def close(self):
+        """Return the sequence restoring the cursor below the last frame."""
+        return f"{RESET}{move_to(len(self.rows), 0)}{SHOW_CURSOR}"
+
+
+class FrameWriter:
+    """
+    Write each frame to the terminal with a single write call.
+
+    When the stream has a file descriptor the encoded frame goes straight to
+    os.write(), bypassing the text and buffer layers that could split it into
+    several writes. Writes and bytes are counted for instrumentation.
+    """
+
+    def __init__(self, stream=None):
+        """
+        Initialize a new FrameWriter
+
+        Parameters:
+        - stream: Text stream to write to (defaults to sys.stdout)
+        """
+        self.stream = stream or sys.stdout
+        try:
+            self.fd = self.stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            self.fd = None
+
+        self.frames = 0
+        self.writes = 0
+        self.bytes = 0
+        self.last_frame_writes = 0
+
+    def write(self, frame):
+        """Write one complete frame and return the number of bytes written."""
+        self.frames += 1
+        self.last_frame_writes = 0
+        if not frame:
+            return 0
+
+        if self.fd is None:
+            self.stream.write(frame)
+            self.stream.flush()
+            self.last_frame_writes = 1
+            size = len(frame.encode("utf-8"))
+        else:
+            # Anything printed through the stream must reach the fd first
+            self.stream.flush()
+            data = memoryview(frame.encode("utf-8"))
+            size = len(data)
+            while data:
+                written = os.write(self.fd, data)
+                data = data[written:]
+                self.last_frame_writes += 1
+
+        self.writes += self.last_frame_writes
+        self.bytes += size
+        return size
+
+    def stats(self):
+        """Return the frame, write and byte counters with per-frame averages."""
+        frames = max(1, self.frames)
+        return {
+            "frames": self.frames,
+            "writes": self.writes,
+            "bytes": self.bytes,
+            "writes_per_frame": self.writes / frames,
+            "bytes_per_frame": self.bytes / frames,
+        }
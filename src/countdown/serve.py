@@ -0,0 +1,475 @@
+"""
+Local HTTP server streaming the countdown to browser overlays.
+
+One broadcaster computes the countdown state on each tick, serializes it once
+as a Server-Sent Events message and writes the same bytes to every
+subscribed connection. A client whose unsent backlog grows beyond a fixed
+limit is disconnected instead of being buffered without bound.
+
+The /ws WebSocket endpoint sends the same countdown as compact binary deltas.
+Each update carries one byte per changed field, the field number in the high
+nibble and its new value in the low nibble:
+
+- 0-7: display positions as in RetroDigitalDisplay.show_time; digits at
+  0, 1, 3, 4, 6 and 7 (value 0-9), colons at 2 and 5 (1 shown, 0 hidden)
+- 8: color index into COLOR_CYCLE, or 4 + index into FINISHED_FLASH
+- 9: finished flag (0 or 1)
+
+A new client first receives every field, then only what changed per tick
+(typically the last seconds digit and the blinking colons: 3 bytes plus a
+2-byte frame header). With ?timing=1 each update also ends with field 15
+followed by the server's time.monotonic_ns() as 8 big-endian bytes, which
+lets a client on the same host measure delivery latency.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+import time
+from datetime import timedelta
+
+from countdown.clock import SystemClock
+from countdown.palette import COLOR_CYCLE, COLOR_CYCLE_SECONDS, FINISHED_FLASH
+from countdown.scheduler import TickScheduler, monotonic_deadline
+from countdown.terminal_countdown import (
+    format_time,
+    parse_duration,
+    parse_target_time,
+)
+
+SSE_HEADERS = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/event-stream\r\n"
+    b"Cache-Control: no-cache\r\n"
+    b"Connection: keep-alive\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"\r\n"
+    b"retry: 1000\n\n"
+)
+
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# WebSocket opcodes (RFC 6455)
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+# Delta fields beyond the eight display positions
+FIELD_COLOR = 8
+FIELD_FINISHED = 9
+FIELD_TIMING = 15
+
+OVERLAY_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Retro Countdown</title>
+<style>
+  html, body { margin: 0; background: transparent; }
+  #timer {
+    font: bold 120px "Courier New", monospace;
+    text-align: center;
+    color: #FF00FF;
+    text-shadow: 0 0 12px #FF88FF;
+  }
+</style>
+</head>
+<body>
+<div id="timer">--:--:--</div>
+<script>
+  const timer = document.getElementById("timer");
+  const events = new EventSource("/events");
+  events.onmessage = (event) => {
+    const state = JSON.parse(event.data);
+    timer.textContent = state.display;
+    timer.style.color = state.color;
+    timer.style.textShadow = "0 0 12px " + state.glow;
+  };
+</script>
+</body>
+</html>
+"""
+
+
+def http_response(status, content_type, body):
+    """Return a complete HTTP/1.1 response with the given body bytes."""
+    return (
+        f"HTTP/1.1 {status}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode() + body
+
+
+def websocket_accept(key):
+    """Return the Sec-WebSocket-Accept value for a client's handshake key."""
+    digest = hashlib.sha1(key.encode() + WEBSOCKET_GUID).digest()
+    return base64.b64encode(digest).decode()
+
+
+def websocket_frame(payload, opcode=OP_BINARY, mask=None):
+    """
+    Return one complete (FIN) WebSocket frame carrying `payload`.
+
+    Servers send unmasked frames; clients pass a 4-byte `mask`.
+    """
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, mask_bit | length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, mask_bit | 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, mask_bit | 127, length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        header += mask
+    return header + payload
+
+
+async def read_websocket_frame(reader, max_size=1 << 16):
+    """Read one WebSocket frame and return (opcode, payload), unmasking it."""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    if length > max_size:
+        raise ValueError("WebSocket frame too large")
+
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return first & 0x0F, payload
+
+
+def display_fields(state):
+    """Return the delta fields (see module docstring) of a countdown state."""
+    display = state["display"][-8:]
+    fields = [
+        (1 if state["colon"] else 0) if char == ":" else int(char) for char in display
+    ]
+    if state["finished"]:
+        fields.append(len(COLOR_CYCLE) + state["flash"])
+    else:
+        fields.append(state["color_index"])
+    fields.append(1 if state["finished"] else 0)
+    return tuple(fields)
+
+
+def encode_fields(fields, previous=None):
+    """Encode the fields that differ from `previous` (all if None) as bytes."""
+    if previous is None:
+        return bytes(field << 4 | value for field, value in enumerate(fields))
+    return bytes(
+        field << 4 | value
+        for field, (value, old) in enumerate(zip(fields, previous))
+        if value != old
+    )
+
+
+class CountdownBroadcaster:
+    """Computes the countdown state per tick and fans it out to subscribers."""
+
+    def __init__(self, target_time, clock=None, backlog_bytes=64 * 1024):
+        """
+        Initialize a new CountdownBroadcaster
+
+        Parameters:
+        - target_time: datetime to count down to
+        - clock: Clock providing time (default: SystemClock)
+        - backlog_bytes: Unsent bytes allowed per client before it is dropped
+        """
+        self.clock = clock or SystemClock()
+        self.scheduler = TickScheduler(
+            monotonic_deadline(target_time, self.clock),
+            periods=(1.0, COLOR_CYCLE_SECONDS),
+            clock=self.clock.monotonic,
+        )
+        self.color_origin = self.scheduler.phase(
+            COLOR_CYCLE_SECONDS, self.clock.monotonic()
+        )
+        self.backlog_bytes = backlog_bytes
+
+        # Transports of the connected SSE and WebSocket clients; timing
+        # clients get the delta with a send timestamp appended
+        self.subscribers = set()
+        self.ws_subscribers = set()
+        self.ws_timing_subscribers = set()
+
+        # Latest state, its serialized SSE message and its delta fields
+        self.state = None
+        self.message = b""
+        self.fields = None
+
+        # Counters for instrumentation
+        self.ticks = 0
+        self.sent = 0
+        self.dropped = 0
+
+    def compute_state(self, now):
+        """Return the countdown state at monotonic time `now`."""
+        finished = self.scheduler.finished(now)
+        flash = None
+        if finished:
+            flash = self.scheduler.phase(1.0, now) % len(FINISHED_FLASH)
+            color_index = None
+            color, glow = FINISHED_FLASH[flash]
+        else:
+            color_phase = self.scheduler.phase(COLOR_CYCLE_SECONDS, now)
+            color_index = (color_phase - self.color_origin) % len(COLOR_CYCLE)
+            color, glow = COLOR_CYCLE[color_index]
+
+        remaining = self.scheduler.remaining_seconds(now)
+        return {
+            "remaining": remaining,
+            "display": format_time(remaining),
+            "color_index": color_index,
+            "color": color,
+            "glow": glow,
+            "flash": flash,
+            "colon": self.scheduler.phase(1.0, now) % 2 == 0,
+            "finished": finished,
+        }
+
+    def keyframe(self):
+        """Return the WebSocket frame carrying every field of the latest state."""
+        return websocket_frame(encode_fields(self.fields))
+
+    def publish(self, now):
+        """Serialize the state once and write it to every subscriber."""
+        self.state = self.compute_state(now)
+        data = json.dumps(self.state, separators=(",", ":"))
+        self.message = f"data: {data}\n\n".encode()
+        self.ticks += 1
+        self.fan_out(self.subscribers, self.message)
+
+        # Encode the WebSocket delta once, shared by every client
+        fields = display_fields(self.state)
+        delta = encode_fields(fields, self.fields)
+        self.fields = fields
+        if delta:
+            if self.ws_subscribers:
+                self.fan_out(self.ws_subscribers, websocket_frame(delta))
+            if self.ws_timing_subscribers:
+                stamp = struct.pack("!BQ", FIELD_TIMING << 4, time.monotonic_ns())
+                frame = websocket_frame(delta + stamp)
+                self.fan_out(self.ws_timing_subscribers, frame)
+
+    def fan_out(self, transports, message):
+        """Write `message` to each transport, dropping clients that fall behind."""
+        for transport in list(transports):
+            if transport.is_closing():
+                transports.discard(transport)
+            elif transport.get_write_buffer_size() > self.backlog_bytes:
+                transports.discard(transport)
+                transport.abort()
+                self.dropped += 1
+            else:
+                transport.write(message)
+                self.sent += 1
+
+    async def run(self):
+        """Publish the state on every tick until cancelled."""
+        now = self.scheduler.tick()
+        while True:
+            self.publish(now)
+            await asyncio.sleep(self.scheduler.delay(now))
+            now = self.scheduler.tick()
+
+
+class OverlayServer:
+    """HTTP server exposing the overlay page, a JSON snapshot, SSE and WebSocket."""
+
+    def __init__(self, broadcaster, host="127.0.0.1", port=8080):
+        self.broadcaster = broadcaster
+        self.host = host
+        self.port = port
+        self.routes = {
+            "/": self.serve_page,
+            "/state": self.serve_state,
+            "/events": self.serve_events,
+            "/ws": self.serve_websocket,
+        }
+
+    async def handle_client(self, reader, writer):
+        """Read one request and dispatch it to its route."""
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 10)
+            lines = request.decode("latin-1").split("\r\n")
+            method, target, _ = lines[0].split(" ", 2)
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        except (
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            asyncio.TimeoutError,
+            ConnectionError,
+            ValueError,
+        ):
+            # Malformed, oversized or abandoned request
+            writer.close()
+            return
+
+        path = target.split("?", 1)[0]
+        route = self.routes.get(path)
+        if method != "GET" or route is None:
+            writer.write(http_response("404 Not Found", "text/plain", b"Not found\n"))
+            writer.close()
+            return
+
+        try:
+            await route(target, headers, reader, writer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve_page(self, target, headers, reader, writer):
+        body = OVERLAY_PAGE.encode()
+        writer.write(http_response("200 OK", "text/html; charset=utf-8", body))
+
+    async def serve_state(self, target, headers, reader, writer):
+        body = json.dumps(self.broadcaster.state).encode()
+        writer.write(http_response("200 OK", "application/json", body))
+
+    async def serve_events(self, target, headers, reader, writer):
+        # Send the latest state right away, then join the fan-out
+        writer.write(SSE_HEADERS + self.broadcaster.message)
+        subscribers = self.broadcaster.subscribers
+        subscribers.add(writer.transport)
+        try:
+            # Clients never send anything; an empty read means they went away
+            while await reader.read(1024):
+                pass
+        finally:
+            subscribers.discard(writer.transport)
+
+    async def serve_websocket(self, target, headers, reader, writer):
+        key = headers.get("sec-websocket-key")
+        if headers.get("upgrade", "").lower() != "websocket" or not key:
+            body = b"Expected a WebSocket upgrade\n"
+            writer.write(http_response("400 Bad Request", "text/plain", body))
+            return
+
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {websocket_accept(key)}\r\n"
+                "\r\n"
+            ).encode()
+        )
+        # Send every field right away, then join the delta fan-out
+        if self.broadcaster.fields is not None:
+            writer.write(self.broadcaster.keyframe())
+        if "timing=1" in target.partition("?")[2].split("&"):
+            subscribers = self.broadcaster.ws_timing_subscribers
+        else:
+            subscribers = self.broadcaster.ws_subscribers
+        subscribers.add(writer.transport)
+        try:
+            while True:
+                opcode, payload = await read_websocket_frame(reader)
+                if opcode == OP_CLOSE:
+                    writer.write(websocket_frame(payload[:2], OP_CLOSE))
+                    break
+                if opcode == OP_PING:
+                    writer.write(websocket_frame(payload, OP_PONG))
+                # Anything else from the client is ignored
+        except (asyncio.IncompleteReadError, ValueError):
+            # The client went away or sent an oversized frame
+            pass
+        finally:
+            subscribers.discard(writer.transport)
+
+    async def run(self):
+        """Start the broadcaster and serve until cancelled."""
+        server = await asyncio.start_server(
+            self.handle_client, self.host, self.port, backlog=1024
+        )
+        broadcast = asyncio.create_task(self.broadcaster.run())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            broadcast.cancel()
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Retro Countdown Overlay Server")
+    group = parser.add_mutually_exclusive_group()
+
+    group.add_argument(
+        "--time", type=str, help="Target time in format HH:MM:SS or HH:MM"
+    )
+
+    group.add_argument(
+        "--duration",
+        type=str,
+        default="5",
+        help="Duration for countdown. Formats: minutes (5), decimal minutes (5.5), MM:SS (5:30), or HH:MM:SS (1:30:45)",
+    )
+
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to listen on (default: localhost)"
+    )
+
+    parser.add_argument(
+        "--port", type=int, default=8080, help="Port to listen on (default: 8080)"
+    )
+
+    parser.add_argument(
+        "--backlog-kb",
+        type=int,
+        default=64,
+        help="Unsent kilobytes allowed per client before it is dropped",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    clock = SystemClock()
+
+    # Parse the target time if provided
+    target_time = None
+    if args.time:
+        try:
+            target_time = parse_target_time(args.time)
+        except ValueError:
+            print("Invalid time format. Using default duration.")
+
+    if target_time is None:
+        duration_seconds = 300  # Default: 5 minutes
+        try:
+            duration_seconds = parse_duration(args.duration)
+        except ValueError as e:
+            print(f"Error: {e}")
+            print("Using default duration (5 minutes).")
+        target_time = clock.now() + timedelta(seconds=duration_seconds)
+
+    broadcaster = CountdownBroadcaster(
+        target_time, clock=clock, backlog_bytes=args.backlog_kb * 1024
+    )
+    server = OverlayServer(broadcaster, args.host, args.port)
+    print(f"Serving countdown overlay on http://{args.host}:{args.port}/")
+    try:
+        asyncio.run(server.run())
+    except KeyboardInterrupt:
+        print("\nServer stopped by user.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+Shared-memory authoritative clock for renderers running side by side.
+
+One publisher process owns the countdown: its monotonic deadline, whether it
+is paused and the instant the color cycle starts. It keeps them in a small
+named shared memory block guarded by a seqlock, and any number of renderer
+processes read that block lock-free on every tick, so every screen on the
+machine flips its digits and colors on the same instants. The publisher is
+also the single place to move the target or pause the countdown while the
+renderers keep running.
+
+time.monotonic() reads the system-wide monotonic clock, so the instants
+published by one process are valid in every other process on the same host.
+
+Layout (little-endian):
+- sequence (uint64): odd while the publisher is writing
+- deadline (double): monotonic instant the countdown reaches zero
+- paused_at (double): monotonic instant the countdown froze at, NaN if running
+- color_epoch (double): monotonic instant of color index 0
+"""
+
+import argparse
+import math
+import struct
+import sys
+from collections import namedtuple
+from datetime import timedelta
+from multiprocessing import resource_tracker, shared_memory
+
+from countdown.clock import SystemClock
+from countdown.scheduler import monotonic_deadline
+from countdown.terminal_countdown import (
+    format_time,
+    parse_duration,
+    parse_target_time,
+)
+
+SEQUENCE = struct.Struct("<Q")
+PAYLOAD = struct.Struct("<ddd")
+SIZE = SEQUENCE.size + PAYLOAD.size
+
+# Reads retried while the publisher is mid-update before giving up
+MAX_RETRIES = 1_000_000
+
+ClockState = namedtuple("ClockState", "deadline paused_at color_epoch")
+
+
+class SharedClockPublisher:
+    """Owns the shared clock block and writes every change under the seqlock."""
+
+    def __init__(self, name, deadline, clock=None):
+        """
+        Initialize a new SharedClockPublisher
+
+        Parameters:
+        - name: Name of the shared memory block renderers attach to
+        - deadline: Monotonic instant the countdown reaches zero
+        - clock: Clock providing monotonic time (default: SystemClock)
+        """
+        self.clock = clock or SystemClock()
+        self.memory = shared_memory.SharedMemory(name=name, create=True, size=SIZE)
+        self.buffer = self.memory.buf
+        self.sequence = 0
+        self.state = ClockState(deadline, None, self.clock.monotonic())
+        self.publish(self.state)
+
+    def publish(self, state):
+        """Write `state` into the block; readers never see a partial update."""
+        self.state = state
+        paused_at = math.nan if state.paused_at is None else state.paused_at
+        self.sequence += 1
+        SEQUENCE.pack_into(self.buffer, 0, self.sequence)
+        PAYLOAD.pack_into(
+            self.buffer, SEQUENCE.size, state.deadline, paused_at, state.color_epoch
+        )
+        self.sequence += 1
+        SEQUENCE.pack_into(self.buffer, 0, self.sequence)
+
+    def set_deadline(self, deadline):
+        self.publish(self.state._replace(deadline=deadline))
+
+    def adjust(self, seconds):
+        """Move the deadline by `seconds` (negative to shorten the countdown)."""
+        self.set_deadline(self.state.deadline + seconds)
+
+    def pause(self):
+        if self.state.paused_at is None:
+            self.publish(self.state._replace(paused_at=self.clock.monotonic()))
+
+    def resume(self):
+        """Resume a paused countdown where it stopped, colors included."""
+        if self.state.paused_at is not None:
+            paused_for = self.clock.monotonic() - self.state.paused_at
+            self.publish(
+                ClockState(
+                    self.state.deadline + paused_for,
+                    None,
+                    self.state.color_epoch + paused_for,
+                )
+            )
+
+    def remaining_seconds(self):
+        now = self.state.paused_at
+        if now is None:
+            now = self.clock.monotonic()
+        return max(0, math.ceil(self.state.deadline - now) - 1)
+
+    def close(self):
+        """Release and remove the block; attached readers keep their mapping."""
+        self.buffer = None
+        self.memory.close()
+        self.memory.unlink()
+
+
+class SharedClockReader:
+    """Lock-free reader of a block written by SharedClockPublisher."""
+
+    def __init__(self, name):
+        """
+        Initialize a new SharedClockReader
+
+        Parameters:
+        - name: Name of the shared memory block to attach to
+        """
+        self.memory = attach(name)
+        if self.memory.size < SIZE:
+            self.memory.close()
+            raise ValueError(f"Shared memory block {name!r} is not a shared clock")
+        self.buffer = self.memory.buf
+        self.retries = 0
+
+    def read(self):
+        """Return a consistent ClockState, retrying while a write is in flight."""
+        for _ in range(MAX_RETRIES):
+            (start,) = SEQUENCE.unpack_from(self.buffer, 0)
+            if not start & 1:
+                deadline, paused_at, color_epoch = PAYLOAD.unpack_from(
+                    self.buffer, SEQUENCE.size
+                )
+                if SEQUENCE.unpack_from(self.buffer, 0)[0] == start:
+                    if math.isnan(paused_at):
+                        paused_at = None
+                    return ClockState(deadline, paused_at, color_epoch)
+            self.retries += 1
+        raise RuntimeError("Shared clock publisher stopped in the middle of an update")
+
+    def sync(self, scheduler):
+        """Point `scheduler` at the shared deadline and pause state."""
+        state = self.read()
+        scheduler.deadline = state.deadline
+        scheduler.paused_at = state.paused_at
+        return state
+
+    def close(self):
+        self.buffer = None
+        self.memory.close()
+
+
+def attach(name):
+    """Attach to an existing block without letting this process unlink it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 every attach is tracked, and the block would be
+        # removed as soon as this reader exits
+        memory = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(memory._name, "shared_memory")
+        return memory
+
+
+COMMANDS = """Commands:
+  +N / -N       move the target by N seconds
+  time HH:MM    set a new target time (HH:MM or HH:MM:SS)
+  duration D    restart the countdown with duration D (same formats as --duration)
+  pause         freeze every display
+  resume        continue where the countdown was paused
+  status        show the remaining time
+  quit          stop publishing (renderers keep their last state)"""
+
+
+def run_command(publisher, line, clock):
+    """Apply one console command to the publisher; return False to quit."""
+    command, _, argument = line.strip().partition(" ")
+    if not command:
+        return True
+    if command in ("quit", "exit"):
+        return False
+
+    if command[0] in "+-":
+        publisher.adjust(float(command))
+    elif command == "time":
+        target_time = parse_target_time(argument.strip(), clock.now())
+        publisher.set_deadline(monotonic_deadline(target_time, clock))
+    elif command == "duration":
+        start = publisher.state.paused_at
+        if start is None:
+            start = clock.monotonic()
+        publisher.set_deadline(start + parse_duration(argument.strip()))
+    elif command == "pause":
+        publisher.pause()
+    elif command == "resume":
+        publisher.resume()
+    elif command != "status":
+        print(COMMANDS)
+        return True
+
+    state = "paused" if publisher.state.paused_at is not None else "running"
+    print(f"{format_time(publisher.remaining_seconds())} ({state})")
+    return True
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Retro Countdown Shared Clock")
+    group = parser.add_mutually_exclusive_group()
+
+    group.add_argument(
+        "--time", type=str, help="Target time in format HH:MM:SS or HH:MM"
+    )
+
+    group.add_argument(
+        "--duration",
+        type=str,
+        default="5",
+        help="Duration for countdown. Formats: minutes (5), decimal minutes (5.5), MM:SS (5:30), or HH:MM:SS (1:30:45)",
+    )
+
+    parser.add_argument(
+        "--name",
+        default="countdown",
+        help="Shared memory name renderers attach to with --shared-clock",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    clock = SystemClock()
+
+    # Parse the target time if provided
+    target_time = None
+    if args.time:
+        try:
+            target_time = parse_target_time(args.time)
+        except ValueError:
+            print("Invalid time format. Using default duration.")
+
+    if target_time is None:
+        duration_seconds = 300  # Default: 5 minutes
+        try:
+            duration_seconds = parse_duration(args.duration)
+        except ValueError as e:
+            print(f"Error: {e}")
+            print("Using default duration (5 minutes).")
+        target_time = clock.now() + timedelta(seconds=duration_seconds)
+
+    try:
+        publisher = SharedClockPublisher(
+            args.name, monotonic_deadline(target_time, clock), clock
+        )
+    except FileExistsError:
+        print(f"Error: a shared clock named {args.name!r} is already running.")
+        return
+
+    print(f"Publishing shared clock {args.name!r}; start renderers with")
+    print(f"  countdown-terminal --shared-clock {args.name}")
+    print(COMMANDS)
+    try:
+        for line in sys.stdin:
+            try:
+                if not run_command(publisher, line, clock):
+                    break
+            except ValueError as e:
+                print(f"Error: {e}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.close()
+        print("\nShared clock stopped.")
+
+
+if __name__ == "__main__":
+    main()
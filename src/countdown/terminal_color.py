@@ -0,0 +1,109 @@
+"""
+Truecolor and 256-color styling of the terminal countdown's ASCII art.
+
+The 16-color renderer styles whole rows. Here every cell gets its own color:
+each glyph is one step of a gradient through the palette colors, shaded from
+the glow color at its top to the segment color at its bottom. ScreenBuffer
+writes such rows run-length compressed, with a sequence only where the color
+changes along a row, and skips the spaces a color change leaves untouched.
+"""
+
+import functools
+import os
+
+from countdown.palette import COLOR_CYCLE, blend_stops
+
+# Color depths of the terminal renderer; "16" styles whole rows with COLORS
+COLOR_DEPTHS = ("16", "256", "truecolor")
+
+# Style of the spaces: the black background of the 16-color rows
+BACKGROUND = "\033[40m"
+
+# Columns of one ASCII art glyph; every glyph is one step of the gradient
+GLYPH_WIDTH = 8
+
+# Gradient steps from one palette color to the next
+STEPS_PER_COLOR = 4
+
+# Channel values of the 6x6x6 color cube of 256-color terminals
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+
+def detect_color_depth(environ=None):
+    """Guess the color depth of the terminal from $COLORTERM and $TERM."""
+    environ = os.environ if environ is None else environ
+    if environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return "truecolor"
+    if "256color" in environ.get("TERM", ""):
+        return "256"
+    return "16"
+
+
+def rgb_to_256(rgb):
+    """Return the 256-color index of the color cube entry nearest to `rgb`."""
+    r, g, b = (
+        min(range(6), key=lambda level: abs(CUBE_LEVELS[level] - value))
+        for value in rgb
+    )
+    return 16 + 36 * r + 6 * g + b
+
+
+def sgr(rgb, depth):
+    """Return the SGR sequence of foreground `rgb` on the black background."""
+    if depth == "truecolor":
+        return "\033[40;38;2;{};{};{}m".format(*rgb)
+    return f"\033[40;38;5;{rgb_to_256(rgb)}m"
+
+
+@functools.lru_cache(maxsize=8)
+def shade_table(depth, rows):
+    """
+    Return the styles of the gradient as table[step][row].
+
+    Every step of the gradient fades from its glow color in row 0 to its
+    segment color in the last row.
+    """
+    colors = blend_stops(tuple(color for color, _ in COLOR_CYCLE), STEPS_PER_COLOR)
+    glows = blend_stops(tuple(glow for _, glow in COLOR_CYCLE), STEPS_PER_COLOR)
+
+    table = []
+    for color, glow in zip(colors, glows):
+        shades = []
+        for row in range(rows):
+            t = row / max(1, rows - 1)
+            rgb = tuple(round(a + (b - a) * t) for a, b in zip(glow, color))
+            shades.append(sgr(rgb, depth))
+        table.append(tuple(shades))
+    return tuple(table)
+
+
+@functools.lru_cache(maxsize=4096)
+def run_styles(text, style):
+    """Return the cell styles of `text` in `style`, spaces on the background."""
+    return tuple(BACKGROUND if char == " " else style for char in text)
+
+
+@functools.lru_cache(maxsize=64)
+def cell_styles(lines, depth, offset, pad, glyph_rows, row_period):
+    """
+    Return the per-cell styles of ASCII art rows for ScreenBuffer.
+
+    Parameters:
+    - lines: Rows of the art, each starting with `pad` columns of padding
+    - depth: "256" or "truecolor"
+    - offset: Gradient step of the first glyph; the color cycle advances it
+    - pad: Padding columns before the first glyph
+    - glyph_rows: Rows of one line of glyphs, shaded from top to bottom
+    - row_period: Rows from one line of glyphs to the next
+    """
+    table = shade_table(depth, glyph_rows)
+    styles = []
+    for index, line in enumerate(lines):
+        row = min(index % row_period, glyph_rows - 1)
+        cells = run_styles(line[:pad], BACKGROUND)
+        # Glyph by glyph, so the styles of a glyph row are looked up once
+        for glyph, column in enumerate(range(pad, len(line), GLYPH_WIDTH)):
+            style = table[(offset + glyph) % len(table)][row]
+            cells += run_styles(line[column : column + GLYPH_WIDTH], style)
+        styles.append(cells)
+    return tuple(styles)
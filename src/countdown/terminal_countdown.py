@@ -1,7 +1,26 @@
-import argparse
+import functools
 import time
 import os
 from datetime import datetime, timedelta
+from countdown.clock import SimulationComplete, SystemClock
+from countdown.palette import GRADIENT_FPS, gradient_sgr
+from countdown.scheduler import (
+    FrameBudget,
+    TickScheduler,
+    format_budget_stats,
+    format_jitter_stats,
+    monotonic_deadline,
+)
+from countdown.screen_buffer import FrameWriter, ScreenBuffer
+from countdown.terminal_color import (
+    COLOR_DEPTHS,
+    STEPS_PER_COLOR,
+    cell_styles,
+    detect_color_depth,
+    shade_table,
+)
+from countdown.terminal_geometry import TerminalGeometry
+from countdown.text_output import FifoOutput, TextFileOutput
 
 # ANSI color codes for terminal 80s style
 COLORS = {
@@ -15,6 +34,9 @@ COLORS = {
     "bg_black": "\033[40m",
 }
 
+# RGB values of the bright colors, the stops of the --gradient animation
+GRADIENT_STOPS = ("#FF55FF", "#55FFFF", "#FFFF55", "#55FF55")
+
 # ASCII art for header text
 HEADER_TEXT = [
     "████████ ██   ██ ███████     ██      ██ ██    ██ ███████ ███████ ████████ ██████  ███████  █████  ███    ███",
@@ -231,42 +253,207 @@ def parse_duration(duration_str):
     raise ValueError(f"Unrecognized duration format: {duration_str}")
 
 
-def render_ascii_time(time_str, color):
-    """Render the time in ASCII art."""
-    lines = [""] * 10  # 10 rows high
+def parse_target_time(time_str, now=None):
+    """
+    Parse a time of day (HH:MM or HH:MM:SS) into the next matching datetime.
+    Raises ValueError if the format is not recognized.
+    """
+    if len(time_str.split(":")) == 3:  # HH:MM:SS format
+        target_time_obj = time.strptime(time_str, "%H:%M:%S")
+    else:  # HH:MM format
+        target_time_obj = time.strptime(time_str, "%H:%M")
+
+    now = now or datetime.now()
+    target_time = datetime(
+        now.year,
+        now.month,
+        now.day,
+        target_time_obj.tm_hour,
+        target_time_obj.tm_min,
+        getattr(target_time_obj, "tm_sec", 0),
+    )
+
+    # If the target time is in the past, add a day
+    if target_time < now:
+        target_time += timedelta(days=1)
+    return target_time
+
+
+@functools.lru_cache(maxsize=256)
+def glyph_strip(chars):
+    """Return the 10 rows of `chars` rendered side by side (e.g. "12" or ":34")."""
+    glyphs = [DIGITS.get(char, DIGITS[" "]) for char in chars]
+    return tuple("".join(glyph[i] for glyph in glyphs) for i in range(10))
+
+
+@functools.lru_cache(maxsize=128)
+def render_ascii_rows(time_str):
+    """Render the time as a tuple of plain (uncolored) ASCII art rows."""
+    # Compose the rows from precomputed strips: "12", ":34", ":56"
+    groups = time_str.split(":")
+    strips = [glyph_strip(groups[0])]
+    strips += [glyph_strip(f":{group}") for group in groups[1:]]
 
-    # Build each row of the display
-    for char in time_str:
-        digit = DIGITS.get(char, DIGITS[" "])
-        for i in range(10):
-            lines[i] += digit[i]
+    return tuple("".join(parts) for parts in zip(*strips))
 
+
+@functools.lru_cache(maxsize=64)
+def styled_digit_rows(time_str, color, terminal_width=0):
+    """
+    Return the (style, text) rows of the time display in the given color,
+    centered for `terminal_width` (no padding when the width is 0).
+    """
+    rows = render_ascii_rows(time_str)
+    pad_str = " " * max(0, (terminal_width - len(rows[0])) // 2)
+
+    style = f"{COLORS['bg_black']}{color}"
+    return tuple((style, f"{pad_str}{line}") for line in rows)
+
+
+@functools.lru_cache(maxsize=64)
+def render_ascii_time(time_str, color):
+    """Render the time in ASCII art."""
     # Return the colored ASCII art
     return "\n".join(
-        [f"{COLORS['bg_black']}{color}{line}{COLORS['reset']}" for line in lines]
+        f"{style}{line}{COLORS['reset']}"
+        for style, line in styled_digit_rows(time_str, color)
     )
 
 
-def display_header(color):
-    """Display the ASCII art header."""
-    terminal_width = os.get_terminal_size().columns
+def render_cache_info():
+    """Return the hit/miss counters of the ASCII art render caches."""
+    return {
+        "glyph_strip": glyph_strip.cache_info(),
+        "render_ascii_rows": render_ascii_rows.cache_info(),
+        "styled_digit_rows": styled_digit_rows.cache_info(),
+        "render_ascii_time": render_ascii_time.cache_info(),
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def header_rows(terminal_width):
+    """Return the header lines padded and truncated for the terminal width."""
     padding = max(0, (terminal_width - len(HEADER_TEXT[0])) // 2)
     pad_str = " " * padding
 
+    rows = []
     for line in HEADER_TEXT:
         if len(line) > terminal_width:
             # Truncate if terminal too narrow
             line = line[: terminal_width - 3] + "..."
-        print(
-            f"{COLORS['bg_black']}{color}{COLORS['bold']}{pad_str}{line}{COLORS['reset']}"
-        )
+        rows.append(f"{pad_str}{line}")
+    return tuple(rows)
+
+
+@functools.lru_cache(maxsize=16)
+def styled_header_rows(terminal_width, color):
+    """Return the pre-rendered header block as (style, text) rows, plus spacing."""
+    style = f"{COLORS['bg_black']}{color}{COLORS['bold']}"
+    rows = tuple((style, line) for line in header_rows(terminal_width))
+    return rows + (("", ""), ("", ""))
+
+
+def display_header(color):
+    """Display the ASCII art header."""
+    for style, line in styled_header_rows(os.get_terminal_size().columns, color):
+        if line:
+            print(f"{style}{line}{COLORS['reset']}")
     print("\n")
 
 
-def terminal_countdown(target_time=None, duration_seconds=300):
-    """Run a terminal-based countdown timer with retro ASCII art display."""
+def countdown_frame(time_str, color, terminal_width):
+    """Build the (style, text) rows of a running countdown frame."""
+    return styled_header_rows(terminal_width, color) + styled_digit_rows(
+        time_str, color, terminal_width
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def gradient_styles(seconds_per_stop):
+    """Return the (header, digits) style lookup tables of the gradient mode."""
+    colors = gradient_sgr(GRADIENT_STOPS, seconds_per_stop)
+    header = tuple(f"{COLORS['bg_black']}{color}{COLORS['bold']}" for color in colors)
+    digits = tuple(f"{COLORS['bg_black']}{color}" for color in colors)
+    return header, digits
+
+
+def gradient_frame(time_str, header_style, digit_style, terminal_width):
+    """Build the rows of a countdown frame with per-frame gradient styles."""
+    header = tuple((header_style, line) for line in header_rows(terminal_width))
+    digits = styled_digit_rows(time_str, "", terminal_width)
+    return (
+        header + (("", ""), ("", "")) + tuple((digit_style, line) for _, line in digits)
+    )
+
+
+def rich_frame(time_str, color_step, terminal_width, depth):
+    """Build the rows of a countdown frame with per-cell 256 or 24-bit colors."""
+    offset = color_step * STEPS_PER_COLOR % len(shade_table(depth, 1))
+
+    header = header_rows(terminal_width)
+    pad = max(0, (terminal_width - len(HEADER_TEXT[0])) // 2)
+    # Two lines of 5-row letters, one blank row apart. The header keeps its
+    # gradient and only the digits cycle, so a color step rewrites the digits
+    header_styles = cell_styles(header, depth, 0, pad, 5, 6)
+
+    digits = tuple(line for _, line in styled_digit_rows(time_str, "", terminal_width))
+    pad = max(0, (terminal_width - len(render_ascii_rows(time_str)[0])) // 2)
+    digit_styles = cell_styles(digits, depth, offset, pad, 10, 10)
+
+    return (
+        tuple(zip(header_styles, header))
+        + (("", ""), ("", ""))
+        + tuple(zip(digit_styles, digits))
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def finished_frame(terminal_width):
+    """Build the (style, text) rows shown once the countdown is complete."""
+    message_style = f"{COLORS['bright_red']}{COLORS['bold']}"
+    message = "THE LIVESTREAM HAS STARTED!".center(terminal_width)
+
+    rows = (("", ""), ("", ""), (message_style, message), ("", ""), ("", ""))
+    return rows + styled_digit_rows("00:00:00", COLORS["bright_red"], terminal_width)
+
+
+def format_writer_stats(stats):
+    """Format the dictionary returned by FrameWriter.stats()."""
+    return (
+        f"frames={stats['frames']} writes/frame={stats['writes_per_frame']:.2f} "
+        f"bytes/frame={stats['bytes_per_frame']:.1f}"
+    )
+
+
+def terminal_countdown(
+    target_time=None,
+    duration_seconds=300,
+    show_stats=False,
+    clock=None,
+    stream=None,
+    shared_clock=None,
+    gradient=False,
+    color_depth="16",
+):
+    """
+    Run a terminal-based countdown timer with retro ASCII art display.
+
+    Parameters:
+    - target_time: datetime to count down to (overrides duration_seconds)
+    - duration_seconds: Countdown length when no target time is given
+    - show_stats: Print timing and write statistics when stopped
+    - clock: Clock providing time and sleep (default: SystemClock)
+    - stream: Text stream frames are written to (default: sys.stdout)
+    - shared_clock: SharedClockReader whose deadline, pause state and color
+      phase override the target time
+    - gradient: Fade smoothly between the colors at up to GRADIENT_FPS
+      (24-bit color), dropping animation frames rather than delaying digits
+    - color_depth: "16" for the ANSI colors, or "256"/"truecolor" for a
+      gradient across the digits with each cell colored on its own
+    """
+    clock = clock or SystemClock()
     if target_time is None:
-        target_time = datetime.now() + timedelta(seconds=duration_seconds)
+        target_time = clock.now() + timedelta(seconds=duration_seconds)
 
     colors = [
         COLORS["bright_magenta"],
@@ -274,48 +461,179 @@ def terminal_countdown(target_time=None, duration_seconds=300):
         COLORS["bright_yellow"],
         COLORS["bright_green"],
     ]
-    color_index = 0
-    last_color_change = time.time()
     color_cycle_duration = 2  # seconds
 
+    # Track the terminal size through SIGWINCH instead of querying every frame
+    geometry = TerminalGeometry()
+    if clock.realtime:
+        geometry.install()
+
+    # The gradient animates at a fixed rate; its frames are optional
+    static_periods = periods = (1.0, color_cycle_duration)
+    budget = None
+    if gradient:
+        gradient_period = 1 / GRADIENT_FPS
+        periods += (gradient_period,)
+        header_styles, digit_styles = gradient_styles(color_cycle_duration)
+        frames_per_color = len(digit_styles) // len(GRADIENT_STOPS)
+        budget = FrameBudget(GRADIENT_FPS)
+
+    # Wake up only when the digits or the color change, or on a resize
+    scheduler = TickScheduler(
+        monotonic_deadline(target_time, clock),
+        periods=periods,
+        clock=clock.monotonic,
+        sleep=geometry.sleep if geometry.watching else clock.sleep,
+    )
+    geometry.on_resize = scheduler.wake
+    now = scheduler.clock()
+    color_origin = scheduler.phase(color_cycle_duration, now)
+    shown_second = None
+    shared_target = None
+
+    # Only the changed cells of each frame are written, in one write call
+    screen = ScreenBuffer()
+    writer = FrameWriter(stream)
+    layout_size = geometry.size()
+    if os.name == "nt":
+        os.system("")  # Enable ANSI escape processing in the Windows console
+
     try:
         while True:
-            clear_screen()
-
-            # Calculate remaining time
-            now = datetime.now()
-            remaining = target_time - now
+            # Follow the publisher of a shared clock (deadline may move live)
+            if shared_clock:
+                state = shared_clock.sync(scheduler)
+                color_origin = scheduler.phase(color_cycle_duration, state.color_epoch)
+                # A moved deadline or a pause must reach the screen at once
+                if (state.deadline, state.paused_at) != shared_target:
+                    shared_target = (state.deadline, state.paused_at)
+                    shown_second = None
 
             # Current color based on time
-            current_time = time.time()
-            if current_time - last_color_change > color_cycle_duration:
-                color_index = (color_index + 1) % len(colors)
-                last_color_change = current_time
+            color_index = scheduler.phase(color_cycle_duration, now) - color_origin
+            current_color = colors[color_index % len(colors)]
 
-            current_color = colors[color_index]
+            # Re-layout once per burst of resize signals
+            if geometry.resized or not geometry.watching:
+                if geometry.size() != layout_size:
+                    layout_size = geometry.size()
+                    screen.invalidate()
+                    shown_second = None
+            terminal_width = layout_size[0]
 
             # Check if countdown is complete
-            if remaining.total_seconds() <= 0:
-                print(
-                    f"\n\n{COLORS['bright_red']}{COLORS['bold']}{'THE LIVESTREAM HAS STARTED!'.center(os.get_terminal_size().columns)}{COLORS['reset']}\n\n"
+            finished = scheduler.finished(now)
+            if budget:
+                # No animation once finished (a shared target may move back)
+                scheduler.periods = static_periods if finished else periods
+
+            if finished:
+                frame = finished_frame(terminal_width)
+            elif budget:
+                # Digit flips always render; frames in between only if they fit
+                second = scheduler.phase(1.0, now)
+                next_flip = scheduler.next_boundary(1.0, now)
+                if second == shown_second and not budget.admit(now, next_flip):
+                    now = scheduler.wait(now)
+                    continue
+                shown_second = second
+
+                # Index into the lookup tables, in step with the color cycle
+                index = scheduler.phase(gradient_period, now)
+                index = (index - color_origin * frames_per_color) % len(digit_styles)
+                time_str = format_time(scheduler.remaining_seconds(now))
+                frame = gradient_frame(
+                    time_str, header_styles[index], digit_styles[index], terminal_width
                 )
-                print(render_ascii_time("00:00:00", COLORS["bright_red"]))
-                time.sleep(1)
-                continue
+            elif color_depth != "16":
+                time_str = format_time(scheduler.remaining_seconds(now))
+                frame = rich_frame(time_str, color_index, terminal_width, color_depth)
+            else:
+                time_str = format_time(scheduler.remaining_seconds(now))
+                frame = countdown_frame(time_str, current_color, terminal_width)
+
+            writer.write(screen.render(frame))
+            if budget:
+                budget.record(now, scheduler.clock())
+
+            # Sleep until the next second boundary
+            now = scheduler.wait(now)
+
+    except (KeyboardInterrupt, SimulationComplete) as stop:
+        geometry.uninstall()
+        writer.write(screen.close())
+        if isinstance(stop, KeyboardInterrupt):
+            print(f"{COLORS['reset']}\nCountdown stopped by user.")
+        if show_stats:
+            print(format_jitter_stats(scheduler.jitter_stats()))
+            print(format_writer_stats(writer.stats()))
+            if budget:
+                print(format_budget_stats(budget.stats()))
+
+
+def format_output_stats(stats):
+    """Format the dictionary returned by WriteCounter.stats()."""
+    return (
+        f"writes={stats['writes']} "
+        f"writes/minute={stats['writes_per_minute']:.1f} "
+        f"(max {stats['max_writes_per_minute']} in any minute)"
+    )
 
-            # Display header and time
-            display_header(current_color)
-            time_str = format_time(int(remaining.total_seconds()))
-            print(render_ascii_time(time_str, current_color))
 
-            # Sleep briefly to prevent high CPU usage
-            time.sleep(0.1)
+def text_countdown(
+    output,
+    target_time=None,
+    duration_seconds=300,
+    show_stats=False,
+    clock=None,
+    shared_clock=None,
+):
+    """
+    Run the countdown without a terminal display, writing HH:MM:SS to `output`.
+
+    Parameters:
+    - output: TextFileOutput or FifoOutput receiving the displayed value
+    - target_time: datetime to count down to (overrides duration_seconds)
+    - duration_seconds: Countdown length when no target time is given
+    - show_stats: Print timing and write statistics when stopped
+    - clock: Clock providing time and sleep (default: SystemClock)
+    - shared_clock: SharedClockReader whose deadline and pause state
+      override the target time
+    """
+    clock = clock or SystemClock()
+    if target_time is None:
+        target_time = clock.now() + timedelta(seconds=duration_seconds)
 
-    except KeyboardInterrupt:
-        print(f"{COLORS['reset']}\nCountdown stopped by user.")
+    # Only the digits matter: wake up once per second
+    scheduler = TickScheduler(
+        monotonic_deadline(target_time, clock),
+        clock=clock.monotonic,
+        sleep=clock.sleep,
+    )
+    now = scheduler.clock()
+
+    try:
+        while True:
+            if shared_clock:
+                shared_clock.sync(scheduler)
+            # The output skips values equal to the last one written
+            output.write(format_time(scheduler.remaining_seconds(now)))
+            now = scheduler.wait(now)
+
+    except (KeyboardInterrupt, SimulationComplete) as stop:
+        output.close()
+        if isinstance(stop, KeyboardInterrupt):
+            print("\nCountdown stopped by user.")
+        if show_stats:
+            print(format_jitter_stats(scheduler.jitter_stats()))
+            print(format_output_stats(output.counter.stats()))
 
 
 def parse_arguments():
+    # Imported here: argparse is most of this module's import time, and the
+    # exporters import the parsing helpers above without a command line
+    import argparse
+
     parser = argparse.ArgumentParser(description="Terminal-based Retro Countdown Timer")
     group = parser.add_mutually_exclusive_group()
 
@@ -330,6 +648,49 @@ def parse_arguments():
         help="Duration for countdown. Formats: minutes (5), decimal minutes (5.5), MM:SS (5:30), or HH:MM:SS (1:30:45)",
     )
 
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print tick timing and write statistics when the countdown is stopped",
+    )
+
+    parser.add_argument(
+        "--shared-clock",
+        metavar="NAME",
+        help="Follow the countdown published by countdown-clock under NAME",
+    )
+
+    parser.add_argument(
+        "--sync-leader",
+        metavar="HOST[:PORT]",
+        help="Follow the clock and target of a countdown-sync leader on the LAN",
+    )
+
+    parser.add_argument(
+        "--output-file",
+        metavar="PATH",
+        help="Write HH:MM:SS to PATH (atomically, only on change) instead of drawing",
+    )
+
+    parser.add_argument(
+        "--fifo",
+        action="store_true",
+        help="Treat --output-file as a named pipe and write one line per change",
+    )
+
+    parser.add_argument(
+        "--gradient",
+        action="store_true",
+        help="Fade smoothly between the colors at up to 60 fps (needs a 24-bit color terminal)",
+    )
+
+    parser.add_argument(
+        "--colors",
+        choices=COLOR_DEPTHS + ("auto",),
+        default="16",
+        help="Terminal colors: 256 or truecolor draw a shaded gradient across the digits; auto detects them from $COLORTERM and $TERM",
+    )
+
     return parser.parse_args()
 
 
@@ -340,24 +701,7 @@ def main():
     target_time = None
     if args.time:
         try:
-            if len(args.time.split(":")) == 3:  # HH:MM:SS format
-                target_time_obj = time.strptime(args.time, "%H:%M:%S")
-            else:  # HH:MM format
-                target_time_obj = time.strptime(args.time, "%H:%M")
-
-            now = datetime.now()
-            target_time = datetime(
-                now.year,
-                now.month,
-                now.day,
-                target_time_obj.tm_hour,
-                target_time_obj.tm_min,
-                getattr(target_time_obj, "tm_sec", 0),
-            )
-
-            # If the target time is in the past, add a day
-            if target_time < now:
-                target_time += timedelta(days=1)
+            target_time = parse_target_time(args.time)
         except ValueError:
             print("Invalid time format. Using default duration.")
             target_time = None
@@ -371,8 +715,71 @@ def main():
         print(f"Error: {e}")
         print("Using default duration (5 minutes).")
 
+    color_depth = detect_color_depth() if args.colors == "auto" else args.colors
+    if args.gradient:
+        if args.colors not in ("16", "auto"):
+            print("Error: --gradient cannot be combined with --colors.")
+            return
+        # The gradient animation colors whole rows
+        color_depth = "16"
+
+    shared_clock = None
+    if args.shared_clock:
+        # Imported here: the shared clock module builds on this one
+        from countdown.shared_clock import SharedClockReader
+
+        try:
+            shared_clock = SharedClockReader(args.shared_clock)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error: cannot attach to shared clock: {e}")
+            return
+
+    clock = None
+    if args.sync_leader:
+        # Imported here: the clock sync module builds on this one
+        from countdown.clock_sync import follow_leader, format_sync_stats
+
+        clock = follow_leader(args.sync_leader)
+        if clock is None:
+            return
+        # The leader's target replaces --time/--duration
+        target_time = clock.target_time() or target_time
+
+    if args.output_file:
+        clock = clock or SystemClock()
+        try:
+            if args.fifo:
+                output = FifoOutput(args.output_file, clock)
+            else:
+                output = TextFileOutput(args.output_file, clock)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            return
+
+        text_countdown(
+            output,
+            target_time,
+            duration_seconds,
+            show_stats=args.stats,
+            clock=clock,
+            shared_clock=shared_clock,
+        )
+        if args.stats and args.sync_leader:
+            print(format_sync_stats(clock.stats()))
+        return
+
     # Start the terminal countdown
-    terminal_countdown(target_time, duration_seconds)
+    terminal_countdown(
+        target_time,
+        duration_seconds,
+        show_stats=args.stats,
+        clock=clock,
+        shared_clock=shared_clock,
+        gradient=args.gradient,
+        color_depth=color_depth,
+    )
+    if args.stats and clock:
+        print(format_sync_stats(clock.stats()))
 
 
 if __name__ == "__main__":
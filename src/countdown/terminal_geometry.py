@@ -0,0 +1,94 @@
+"""
+Terminal size tracking driven by SIGWINCH.
+
+The size is queried once and then only again after the terminal reports a
+resize, so steady-state frames need no ioctl calls. Where SIGWINCH is not
+available (Windows) the size is queried on every call as before.
+"""
+
+import os
+import select
+import signal
+import time
+
+
+class TerminalGeometry:
+    """Cached terminal size, refreshed only when the terminal is resized."""
+
+    def __init__(self, fallback=(80, 24)):
+        """
+        Initialize a new TerminalGeometry
+
+        Parameters:
+        - fallback: (columns, lines) used when stdout is not a terminal
+        """
+        self.columns, self.lines = fallback
+        self.resized = True
+        self.watching = False
+        self.ioctl_calls = 0
+
+        # Called from the signal handler after a resize, e.g. to wake a sleeper
+        self.on_resize = None
+
+        self._wakeup = None
+        self._previous_handler = None
+
+    def install(self):
+        """Start tracking resizes through SIGWINCH where the platform has it."""
+        if not hasattr(signal, "SIGWINCH"):
+            return
+        try:
+            self._previous_handler = signal.signal(signal.SIGWINCH, self._handle_resize)
+        except ValueError:
+            # Signal handlers can only be installed from the main thread
+            return
+
+        # Self-pipe so that sleep() returns as soon as a resize arrives
+        self._wakeup = os.pipe()
+        for fd in self._wakeup:
+            os.set_blocking(fd, False)
+        self.watching = True
+
+    def uninstall(self):
+        """Restore the previous SIGWINCH handler."""
+        if not self.watching:
+            return
+        signal.signal(signal.SIGWINCH, self._previous_handler or signal.SIG_DFL)
+        for fd in self._wakeup:
+            os.close(fd)
+        self._wakeup = None
+        self.watching = False
+
+    def _handle_resize(self, signum, frame):
+        """Mark the size as stale; the next size() call re-queries it."""
+        self.resized = True
+        try:
+            os.write(self._wakeup[1], b"\0")
+        except (BlockingIOError, TypeError):
+            pass
+        if self.on_resize:
+            self.on_resize()
+
+    def size(self):
+        """Return (columns, lines), querying the terminal only after a resize."""
+        if self.resized or not self.watching:
+            self.resized = False
+            self.ioctl_calls += 1
+            try:
+                self.columns, self.lines = os.get_terminal_size()
+            except OSError:
+                pass  # Not a terminal: keep the previous (or fallback) size
+        return self.columns, self.lines
+
+    def sleep(self, delay):
+        """Sleep for `delay` seconds, returning early if the terminal is resized."""
+        if not self.watching:
+            time.sleep(delay)
+            return
+
+        readable, _, _ = select.select([self._wakeup[0]], [], [], delay)
+        if readable:
+            try:
+                os.read(self._wakeup[0], 512)
+            except BlockingIOError:
+                pass
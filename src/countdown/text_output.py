@@ -0,0 +1,140 @@
+"""
+Plain-text outputs of the countdown for file-watching overlay sources.
+
+Both outputs take the displayed string on every tick but only write when it
+differs from the last one written. TextFileOutput replaces the file
+atomically (a temporary file in the same directory renamed over it), so a
+watcher never reads a half-written value; FifoOutput writes one line per
+change into a named pipe for a reader that streams it.
+"""
+
+import errno
+import os
+import stat
+from collections import deque
+
+
+class WriteCounter:
+    """Counts writes, overall and within any sliding minute."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.started = clock.monotonic()
+        self.writes = 0
+        self.recent = deque()
+        self.max_per_minute = 0
+
+    def record(self):
+        now = self.clock.monotonic()
+        self.writes += 1
+        self.recent.append(now)
+        while self.recent[0] <= now - 60:
+            self.recent.popleft()
+        self.max_per_minute = max(self.max_per_minute, len(self.recent))
+
+    def stats(self):
+        minutes = max(1 / 60, (self.clock.monotonic() - self.started) / 60)
+        return {
+            "writes": self.writes,
+            "writes_per_minute": self.writes / minutes,
+            "max_writes_per_minute": self.max_per_minute,
+        }
+
+
+class TextFileOutput:
+    """Keeps a text file holding the displayed value, rewritten atomically."""
+
+    def __init__(self, path, clock):
+        """
+        Initialize a new TextFileOutput
+
+        Parameters:
+        - path: File to keep up to date
+        - clock: Clock providing monotonic time for the write counters
+        """
+        self.path = os.path.abspath(path)
+        self.directory = os.path.dirname(self.path)
+        # Temporary file next to the target, so the rename stays atomic
+        self.temporary = os.path.join(
+            self.directory, f".{os.path.basename(self.path)}.{os.getpid()}.tmp"
+        )
+        self.last = None
+        self.counter = WriteCounter(clock)
+
+    def write(self, text):
+        """Replace the file with `text` if it changed; return True if written."""
+        if text == self.last:
+            return False
+
+        try:
+            with open(self.temporary, "w") as f:
+                f.write(text)
+            os.replace(self.temporary, self.path)
+        except BaseException:
+            if os.path.exists(self.temporary):
+                os.unlink(self.temporary)
+            raise
+
+        self.last = text
+        self.counter.record()
+        return True
+
+    def close(self):
+        pass
+
+
+class FifoOutput:
+    """Writes each changed value as one line into a named pipe."""
+
+    def __init__(self, path, clock):
+        """
+        Initialize a new FifoOutput
+
+        Parameters:
+        - path: Named pipe to write to (created if it does not exist)
+        - clock: Clock providing monotonic time for the write counters
+        """
+        if not os.path.exists(path):
+            os.mkfifo(path)
+        elif not stat.S_ISFIFO(os.stat(path).st_mode):
+            raise ValueError(f"{path} is not a named pipe")
+        self.path = path
+        self.fd = None
+        self.last = None
+        self.counter = WriteCounter(clock)
+
+    def _open(self):
+        # Non-blocking, so the countdown never waits for a reader
+        try:
+            self.fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as e:
+            if e.errno != errno.ENXIO:
+                raise
+            # No reader yet
+            self.fd = None
+
+    def write(self, text):
+        """Write `text` as a line if it changed and a reader is attached."""
+        if text == self.last:
+            return False
+        if self.fd is None:
+            self._open()
+            if self.fd is None:
+                return False
+
+        try:
+            os.write(self.fd, f"{text}\n".encode())
+        except (BrokenPipeError, BlockingIOError):
+            # The reader left or stopped reading; send the next value afresh
+            self.close()
+            return False
+
+        self.last = text
+        self.counter.record()
+        return True
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        self.last = None
@@ -0,0 +1,215 @@
+"""
+Hierarchical timing wheel for large numbers of scheduled target times.
+
+Targets are bucketed by expiry tick into a small stack of wheels (256 slots
+per level by default); a target far in the future sits in a coarse slot and
+is cascaded into finer wheels as its time approaches. Inserting and
+cancelling are O(1), and advancing the clock hands back every expired target
+of a tick in one batch. Targets beyond the span of the wheels wait in an
+overflow heap until they come within range.
+"""
+
+import heapq
+import itertools
+import math
+
+from countdown.clock import SystemClock
+from countdown.scheduler import monotonic_deadline
+
+
+class TimerHandle:
+    """A scheduled target; pass it to TimingWheel.cancel() to unschedule."""
+
+    __slots__ = ("deadline", "tick", "callback", "payload", "bucket", "active")
+
+    def __init__(self, deadline, tick, callback, payload):
+        self.deadline = deadline
+        self.tick = tick
+        self.callback = callback
+        self.payload = payload
+        self.bucket = None
+        self.active = True
+
+
+class TimingWheel:
+    """Hierarchical timing wheel with O(1) insert and cancel."""
+
+    def __init__(self, resolution=1.0, slots=256, levels=4, start=0.0):
+        """
+        Initialize a new TimingWheel
+
+        Parameters:
+        - resolution: Length of one tick in seconds (expiry granularity)
+        - slots: Number of slots per wheel level
+        - levels: Number of wheel levels; they span slots**levels ticks
+        - start: Time the wheel starts at (same clock as the deadlines)
+        """
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self.span = slots**levels
+        # Ticks covered by one slot of each level
+        self.granularity = [slots**level for level in range(levels)]
+        self.current_tick = math.floor(start / resolution)
+
+        # Each slot maps handle -> None (an insertion-ordered set)
+        self.wheels = [[{} for _ in range(slots)] for _ in range(levels)]
+        self.overflow = []
+        self.overflow_count = 0
+        self.sequence = itertools.count()
+        self.ready = {}
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def schedule(self, deadline, callback=None, payload=None):
+        """Schedule `callback(handle)` for `deadline` and return its handle."""
+        handle = TimerHandle(
+            deadline, math.ceil(deadline / self.resolution), callback, payload
+        )
+        self._place(handle)
+        self.count += 1
+        return handle
+
+    def cancel(self, handle):
+        """Unschedule a pending handle (no-op if it already expired)."""
+        if not handle.active:
+            return
+        handle.active = False
+        if handle.bucket is not None:
+            del handle.bucket[handle]
+            handle.bucket = None
+        else:
+            # Handles in the overflow heap are dropped lazily when they surface
+            self.overflow_count -= 1
+        self.count -= 1
+
+    def _place(self, handle):
+        delta = handle.tick - self.current_tick
+        if delta <= 0:
+            bucket = self.ready
+        elif delta >= self.span:
+            heapq.heappush(self.overflow, (handle.tick, next(self.sequence), handle))
+            self.overflow_count += 1
+            handle.bucket = None
+            return
+        else:
+            level = 0
+            while delta >= self.granularity[level] * self.slots:
+                level += 1
+            index = (handle.tick // self.granularity[level]) % self.slots
+            bucket = self.wheels[level][index]
+        bucket[handle] = None
+        handle.bucket = bucket
+
+    def _cascade(self, level):
+        """Move the due slot of `level` down into the finer wheels."""
+        index = (self.current_tick // self.granularity[level]) % self.slots
+        if index == 0 and level + 1 < self.levels:
+            self._cascade(level + 1)
+        bucket = self.wheels[level][index]
+        if bucket:
+            self.wheels[level][index] = {}
+            for handle in bucket:
+                self._place(handle)
+
+    def _refill(self):
+        """Move overflow targets that are now within the wheel span."""
+        while self.overflow and self.overflow[0][0] - self.current_tick < self.span:
+            _, _, handle = heapq.heappop(self.overflow)
+            if handle.active:
+                self.overflow_count -= 1
+                self._place(handle)
+
+    def advance(self, now):
+        """Advance to time `now` and return the expired handles in tick order."""
+        target = math.floor(now / self.resolution)
+        expired = list(self.ready)
+        self.ready.clear()
+
+        while self.current_tick < target:
+            if self.count - self.overflow_count == len(expired):
+                # The wheels are empty: jump ahead to the target, or to where
+                # the earliest overflow target comes within the wheel span
+                jump = target
+                if self.overflow:
+                    jump = min(jump, self.overflow[0][0] - self.span + 1)
+                self.current_tick = max(self.current_tick + 1, jump)
+                self._refill()
+                continue
+
+            self.current_tick += 1
+            if self.current_tick % self.slots == 0 and self.levels > 1:
+                self._cascade(1)
+                if self.current_tick % self.granularity[-1] == 0:
+                    self._refill()
+                # Targets cascaded onto this tick expire before later ticks
+                expired.extend(self.ready)
+                self.ready.clear()
+
+            index = self.current_tick % self.slots
+            bucket = self.wheels[0][index]
+            if bucket:
+                self.wheels[0][index] = {}
+                expired.extend(bucket)
+
+        self._refill()
+        expired.extend(self.ready)
+        self.ready.clear()
+
+        for handle in expired:
+            handle.active = False
+            handle.bucket = None
+        self.count -= len(expired)
+        return expired
+
+    def run_due(self, now):
+        """Advance to `now` and call the callback of every expired handle."""
+        expired = self.advance(now)
+        for handle in expired:
+            if handle.callback:
+                handle.callback(handle)
+        return expired
+
+
+class TargetSchedule:
+    """
+    A long-lived set of wall-clock target times backed by a TimingWheel.
+
+    Timers subscribe a callback to a target datetime (or to a monotonic
+    deadline); poll() fires every subscription whose target has been
+    reached, in one batch per call, to within the wheel resolution. The
+    dashboard uses it for the expiry of its timers.
+    """
+
+    def __init__(self, clock=None, resolution=1.0):
+        self.clock = clock or SystemClock()
+        self.resolution = resolution
+        self.wheel = TimingWheel(resolution, start=self.clock.monotonic())
+
+    def __len__(self):
+        return len(self.wheel)
+
+    def subscribe(self, target_time, callback, payload=None):
+        """Call `callback(handle)` once `target_time` (a datetime) is reached."""
+        deadline = monotonic_deadline(target_time, self.clock)
+        return self.wheel.schedule(deadline, callback, payload)
+
+    def subscribe_deadline(self, deadline, callback, payload=None):
+        """Call `callback(handle)` once the monotonic `deadline` is reached."""
+        return self.wheel.schedule(deadline, callback, payload)
+
+    def unsubscribe(self, handle):
+        self.wheel.cancel(handle)
+
+    def next_poll(self, now):
+        """Return the monotonic instant of the next expiry tick (None if empty)."""
+        if not len(self.wheel):
+            return None
+        return (math.floor(now / self.resolution) + 1) * self.resolution
+
+    def poll(self, now=None):
+        """Fire all subscriptions that are due and return their handles."""
+        now = self.clock.monotonic() if now is None else now
+        return self.wheel.run_due(now)
@@ -0,0 +1,285 @@
+"""
+Raw video output of the advanced display for headless streaming rigs.
+
+Frames of the 7-segment display (same geometry as RetroDigitalDisplay, see
+countdown.raster) are written as raw RGB24 or BGRA to stdout or a named
+pipe at a fixed frame rate, for an encoder such as ffmpeg to consume. A
+monotonic frame pacer schedules every frame on a fixed grid; when the
+display has not changed the previous frame buffer is written again as is,
+so a duplicate frame costs one write of an existing buffer and no copy.
+"""
+
+import argparse
+import math
+import os
+import stat
+import sys
+from datetime import timedelta
+
+from countdown.clock import SimulationComplete, SystemClock
+from countdown.export import frame_state
+from countdown.palette import COLOR_CYCLE_SECONDS
+from countdown.raster import PIXEL_FORMATS, DisplayRaster, fit_size
+from countdown.scheduler import TickScheduler, monotonic_deadline
+from countdown.terminal_countdown import parse_duration, parse_target_time
+
+
+def write_all(fd, view):
+    """Write a whole memoryview to `fd`, following partial pipe writes."""
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+class FramePacer:
+    """Paces frames on a fixed grid of monotonic instants."""
+
+    def __init__(self, fps, clock, max_lag=1.0):
+        """
+        Initialize a new FramePacer
+
+        Parameters:
+        - fps: Frames per second
+        - clock: Clock providing monotonic time and sleep
+        - max_lag: Seconds the output may fall behind before frames are
+          skipped to catch up
+        """
+        self.interval = 1.0 / fps
+        self.clock = clock
+        self.max_lag = max_lag
+        self.start = clock.monotonic()
+        self.index = 0
+
+        # Counters for instrumentation
+        self.late = 0
+        self.skipped = 0
+        self.max_lateness = 0.0
+
+    def next(self):
+        """Wait for the next frame instant and return it."""
+        due = self.start + self.index * self.interval
+        now = self.clock.monotonic()
+        if now < due:
+            self.clock.sleep(due - now)
+        else:
+            lateness = now - due
+            self.max_lateness = max(self.max_lateness, lateness)
+            if lateness > self.interval:
+                self.late += 1
+            if lateness > self.max_lag:
+                # The consumer stalled: resume at the current frame instant
+                behind = math.floor(lateness / self.interval)
+                self.skipped += behind
+                self.index += behind
+                due += behind * self.interval
+        self.index += 1
+        return due
+
+
+class VideoPipe:
+    """Renders the countdown and writes it as raw frames at a fixed rate."""
+
+    def __init__(
+        self,
+        target_time,
+        fd,
+        width=1920,
+        height=1080,
+        fps=60,
+        pixel_format="rgb24",
+        size=None,
+        clock=None,
+    ):
+        """
+        Initialize a new VideoPipe
+
+        Parameters:
+        - target_time: datetime to count down to
+        - fd: File descriptor the frames are written to
+        - width, height: Frame size in pixels
+        - fps: Frames per second
+        - pixel_format: "rgb24" or "bgra"
+        - size: Height of the digits (default: the largest that fits the
+          frame, at most a third of its height)
+        - clock: Clock providing time and sleep (default: SystemClock)
+        """
+        self.clock = clock or SystemClock()
+        self.fd = fd
+        self.fps = fps
+        self.raster = DisplayRaster(
+            width, height, size or fit_size(width, height), pixel_format=pixel_format
+        )
+        self.view = memoryview(self.raster.frame)
+        self.scheduler = TickScheduler(
+            monotonic_deadline(target_time, self.clock),
+            periods=(1.0, COLOR_CYCLE_SECONDS),
+            clock=self.clock.monotonic,
+        )
+        self.color_origin = self.scheduler.phase(
+            COLOR_CYCLE_SECONDS, self.clock.monotonic()
+        )
+        self.state = None
+        self.pacer = None
+
+        # Counters for instrumentation
+        self.frames = 0
+        self.rendered = 0
+
+    def run(self, seconds=None):
+        """Write frames until stopped, or for `seconds` of video."""
+        pacer = self.pacer = FramePacer(self.fps, self.clock)
+        limit = None if seconds is None else round(seconds * self.fps)
+        while limit is None or self.frames < limit:
+            due = pacer.next()
+            state = frame_state(self.scheduler, self.color_origin, due)
+            if state != self.state:
+                # Only the changed cells are re-blitted into the reused buffer
+                self.raster.render(*state)
+                self.state = state
+                self.rendered += 1
+            write_all(self.fd, self.view)
+            self.frames += 1
+
+    def stats(self):
+        """Return frame, render and pacing counters."""
+        stats = {"frames": self.frames, "rendered": self.rendered}
+        if self.pacer:
+            stats["late"] = self.pacer.late
+            stats["skipped"] = self.pacer.skipped
+            stats["max_lateness_ms"] = self.pacer.max_lateness * 1000
+        return stats
+
+
+def open_output(path):
+    """Return a writable file descriptor for "-" (stdout), a file or a FIFO."""
+    if path == "-":
+        return sys.stdout.fileno()
+    if os.path.exists(path) and stat.S_ISFIFO(os.stat(path).st_mode):
+        print(f"Waiting for a reader on {path}...", file=sys.stderr)
+    return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Retro Countdown Raw Video Output")
+    group = parser.add_mutually_exclusive_group()
+
+    group.add_argument(
+        "--time", type=str, help="Target time in format HH:MM:SS or HH:MM"
+    )
+
+    group.add_argument(
+        "--duration",
+        type=str,
+        default="5",
+        help="Duration for countdown. Formats: minutes (5), decimal minutes (5.5), MM:SS (5:30), or HH:MM:SS (1:30:45)",
+    )
+
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="File or named pipe to write frames to (default: stdout)",
+    )
+
+    parser.add_argument(
+        "--mkfifo",
+        action="store_true",
+        help="Create --output as a named pipe if it does not exist",
+    )
+
+    parser.add_argument("--width", type=int, default=1920, help="Frame width")
+
+    parser.add_argument("--height", type=int, default=1080, help="Frame height")
+
+    parser.add_argument("--fps", type=int, default=60, help="Frames per second")
+
+    parser.add_argument(
+        "--pixel-format",
+        choices=sorted(PIXEL_FORMATS),
+        default="rgb24",
+        help="Pixel layout of the raw frames",
+    )
+
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=None,
+        help="Height of the digits in pixels (default: the largest that fits the frame)",
+    )
+
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=None,
+        help="Stop after this many seconds of video (default: run until stopped)",
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print frame and pacing statistics to stderr when stopped",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    clock = SystemClock()
+
+    # Parse the target time if provided
+    target_time = None
+    if args.time:
+        try:
+            target_time = parse_target_time(args.time)
+        except ValueError:
+            print("Invalid time format. Using default duration.", file=sys.stderr)
+
+    if target_time is None:
+        duration_seconds = 300  # Default: 5 minutes
+        try:
+            duration_seconds = parse_duration(args.duration)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            print("Using default duration (5 minutes).", file=sys.stderr)
+        target_time = clock.now() + timedelta(seconds=duration_seconds)
+
+    if args.mkfifo and args.output != "-" and not os.path.exists(args.output):
+        os.mkfifo(args.output)
+
+    print(
+        f"Raw video: -f rawvideo -pix_fmt {args.pixel_format} "
+        f"-s {args.width}x{args.height} -framerate {args.fps}",
+        file=sys.stderr,
+    )
+    fd = open_output(args.output)
+    pipe = VideoPipe(
+        target_time,
+        fd,
+        width=args.width,
+        height=args.height,
+        fps=args.fps,
+        pixel_format=args.pixel_format,
+        size=args.size,
+        clock=clock,
+    )
+    try:
+        pipe.run(args.seconds)
+    except (KeyboardInterrupt, BrokenPipeError, SimulationComplete):
+        # Stopped by the user, or the encoder went away
+        pass
+    finally:
+        if fd != sys.stdout.fileno():
+            os.close(fd)
+
+    if args.stats and pipe.pacer:
+        stats = pipe.stats()
+        print(
+            f"frames={stats['frames']} rendered={stats['rendered']} "
+            f"late={stats['late']} skipped={stats['skipped']} "
+            f"max lateness={stats['max_lateness_ms']:.2f}ms",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
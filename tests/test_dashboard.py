@@ -0,0 +1,24 @@
+import unittest
+
+from countdown.clock import VirtualClock
+from countdown.dashboard import build_timers
+
+
+class BuildTimersTest(unittest.TestCase):
+    def test_time_must_be_a_string(self):
+        with self.assertRaisesRegex(ValueError, "timer 2: the time"):
+            build_timers(
+                [{"label": "Ok", "duration": "1"}, {"time": 1200}], VirtualClock()
+            )
+
+    def test_label_must_be_a_string(self):
+        with self.assertRaisesRegex(ValueError, "timer 1: the label"):
+            build_timers([{"label": 5, "duration": "1"}], VirtualClock())
+
+    def test_entries_must_be_objects(self):
+        with self.assertRaisesRegex(ValueError, "timer 1 must be an object"):
+            build_timers(["12:00"], VirtualClock())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from countdown.bench.fake_canvas import RecordingCanvas
+from countdown.digital_display import RetroDigitalDisplay, fit_layout
+
+
+class ShowTimeTest(unittest.TestCase):
+    def setUp(self):
+        self.display = RetroDigitalDisplay(RecordingCanvas(), *fit_layout(1024, 600))
+        self.display.show_time(0, 1, 58)
+        self.display.flush()
+
+    def updates(self, *time):
+        start = self.display.batch.updates
+        self.display.show_time(*time)
+        self.display.flush()
+        return self.display.batch.updates - start
+
+    def test_blinking_colons_only_hides_them(self):
+        # Two dots and two glows per colon
+        self.assertEqual(self.updates(0, 1, 58, False), 8)
+        self.assertEqual(self.updates(0, 1, 58, False), 0)
+        self.assertEqual(self.updates(0, 1, 58, True), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
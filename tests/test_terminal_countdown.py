@@ -0,0 +1,73 @@
+import contextlib
+import io
+import os
+import re
+import unittest
+from multiprocessing import resource_tracker
+
+from countdown.clock import VirtualClock
+from countdown.shared_clock import SharedClockPublisher, SharedClockReader
+from countdown.terminal_countdown import terminal_countdown
+
+
+class SlowStream(io.StringIO):
+    """Text stream on which every write costs `cost` virtual seconds."""
+
+    def __init__(self, clock, cost):
+        super().__init__()
+        self.clock = clock
+        self.cost = cost
+
+    def write(self, text):
+        # Not clock.advance(): the final write after the stop must not raise
+        self.clock.elapsed += self.cost
+        return super().write(text)
+
+
+def run_gradient(shared, seconds=10, cost=0.012):
+    """Run --gradient for `seconds` on a slow stream; return the budget stats."""
+    clock = VirtualClock(stop_after=seconds)
+    publisher = reader = None
+    if shared:
+        name = f"countdown-test-{os.getpid()}"
+        publisher = SharedClockPublisher(name, clock.monotonic() + 300, clock=clock)
+        reader = SharedClockReader(name)
+        # Attaching unregisters the block, which this process also created
+        resource_tracker.register(publisher.memory._name, "shared_memory")
+
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            terminal_countdown(
+                duration_seconds=300,
+                show_stats=True,
+                clock=clock,
+                stream=SlowStream(clock, cost),
+                shared_clock=reader,
+                gradient=True,
+            )
+    finally:
+        if shared:
+            reader.close()
+            publisher.close()
+
+    match = re.search(
+        r"rendered=(\d+) animation frames dropped=(\d+)", output.getvalue()
+    )
+    return int(match.group(1)), int(match.group(2))
+
+
+class GradientBudgetTest(unittest.TestCase):
+    def test_slow_stream_drops_frames(self):
+        rendered, dropped = run_gradient(shared=False)
+        self.assertGreater(dropped, 0)
+        self.assertLess(rendered, 600)
+
+    def test_slow_stream_drops_frames_with_shared_clock(self):
+        rendered, dropped = run_gradient(shared=True)
+        self.assertGreater(dropped, 0)
+        self.assertLess(rendered, 600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import random
+import unittest
+
+from countdown.timing_wheel import TimingWheel
+
+
+class TimingWheelOrderTest(unittest.TestCase):
+    def test_cascaded_targets_expire_in_order(self):
+        wheel = TimingWheel()
+        for deadline in (700, 256, 257, 3):
+            wheel.schedule(deadline)
+        expired = wheel.advance(1000)
+        self.assertEqual([handle.deadline for handle in expired], [3, 256, 257, 700])
+
+    def test_batches_are_in_tick_order(self):
+        # A small wheel, so advances cross cascades and overflow refills
+        generator = random.Random(7)
+        wheel = TimingWheel(slots=4, levels=2)
+        deadlines = [generator.randrange(1, 200) for _ in range(500)]
+        for deadline in deadlines:
+            wheel.schedule(deadline)
+
+        seen = []
+        now = 0
+        while now < 200:
+            now += generator.randrange(1, 40)
+            expired = [handle.tick for handle in wheel.advance(now)]
+            self.assertEqual(expired, sorted(expired))
+            seen.extend(expired)
+        self.assertEqual(seen, sorted(deadlines))
+
+
+if __name__ == "__main__":
+    unittest.main()